@@ -10,8 +10,11 @@ All legacy template-based methods have been completely removed.
 New 4-stage conversational pipeline implementation required.
 """
 
-import json
-from typing import Dict, List, Any, Optional, Literal
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Literal, NamedTuple, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -24,10 +27,18 @@ from ...infrastructure.validation.schemas import validate_stage_response, valida
 from ...domain.matrices.canonical import get_canonical_matrix
 from ...domain.budgets import BudgetConfig
 from ...application.lenses import LensResolver
+from ...lib import jsonio
 from .aggregator import validate_and_write_agg, create_aggregator_schema_hint
 from .contracts import MatrixSnapshot
 
 
+class Message(NamedTuple):
+    """A single transcript turn. Serialized to a dict only when written to JSONL."""
+
+    role: str
+    content: str
+
+
 STATION_MAP = {
     "C": "problem statement",
     "F": "requirements",
@@ -38,6 +49,28 @@ STATION_MAP = {
 }
 
 
+# Stage keywords for the semantic valley trace; matched in a single scan per turn
+_STAGE_KEYWORDS_RE = re.compile(
+    r"play a game|sufficient|mechanical|semantic|interpretation|lens", re.IGNORECASE
+)
+
+
+def _classify_user_turn(content: str) -> str:
+    """Classify a user turn into a semantic valley trace stage title."""
+    found = {m.group() for m in _STAGE_KEYWORDS_RE.finditer(content)}
+    lowered = {token.lower() for token in found}
+    # "play a game"/"sufficient" are matched case-sensitively, as before
+    if "play a game" in found and "sufficient" in found:
+        return "INITIALIZE (Semantic Priming)"
+    if "mechanical" in lowered:
+        return "MECHANICAL CONSTRUCTION"
+    if "semantic" in lowered and "interpretation" in lowered:
+        return "SEMANTIC INTERPRETATION"
+    if "lens" in lowered:
+        return "LENS APPLICATION"
+    return "USER INSTRUCTION"
+
+
 def _infer_operation(matrix_name: str) -> str:
     """Infer operation type from matrix name."""
     operations = {
@@ -77,6 +110,7 @@ class DialogueOrchestrator:
         relaxed_json: bool = False,
         inband_c_normalize: bool = False,
         stop_at: Optional[str] = None,
+        parallel_extracts: bool = False,
     ):
         """
         Initialize the dialogue orchestrator.
@@ -90,6 +124,8 @@ class DialogueOrchestrator:
             lens_mode: Lens resolution mode ("catalog" or "auto")
             write_catalog: Whether to write generated lenses to catalog
             reasoning_effort: GPT-5 reasoning effort level ("minimal", "medium", "low")
+            parallel_extracts: Run the G/P/T extraction stages concurrently against the
+                transcript as of Z (each stage no longer sees the sibling extractions)
         """
         # Use global config if not provided
         from ...infrastructure.llm.config import get_config
@@ -106,23 +142,31 @@ class DialogueOrchestrator:
         self.relaxed_json = relaxed_json
         self.inband_c_normalize = inband_c_normalize
         self.stop_at = stop_at
+        self.parallel_extracts = parallel_extracts
 
         # Initialize lens resolver 
         self.lens_resolver = LensResolver(lens_mode=lens_mode)
         
-        # Initialize prompt registry
+        # Initialize prompt registry; system text and kernel hash are invariant per run
         self.registry = get_registry()
+        self._system_text = self.registry.get_text("system")
+        self._kernel_hash = self.registry.compute_kernel_hash()
+        self._prompt_shas = self._compute_prompt_shas()
 
         # Track conversation history
         self.dialogue_history = []
         self.token_count = 0
+        self._token_lock = threading.Lock()
+        
+        # Run clock: one wall-clock anchor, trace entries carry monotonic offsets
+        self._start_run_clock()
         
         # Store matrix snapshots for dependencies
         self.snapshots = {}
         
         # Track matrix results for final output
         self.matrix_results = {}
-
+        
         # Load canonical matrices
         self.A = get_canonical_matrix("A")
         self.B = get_canonical_matrix("B")
@@ -141,13 +185,13 @@ class DialogueOrchestrator:
         Returns:
             Dictionary with phase1_output structure
         """
+        self._start_run_clock()
+        
         # Initialize system message from system.md
-        system_message = self.registry.get_text("system")
+        system_message = self._system_text
         
         # Initialize dialogue with system message
-        self.dialogue_history = [
-            {"role": "system", "content": system_message}
-        ]
+        self.dialogue_history = [Message("system", system_message)]
         
         # Initialize trace data
         trace_entries = []
@@ -180,6 +224,7 @@ class DialogueOrchestrator:
             final_output = {
                 "meta": {
                     "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "run_started_at": self._t0_iso,
                     "model": self.model,
                     "temperature": self.temperature,
                     "lens_mode": self.lens_mode,
@@ -436,30 +481,25 @@ class DialogueOrchestrator:
         trace_entries.append(z_principles_trace)
         self.matrix_results["Z"]["principles"] = z_principles_result
         
-        # MATRIX G EXTRACTION - Extract first 3 rows from Z
-        
-        # G/extract.md - Extract Matrix G from Matrix Z
-        g_extract_result, g_extract_trace = self._execute_stage(
-            "phase1_g_extract", "G", "extract"
-        )
+        # MATRIX G/P/T - Extract G (first 3 rows of Z), P (4th row of Z), T (transpose of J)
+        # These stages only depend on Z and J, so they may run concurrently.
+        extract_stages = [
+            ("phase1_g_extract", "G", "extract"),
+            ("phase1_p_extract", "P", "extract"),
+            ("phase1_t_transform", "T", "transform"),
+        ]
+        if self.parallel_extracts:
+            extract_outcomes = self._execute_stages_concurrently(extract_stages)
+        else:
+            extract_outcomes = [self._execute_stage(*spec) for spec in extract_stages]
+        (g_extract_result, g_extract_trace), (p_extract_result, p_extract_trace), (
+            t_transform_result, t_transform_trace
+        ) = extract_outcomes
+
         trace_entries.append(g_extract_trace)
         self.matrix_results["G"] = {"intro": g_extract_result}
-        
-        # MATRIX P EXTRACTION - Extract 4th row from Z
-        
-        # P/extract.md - Extract Matrix P from Matrix Z
-        p_extract_result, p_extract_trace = self._execute_stage(
-            "phase1_p_extract", "P", "extract"
-        )
         trace_entries.append(p_extract_trace)
         self.matrix_results["P"] = {"extract": p_extract_result}
-        
-        # MATRIX T TRANSFORMATION - Transpose of J
-        
-        # T/transform.md - Transform Matrix J to Matrix T
-        t_transform_result, t_transform_trace = self._execute_stage(
-            "phase1_t_transform", "T", "transform"
-        )
         trace_entries.append(t_transform_trace)
         self.matrix_results["T"] = {"intro": t_transform_result}
         
@@ -585,6 +625,7 @@ class DialogueOrchestrator:
         final_output = {
             "meta": {
                 "generated_at": datetime.now(timezone.utc).isoformat(),
+                "run_started_at": self._t0_iso,
                 "model": self.model,
                 "temperature": self.temperature,
                 "lens_mode": self.lens_mode,
@@ -665,11 +706,10 @@ class DialogueOrchestrator:
             rendered_prompt += "\n\nReturn one JSON object that satisfies the provided schema exactly: fill every required field and do not include extra keys."
         
         # Add user turn to transcript with rendered prompt
-        user_message = {"role": "user", "content": rendered_prompt}
-        self.dialogue_history.append(user_message)
+        self._append_message("user", rendered_prompt)
         
         # Get system prompt and build input from dialogue history
-        system_text = self.registry.get_text("system")
+        system_text = self._system_text
         input_text = self._build_canonical_transcript()
         
         # Build strict JSON schema for lenses response from single source
@@ -704,7 +744,7 @@ class DialogueOrchestrator:
             raise RuntimeError(f"Empty lenses JSON response for {matrix_name}/{station}. raw={str(raw)[:300]}")
         if self.relaxed_json:
             # Skip JSON enforcement; record raw content
-            self.dialogue_history.append({"role": "assistant", "content": response_content})
+            self._append_message("assistant", response_content)
             return {
                 "station": station,
                 "matrix_id": matrix_name,
@@ -717,8 +757,7 @@ class DialogueOrchestrator:
             raise ValueError(f"Failed to parse lenses JSON response: {e}")
         
         # Add assistant turn to transcript with JSON response (option A)
-        assistant_message = {"role": "assistant", "content": response_content}
-        self.dialogue_history.append(assistant_message)
+        self._append_message("assistant", response_content)
         
         # Validate lenses structure
         if "lenses" not in lenses_json and not self.relaxed_json:
@@ -825,24 +864,40 @@ Lenses: {lenses_result['lenses']}"""
         
         return rendered
 
-    def _build_canonical_transcript(self) -> str:
+    def _append_message(
+        self, role: str, content: str, history: Optional[List[Message]] = None
+    ) -> None:
+        """
+        Append a turn to the transcript (the single mutation point for history).
+        
+        Args:
+            role: Message role ("user" or "assistant")
+            content: Message content
+            history: Message list to extend (defaults to self.dialogue_history)
+        """
+        if history is None:
+            history = self.dialogue_history
+        history.append(Message(role, content))
+
+    def _build_canonical_transcript(self, history: Optional[List[Message]] = None) -> str:
         """
         FIX-3: Build canonical transcript format for LLM input.
         
         Returns dialogue history as human-readable text format, not JSON.
         This maintains semantic consistency with how the LLM sees conversations.
         
+        Args:
+            history: Message list to render (defaults to self.dialogue_history)
+        
         Returns:
             Canonical transcript string
         """
-        transcript_lines = []
-        for msg in self.dialogue_history:
-            role = msg["role"]
-            content = msg["content"]
-            if role != "system":  # Skip system message as it goes in instructions
-                transcript_lines.append(f"[{role.upper()}] {content}")
-        
-        return "\n\n".join(transcript_lines)
+        if history is None:
+            history = self.dialogue_history
+        # Skip system message as it goes in instructions
+        return "\n\n".join(
+            f"[{msg.role.upper()}] {msg.content}" for msg in history if msg.role != "system"
+        )
 
     def _validate_generate_lenses_only_in_auto(self) -> None:
         """
@@ -860,7 +915,7 @@ Lenses: {lenses_result['lenses']}"""
         
         # Search transcript for generate_lenses content
         for i, turn in enumerate(self.dialogue_history):
-            content = turn.get("content", "")
+            content = turn.content
             
             # Look for generate_lenses asset patterns
             if "generate_lenses" in content.lower() or "Generate Complete Lens Matrix" in content:
@@ -870,7 +925,44 @@ Lenses: {lenses_result['lenses']}"""
                     f"Content preview: {content[:100]}..."
                 )
 
-    def _execute_stage(self, asset_id: str, matrix_name: str, stage: str) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    def _execute_stages_concurrently(
+        self, stages: List[Tuple[str, str, str]]
+    ) -> List[tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Execute independent stages concurrently against the current transcript.
+        
+        Each stage runs on its own copy of the dialogue history; the new turns are
+        appended back to self.dialogue_history in the order of `stages`, so the
+        saved transcript is deterministic regardless of completion order.
+        
+        Args:
+            stages: List of (asset_id, matrix_name, stage) tuples
+        
+        Returns:
+            List of (stage_result, trace_entry) tuples in the order of `stages`
+        """
+        base_len = len(self.dialogue_history)
+        histories = [list(self.dialogue_history) for _ in stages]
+        
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = [
+                executor.submit(self._execute_stage, asset_id, matrix_name, stage, history)
+                for (asset_id, matrix_name, stage), history in zip(stages, histories)
+            ]
+            outcomes = [future.result() for future in futures]
+        
+        for history in histories:
+            self.dialogue_history.extend(history[base_len:])
+        
+        return outcomes
+
+    def _execute_stage(
+        self,
+        asset_id: str,
+        matrix_name: str,
+        stage: str,
+        history: Optional[List[Message]] = None,
+    ) -> tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Execute a single stage of the conversational pipeline.
         
@@ -878,11 +970,15 @@ Lenses: {lenses_result['lenses']}"""
             asset_id: Asset ID for the prompt (e.g., "phase1_c_mechanical")
             matrix_name: Matrix name (e.g., "C")
             stage: Stage name (e.g., "mechanical")
+            history: Message list to extend (defaults to self.dialogue_history)
         
         Returns:
             Tuple of (stage_result, trace_entry)
         """
         import hashlib
+
+        if history is None:
+            history = self.dialogue_history
         
         # Load the prompt asset
         prompt_text = self.registry.get_text(asset_id)
@@ -913,11 +1009,10 @@ Lenses: {lenses_result['lenses']}"""
         rendered_prompt = self._render_template_strict(prompt_text, template_vars)
         
         # Add user message to history
-        user_message = {"role": "user", "content": rendered_prompt}
-        self.dialogue_history.append(user_message)
+        self._append_message("user", rendered_prompt, history)
         
         # Compute input hash for provenance
-        input_text = self._build_canonical_transcript()
+        input_text = self._build_canonical_transcript(history)
         input_hash = hashlib.sha256(input_text.encode()).hexdigest()[:16]
         
         # Make LLM call using new Responses API interface
@@ -927,12 +1022,12 @@ Lenses: {lenses_result['lenses']}"""
             asset_sha = asset_info.sha256[:16]
             
             # Build instructions (system.md sent explicitly every call)
-            system_text = self.registry.get_text("system")
+            system_text = self._system_text
             
             # Build input from the full transcript (excluding system which is sent via instructions).
             # Note: The latest user prompt has already been appended to dialogue_history,
             # so _build_canonical_transcript() already includes it. Do NOT append it again.
-            input_text = self._build_canonical_transcript()
+            input_text = self._build_canonical_transcript(history)
             
             # P0-3: Get strict JSON schema for response format (per colleague_1's specification)
             from ...infrastructure.validation.json_schema_converter import get_strict_response_format
@@ -1043,16 +1138,16 @@ Lenses: {lenses_result['lenses']}"""
                     stage_result = {"content": response_content, "error": "json_parse_failed"}
             
             # Add assistant response to history
-            assistant_message = {"role": "assistant", "content": response_content}
-            self.dialogue_history.append(assistant_message)
+            self._append_message("assistant", response_content, history)
             
             # Update token count from actual usage
             usage = response.get("usage")
-            if usage and hasattr(usage, "total_tokens"):
-                self.token_count += getattr(usage, "total_tokens", 0)
-            else:
-                # Fallback to estimation
-                self.token_count += len(rendered_prompt.split()) + len(response_content.split())
+            with self._token_lock:
+                if usage and hasattr(usage, "total_tokens"):
+                    self.token_count += getattr(usage, "total_tokens", 0)
+                else:
+                    # Fallback to estimation
+                    self.token_count += len(rendered_prompt.split()) + len(response_content.split())
             
             # Compute output hash
             output_hash = hashlib.sha256(response_content.encode()).hexdigest()[:16]
@@ -1070,7 +1165,7 @@ Lenses: {lenses_result['lenses']}"""
                 "usage": usage if usage else {"estimated_tokens": len(rendered_prompt.split()) + len(response_content.split())},
                 "api_call": "responses",  # Mark as using new API
                 "response_id": response.get("id"),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp_offset_ns": self._elapsed_ns()
             }
             
             return stage_result, trace_entry
@@ -1081,7 +1176,7 @@ Lenses: {lenses_result['lenses']}"""
             error_trace = {
                 "asset_id": asset_id,
                 "error": str(e),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp_offset_ns": self._elapsed_ns()
             }
             return error_result, error_trace
 
@@ -1122,9 +1217,7 @@ cols: {json.dumps(cols)}
         Returns:
             Tuple of (data_drop_result, trace_entry)
         """
-        import json
         import hashlib
-        from datetime import datetime, timezone
         
         # Build clean data-drop block based on kind
         if getattr(self, 'relaxed_json', False):
@@ -1157,8 +1250,7 @@ Matrix {matrix_name} has been derived through transformation."""
             raise ValueError(f"Invalid data-drop kind: {kind}. Must be 'transform'")
         
         # Add user turn to dialogue history
-        user_message = {"role": "user", "content": data_drop_block}
-        self.dialogue_history.append(user_message)
+        self._append_message("user", data_drop_block)
         
         # Build data-drop result
         data_drop_result = {
@@ -1184,7 +1276,7 @@ Matrix {matrix_name} has been derived through transformation."""
             "matrix": matrix_name,
             "turn_type": "data",  # Mark as data turn per spec
             "content_hash": content_hash,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp_offset_ns": self._elapsed_ns(),
             "no_llm_call": True  # Explicit marker
         }
         
@@ -1210,8 +1302,6 @@ Matrix {matrix_name} has been derived through transformation."""
         Returns:
             Tuple of (lenses_result, trace_entry)
         """
-        import json
-        import hashlib
         
         # D2-2: Preflight parity check
         # Verify rows/cols from interpreted matrix match lens block before injection
@@ -1260,7 +1350,7 @@ Matrix {matrix_name} has been derived through transformation."""
                 "station": station,
                 "matrix": matrix_name,
                 "source": lenses_result.get("source", "auto"),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp_offset_ns": self._elapsed_ns(),
             }
             return lenses_result, trace_entry
 
@@ -1294,23 +1384,6 @@ Matrix {matrix_name} has been derived through transformation."""
                 # Log structured skip reason for production
                 print(f"ℹ️  Matrix {matrix_name} parity check: interpreted layer not computed (expected for non-LLM stages)")
         
-        # Get metadata for provenance
-        from ...infrastructure.prompts.registry import get_registry
-        registry = get_registry()
-        
-        # Compute hashes for provenance
-        system_text = registry.get_text("system")
-        system_sha = hashlib.sha256(system_text.encode()).hexdigest()[:16]
-        
-        # Get normative context if available
-        from pathlib import Path
-        normative_file = Path(__file__).parent.parent.parent / "normative_system_prompt.txt"
-        if normative_file.exists():
-            normative_text = normative_file.read_text()
-            normative_sha = hashlib.sha256(normative_text.encode()).hexdigest()[:16]
-        else:
-            normative_sha = "unavailable"
-        
         # Asset SHA from lens source
         asset_sha = lenses_result.get("meta", {}).get("asset_sha", "unknown")
         if not asset_sha or asset_sha == "unknown":
@@ -1350,8 +1423,7 @@ Lenses: {lenses_result['lenses']}"""
                 print(f"✅ D2-5 lens payload validation passed for {station}/{matrix_name}")
             
             # Add lens data as USER message (data belongs in conversational turns)
-            lens_message = {"role": "user", "content": lens_block}
-            self.dialogue_history.append(lens_message)
+            self._append_message("user", lens_block)
         else:
             print(f"✅ Auto mode: lenses already in transcript from LLM generation for {station}/{matrix_name}")
         
@@ -1364,19 +1436,17 @@ Lenses: {lenses_result['lenses']}"""
             "source": lenses_result["source"],
             "lens_count": sum(len(row) for row in lenses_result["lenses"]),
             "meta": {
-                "system_sha": system_sha,
-                "normative_sha": normative_sha,
+                **self._prompt_shas,
                 "asset_sha": asset_sha
             },
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp_offset_ns": self._elapsed_ns()
         }
         
         return lenses_result, trace_entry
 
     def _build_system_message(self) -> str:
         """Build the system message with normative context."""
-        registry = get_registry()
-        return registry.get_text("system")
+        return self._system_text
 
     def _call_llm_with_json_tail(
         self, user_message: str, json_tail: str, operation: str
@@ -1396,7 +1466,7 @@ Lenses: {lenses_result['lenses']}"""
         full_message = f"{user_message}\n\n{json_tail}"
 
         # Add to dialogue history
-        self.dialogue_history.append({"role": "user", "content": full_message})
+        self._append_message("user", full_message)
 
         # Check token budget
         if self.budget_config and self.budget_config.token_budget and self.token_count > self.budget_config.token_budget:
@@ -1443,17 +1513,10 @@ Lenses: {lenses_result['lenses']}"""
 
         # Build instructions and input for Responses API
         # Get system prompt
-        system_text = self.registry.get_text("system")
+        system_text = self._system_text
         
         # Build input from dialogue history as string (not messages array)
-        transcript_lines = []
-        for msg in self.dialogue_history:
-            role = msg["role"]
-            content = msg["content"]
-            if role != "system":  # Skip system message as it goes in instructions
-                transcript_lines.append(f"[{role.upper()}] {content}")
-        
-        input_text = "\n\n".join(transcript_lines)
+        input_text = self._build_canonical_transcript()
 
         parsed, metadata = try_parse_json_or_repair(
             instructions=system_text,
@@ -1523,16 +1586,19 @@ Lenses: {lenses_result['lenses']}"""
                 f"Matrix {matrix_name} row count mismatch: "
                 f"LLM has {len(llm_elements)} rows, computed has {len(comp_elements)}"
             )
-            
-        for i, (llm_row, comp_row) in enumerate(zip(llm_elements, comp_elements)):
-            if len(llm_row) != len(comp_row):
-                raise ValueError(
-                    f"Matrix {matrix_name} row {i} length mismatch: "
-                    f"LLM has {len(llm_row)} elements, computed has {len(comp_row)}"
-                )
-            
-            # For now, we'll trust the semantic content matches
-            # In production, you might want deeper semantic comparison
+        
+        # Compare all row lengths at once; only locate the offending row on failure
+        llm_lens = list(map(len, llm_elements))
+        comp_lens = list(map(len, comp_elements))
+        if llm_lens != comp_lens:
+            i = next(i for i, (a, b) in enumerate(zip(llm_lens, comp_lens)) if a != b)
+            raise ValueError(
+                f"Matrix {matrix_name} row {i} length mismatch: "
+                f"LLM has {llm_lens[i]} elements, computed has {comp_lens[i]}"
+            )
+        
+        # For now, we'll trust the semantic content matches
+        # In production, you might want deeper semantic comparison
             
         print(f"✅ Matrix {matrix_name} reconstruction validated: {len(comp_rows)}×{len(comp_cols)}")
         return True
@@ -1540,7 +1606,6 @@ Lenses: {lenses_result['lenses']}"""
     def _generate_semantic_trace_file(self, output_dir: Path):
         """Generate human-readable semantic valley trace file."""
         from datetime import datetime
-        import json
         
         trace_file = output_dir / "SEMANTIC_VALLEY_TRACE.txt"
         
@@ -1554,8 +1619,7 @@ Lenses: {lenses_result['lenses']}"""
             stage_num = 0
             
             for i, entry in enumerate(self.dialogue_history, 1):
-                role = entry.get('role', '')
-                content = entry.get('content', '')
+                role, content = entry
                 
                 if role == 'system':
                     stage_num += 1
@@ -1565,31 +1629,10 @@ Lenses: {lenses_result['lenses']}"""
                     
                 elif role == 'user':
                     stage_num += 1
-                    if 'play a game' in content and 'sufficient' in content:
-                        out.write(f'STAGE {stage_num}: INITIALIZE (Semantic Priming)\n')
-                        out.write('-' * 40 + '\n')
-                        out.write('COMPLETE CONTENT:\n')
-                        out.write(content + '\n\n')
-                    elif 'mechanical' in content.lower():
-                        out.write(f'STAGE {stage_num}: MECHANICAL CONSTRUCTION\n')
-                        out.write('-' * 40 + '\n')
-                        out.write('COMPLETE CONTENT:\n')
-                        out.write(content + '\n\n')
-                    elif 'semantic' in content.lower() and 'interpretation' in content.lower():
-                        out.write(f'STAGE {stage_num}: SEMANTIC INTERPRETATION\n')
-                        out.write('-' * 40 + '\n')
-                        out.write('COMPLETE CONTENT:\n')
-                        out.write(content + '\n\n')
-                    elif 'lens' in content.lower():
-                        out.write(f'STAGE {stage_num}: LENS APPLICATION\n')
-                        out.write('-' * 40 + '\n')
-                        out.write('COMPLETE CONTENT:\n')
-                        out.write(content + '\n\n')
-                    else:
-                        out.write(f'STAGE {stage_num}: USER INSTRUCTION\n')
-                        out.write('-' * 40 + '\n')
-                        out.write('COMPLETE CONTENT:\n')
-                        out.write(content + '\n\n')
+                    out.write(f'STAGE {stage_num}: {_classify_user_turn(content)}\n')
+                    out.write('-' * 40 + '\n')
+                    out.write('COMPLETE CONTENT:\n')
+                    out.write(content + '\n\n')
                         
                 elif role == 'assistant':
                     out.write(f'GPT-5 RESPONSE (Stage {stage_num}):\n')
@@ -1609,32 +1652,45 @@ Lenses: {lenses_result['lenses']}"""
     
     def _compute_kernel_hash(self) -> str:
         """Compute kernel hash from prompt assets."""
-        registry = get_registry()
-        return registry.compute_kernel_hash()
-
-    def _format_matrix(self, matrix) -> str:
-        """Format a matrix for display in prompts."""
-        lines = []
-        for i, row in enumerate(matrix.cells):
-            row_values = [cell.value for cell in row]
-            lines.append(f"Row {i} ({matrix.row_labels[i]}): {row_values}")
-        return "\n".join(lines)
-
-    def _format_elements(self, elements: List[List[str]], rows: List[str], cols: List[str]) -> str:
-        """Format matrix elements for display in prompts."""
-        lines = []
-        for i, row in enumerate(elements):
-            lines.append(f"Row {i} ({rows[i]}): {row}")
-        return "\n".join(lines)
+        return self._kernel_hash
+
+    def _start_run_clock(self) -> None:
+        """Anchor the run's wall-clock start and its monotonic reference."""
+        self._t0_iso = datetime.now(timezone.utc).isoformat()
+        self._t0_mono = time.monotonic_ns()
+
+    def _elapsed_ns(self) -> int:
+        """Nanoseconds since the run started (monotonic, for trace ordering)."""
+        return time.monotonic_ns() - self._t0_mono
+
+    def _compute_prompt_shas(self) -> Dict[str, str]:
+        """Hash the system prompt and normative context once for lens-injection provenance."""
+        import hashlib
+
+        system_sha = hashlib.sha256(self._system_text.encode()).hexdigest()[:16]
+
+        # Get normative context if available
+        normative_file = Path(__file__).parent.parent.parent / "normative_system_prompt.txt"
+        if normative_file.exists():
+            normative_sha = hashlib.sha256(normative_file.read_bytes()).hexdigest()[:16]
+        else:
+            normative_sha = "unavailable"
+
+        return {"system_sha": system_sha, "normative_sha": normative_sha}
+
+    def reload_assets(self) -> None:
+        """Reload prompt assets and refresh the cached system text and kernel hash."""
+        self.registry.reload()
+        self._system_text = self.registry.get_text("system")
+        self._kernel_hash = self.registry.compute_kernel_hash()
+        self._prompt_shas = self._compute_prompt_shas()
 
     def save_dialogue(self, output_path: Path):
         """Save dialogue history to JSONL file."""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            for message in self.dialogue_history:
-                f.write(json.dumps(message) + "\n")
+        jsonio.write_jsonl(output_path, (message._asdict() for message in self.dialogue_history))
         
         # Generate human-readable semantic valley trace
         self._generate_semantic_trace_file(output_path.parent)
@@ -5,12 +5,52 @@ Converts dialogue history into a compact snapshot that serves
 as the system prompt for Phase 2 tensor operations.
 """
 
-import json
 import hashlib
 from typing import List, Dict, Any
 from pathlib import Path
 from datetime import datetime, timezone
 
+from ...lib.jsonio import read_jsonl
+
+# Static snapshot sections (invariant across runs, built once at import)
+_STATION_CONTEXTS = {
+    "Problem Statement": "Understanding the problem space",
+    "Requirements": "Defining what is needed",
+    "Objectives": "Setting solution goals",
+    "Verification": "Checking solution validity",
+    "Validation": "Confirming solution value",
+    "Evaluation": "Assessing solution quality",
+}
+
+_STATION_CONTEXTS_MD = "\n".join(
+    f"### {station}\n{description}\n" for station, description in _STATION_CONTEXTS.items()
+)
+
+_TRANSFORMATIONS_MD = "\n".join(
+    [
+        "### Matrix Computations",
+        "- C = A · B (Problem Statement)",
+        "- F = C ⊙ J (Requirements)",
+        "- D = A + F (Objectives with canonical formula)",
+        "- K = transpose(D)",
+        "- X = K · J (Verification)",
+        "- Z = shift(X) (Validation)",
+        "- G = Z[0:3, :] (First 3 rows)",
+        "- P = Z[3, :] (Fourth row)",
+        "- T = transpose(J)",
+        "- E = G · T (Evaluation)",
+    ]
+)
+
+_COMMON_COMBINATIONS_MD = "\n".join(
+    [
+        "\n#### Common Semantic Combinations",
+        "- Normative × Necessity → Standards and requirements",
+        "- Operative × Sufficiency → Practical implementations",
+        "- Iterative × Completeness → Continuous improvement",
+    ]
+)
+
 
 class SnapshotGenerator:
     """
@@ -103,11 +143,7 @@ class SnapshotGenerator:
 
     def _load_dialogue(self, dialogue_path: Path) -> List[Dict[str, Any]]:
         """Load dialogue history from JSONL."""
-        dialogue = []
-        with open(dialogue_path, "r") as f:
-            for line in f:
-                dialogue.append(json.loads(line))
-        return dialogue
+        return read_jsonl(dialogue_path)
 
     def _generate_front_matter(self, phase1_output: Dict[str, Any]) -> str:
         """Generate YAML front matter for snapshot."""
@@ -169,23 +205,7 @@ application to the canonical matrices.
 
     def _extract_station_contexts(self, dialogue: List[Dict]) -> str:
         """Extract station contexts from dialogue."""
-        stations = []
-
-        station_map = {
-            "Problem Statement": "Understanding the problem space",
-            "Requirements": "Defining what is needed",
-            "Objectives": "Setting solution goals",
-            "Verification": "Checking solution validity",
-            "Validation": "Confirming solution value",
-            "Evaluation": "Assessing solution quality",
-        }
-
-        for station, description in station_map.items():
-            stations.append(f"### {station}")
-            stations.append(f"{description}")
-            stations.append("")
-
-        return "\n".join(stations)
+        return _STATION_CONTEXTS_MD
 
     def _format_matrix_definitions(self, phase1_output: Dict[str, Any]) -> str:
         """Format matrix definitions from Phase 1 output."""
@@ -214,21 +234,7 @@ application to the canonical matrices.
 
     def _extract_transformations(self, dialogue: List[Dict]) -> str:
         """Extract key transformations from dialogue."""
-        transformations = []
-
-        transformations.append("### Matrix Computations")
-        transformations.append("- C = A · B (Problem Statement)")
-        transformations.append("- F = C ⊙ J (Requirements)")
-        transformations.append("- D = A + F (Objectives with canonical formula)")
-        transformations.append("- K = transpose(D)")
-        transformations.append("- X = K · J (Verification)")
-        transformations.append("- Z = shift(X) (Validation)")
-        transformations.append("- G = Z[0:3, :] (First 3 rows)")
-        transformations.append("- P = Z[3, :] (Fourth row)")
-        transformations.append("- T = transpose(J)")
-        transformations.append("- E = G · T (Evaluation)")
-
-        return "\n".join(transformations)
+        return _TRANSFORMATIONS_MD
 
     def _extract_patterns(self, dialogue: List[Dict], phase1_output: Dict[str, Any]) -> str:
         """Extract semantic patterns discovered."""
@@ -244,10 +250,7 @@ application to the canonical matrices.
                 patterns.append(f"{i}. {principle}")
 
         # Look for recurring semantic combinations
-        patterns.append("\n#### Common Semantic Combinations")
-        patterns.append("- Normative × Necessity → Standards and requirements")
-        patterns.append("- Operative × Sufficiency → Practical implementations")
-        patterns.append("- Iterative × Completeness → Continuous improvement")
+        patterns.append(_COMMON_COMBINATIONS_MD)
 
         return "\n".join(patterns)
 
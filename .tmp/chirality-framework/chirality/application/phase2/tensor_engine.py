@@ -8,18 +8,136 @@ rolling context.
 
 import json
 import hashlib
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 import itertools
+import math
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from ...infrastructure.llm.openai_adapter import call_responses
 from ...infrastructure.llm.repair import try_parse_json_or_repair, create_tensor_cell_schema_hint
 from ...infrastructure.monitoring.tracer import JSONLTracer
-from ...infrastructure.caching import CellCache, ResumableRunner
+from ...infrastructure.caching import CellCache, ResumableRunner, content_digest
 from ...domain.budgets import BudgetConfig, BudgetTracker
+from ...lib import jsonio
 from ...lib.logging import log_info
 
 
+# Cell prompt + JSON contract, parsed once and filled per cell with %-formatting
+_CELL_PROMPT_TEMPLATE = """
+Compute tensor cell %(tensor)s%(index)s using semantic cross product.
+
+Left operand: %(left)s
+Right operand: %(right)s
+
+Apply the semantic cross product operation to create a hierarchical
+semantic relationship between these operands.
+
+%(lens)s
+
+Consider how the left operand provides context that transforms or
+extends the meaning of the right operand in this hierarchical structure.
+
+
+Return JSON only: {"tensor":"%(tensor)s","value":"...","confidence":0.0-1.0}"""
+
+
+# Cells keyed and looked up per chunk in compute_tensor's resume/cache pre-pass
+_LOOKUP_CHUNK_SIZE = 1024
+
+
+def _is_cell_result(obj: Any) -> Tuple[bool, str]:
+    """Check a parsed cell response carries the contract's `value` field."""
+    if not isinstance(obj, dict):
+        return False, "not a dict"
+    if not isinstance(obj.get("value"), str):
+        return False, "missing string 'value'"
+    return True, ""
+
+
+class _CellWriter:
+    """
+    Write-behind persistence for computed cells.
+
+    Cell workers submit results and go straight back to the LLM while a single
+    background thread writes them to the cache and resume traces. The queue
+    is bounded so a slow disk applies backpressure instead of buffering the
+    whole tensor in memory.
+    """
+
+    def __init__(self, write: Callable[..., None], maxsize: int = 1024):
+        self._write = write
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=maxsize)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="tensor-cell-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, *item: Any):
+        """Queue one write; blocks only when the queue is full."""
+        self._queue.put(item)
+
+    def close(self):
+        """Drain pending writes, stop the thread, and re-raise the first write error."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error is None:
+                try:
+                    self._write(*item)
+                except Exception as e:
+                    # Surface on close(); later writes are skipped
+                    self._error = e
+
+
+class _LensTable:
+    """
+    Lens lookup for one tensor computation.
+
+    A cell's lens depends only on the (row, col) slice of its index, so lens
+    ids and texts are resolved once per coordinate and reused for every cell
+    sharing it. Missing lenses still raise on first use.
+    """
+
+    __slots__ = ("_engine", "_matrix", "_coords", "_ids", "_lenses")
+
+    def __init__(self, engine: "TensorEngine", matrix: Dict[str, Any], rank: int):
+        self._engine = engine
+        self._matrix = matrix
+        # Same index slice _compute_lens_id reads the row/col from
+        n_dims = len(matrix.get("rows", [])) + len(matrix.get("cols", []))
+        start = rank - n_dims
+        self._coords = slice(start, start + 2) if 0 <= start < rank - 1 else slice(0, 0)
+        self._ids: Dict[Tuple[int, ...], str] = {}
+        self._lenses: Dict[Tuple[int, ...], Tuple[str, str]] = {}
+
+    def lens_id(self, idx: Tuple[int, ...]) -> str:
+        """Lens ID for a cell index."""
+        key = idx[self._coords]
+        lens_id = self._ids.get(key)
+        if lens_id is None:
+            lens_id = self._ids[key] = self._engine._compute_lens_id(self._matrix, idx)
+        return lens_id
+
+    def lens(self, idx: Tuple[int, ...]) -> Tuple[str, str]:
+        """(lens_id, lens_text) for a cell index, from a single lookup."""
+        key = idx[self._coords]
+        entry = self._lenses.get(key)
+        if entry is None:
+            lens_text = self._engine._get_lens_text(self._matrix, idx)
+            entry = self._lenses[key] = (self.lens_id(idx), lens_text)
+        return entry
+
+
 class TensorEngine:
     """
     Executes Phase 2 tensor computations statelessly.
@@ -43,6 +161,8 @@ class TensorEngine:
         artifacts_dir: Optional[Path] = None,
         cache_enabled: bool = True,
         resume: bool = False,
+        batch_size: int = 1,
+        dedupe_operands: bool = False,
     ):
         """
         Initialize tensor engine.
@@ -61,11 +181,18 @@ class TensorEngine:
             artifacts_dir: Directory for caching and resume data
             cache_enabled: Whether to enable cell caching
             resume: Whether to resume from previous run
+            batch_size: Maximum cells sharing a lens to compute in one LLM call
+            dedupe_operands: Compute identical (left, right, lens) cells only once
         """
         self.snapshot = self._load_snapshot(snapshot_path)
         self.phase1_output = phase1_output
         self.lens_catalog = self._load_lens_catalog(lens_catalog_path) if lens_catalog_path else {}
 
+        # Cache-key components that are invariant for the engine's lifetime
+        self._snapshot_hash = self._get_snapshot_hash()
+        self._kernel_hash = self._get_kernel_hash()
+        self._lens_catalog_digest = self._get_lens_catalog_digest()
+
         # Single source of truth: model/temperature/top_p from global config when not provided
         from ...infrastructure.llm.config import get_config
         cfg = get_config()
@@ -78,11 +205,24 @@ class TensorEngine:
         self.tracer = tracer
         self.artifacts_dir = Path(artifacts_dir) if artifacts_dir else None
         self.resume = resume
+        self.batch_size = max(1, batch_size)
+        self.dedupe_operands = dedupe_operands
+
+        # Background cell writer, live only while compute_tensor runs
+        self._writer: Optional[_CellWriter] = None
+
+        # Compact per-source operand accessors, keyed by (id(source), side)
+        self._operand_accessors: Dict[Tuple[int, str], Tuple[Any, Callable]] = {}
+
+        # Per-tensor response schemas and repair hints, reused across cells
+        self._response_formats: Dict[str, Dict[str, Any]] = {}
+        self._batch_response_formats: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._schema_hints: Dict[str, str] = {}
 
         # Budget tracking (single source of truth)
         self.budget_tracker = None
         if budget_config:
-            self.budget_tracker = BudgetTracker(budget_config, phase="phase2")
+            self.budget_tracker = BudgetTracker.for_config(budget_config, phase="phase2")
 
         # Cache and resume infrastructure
         if cache_enabled and self.artifacts_dir:
@@ -124,72 +264,114 @@ class TensorEngine:
         # Compute tensor dimensions
         dims = self._compute_tensor_dims(left_source, right_source)
 
-        # Apply pruning if configured
+        # Lens ids/texts are resolved once per lens coordinate, not per cell
+        lens_table = _LensTable(self, matrix_for_lens, len(dims))
+
+        # Apply pruning if configured; otherwise stream indices without materializing
         if pruning_config:
-            cell_indices = self._apply_pruning(dims, pruning_config)
+            cell_indices = self._apply_pruning(
+                dims,
+                pruning_config,
+                features=lambda idx: (
+                    self._get_operand_value(left_source, idx, "left"),
+                    self._get_operand_value(right_source, idx, "right"),
+                    lens_table.lens_id(idx),
+                ),
+            )
+            total_cells = len(cell_indices)
         else:
-            cell_indices = list(itertools.product(*[range(d) for d in dims]))
+            cell_indices = itertools.product(*[range(d) for d in dims])
+            total_cells = math.prod(dims)
 
         # Get completed cells for resume
         completed_cells = set()
         if self.resume and self.resumable_runner:
             completed_cells = self.resumable_runner.get_completed_cells(name)
 
-        # Compute cells
+        # Serve resume/cache hits first; only the remaining cells need the LLM.
+        # Pending cells get a placeholder so `cells` stays in index order
         cells = {}
-        cells_computed = 0
+        pending = []
         cells_from_cache = 0
         cells_from_resume = 0
 
-        for idx in cell_indices:
-            # Check resume first (saved cell traces)
-            if self.resumable_runner:
-                # Use canonical cell key from ResumableRunner
-                cell_key_resume = "_".join(map(str, idx))
-                if cell_key_resume in completed_cells:
-                    resumed_result = self.resumable_runner.load_cell_result(name, idx)
-                    if resumed_result:
-                        cells[idx] = resumed_result
-                        cells_from_resume += 1
-                        continue
-
-            # Check cache second (disk/memory cache)
-            cache_key = self._compute_cache_key(
-                name, idx, left_source, right_source, matrix_for_lens
-            )
-            cached_result = self.cache.get(cache_key)
-            if cached_result:
-                cells[idx] = cached_result
-                cells_from_cache += 1
-                continue
+        # Index the cache store once so misses need no per-cell query
+        self.cache.scan()
 
-            # Compute cell (last resort)
-            cell_value = self._compute_tensor_cell(
-                name, idx, left_source, right_source, matrix_for_lens, cache_key
+        # Cache keys are pure CPU; the resume/cache reads are disk I/O, so they
+        # are fanned out across the worker pool
+        key_builder = self.cache.make_key_builder(
+            tensor_name=name,
+            model=self.model,
+            temperature=self.temperature,
+            top_p=self.top_p,
+            kernel_hash=self._kernel_hash,
+            lens_catalog_digest=self._lens_catalog_digest,
+        )
+        def lookup(item):
+            return self._lookup_cell(name, item[0], item[1], completed_cells)
+
+        # Indices are consumed in fixed-size chunks so the index stream is never
+        # materialized and at most one chunk of lookups is queued on the pool
+        has_disk_state = self.cache.enabled or bool(completed_cells)
+        executor = (
+            ThreadPoolExecutor(max_workers=self.parallel)
+            if has_disk_state and self.parallel > 1
+            else None
+        )
+        try:
+            cell_indices = iter(cell_indices)
+            while True:
+                keyed = [
+                    (idx, self._compute_cache_key(key_builder, idx, left_source, right_source, lens_table))
+                    for idx in itertools.islice(cell_indices, _LOOKUP_CHUNK_SIZE)
+                ]
+                if not keyed:
+                    break
+                hits = executor.map(lookup, keyed) if executor and len(keyed) > 1 else map(lookup, keyed)
+
+                for (idx, cache_key), (source, result) in zip(keyed, hits):
+                    cells[idx] = result
+                    if source == "resume":
+                        cells_from_resume += 1
+                    elif source == "cache":
+                        cells_from_cache += 1
+                    else:
+                        pending.append((idx, cache_key))
+        finally:
+            if executor:
+                executor.shutdown()
+
+        # Cache/resume writes go to a background writer so workers return to the
+        # LLM immediately; it is drained before returning or raising
+        if self.cache.enabled or self.resumable_runner:
+            self._writer = _CellWriter(self._store_cell)
+        try:
+            cells_computed, cells_deduplicated = self._compute_pending_cells(
+                name, cells, pending, left_source, right_source, lens_table
             )
-
-            # Save to cache
-            self.cache.put(cache_key, cell_value)
-
-            # Save to resume traces
-            if self.resumable_runner:
-                self.resumable_runner.save_cell_result(name, idx, cell_value)
-
-            cells[idx] = cell_value
-            cells_computed += 1
+        finally:
+            writer, self._writer = self._writer, None
+            try:
+                if writer:
+                    writer.close()
+            finally:
+                # Commit the last partial batch of resume traces
+                if self.resumable_runner:
+                    self.resumable_runner.flush()
 
         # Update progress tracking
         if self.resumable_runner:
-            total_cells = len(cell_indices)
-            completed = cells_computed + cells_from_cache + cells_from_resume
+            completed = cells_computed + cells_deduplicated + cells_from_cache + cells_from_resume
             self.resumable_runner.update_progress(name, completed, total_cells)
 
         # Log computation stats
         log_info(f"Tensor {name} computation complete:")
         log_info(f"  Cells computed: {cells_computed}")
+        log_info(f"  Cells deduplicated: {cells_deduplicated}")
         log_info(f"  Cells from cache: {cells_from_cache}")
         log_info(f"  Cells from resume: {cells_from_resume}")
-        log_info(f"  Total cells: {len(cell_indices)}")
+        log_info(f"  Total cells: {total_cells}")
 
         return {
             "name": name,
@@ -200,9 +382,10 @@ class TensorEngine:
             "matrix_operand": matrix_operand,
             "stats": {
                 "cells_computed": cells_computed,
+                "cells_deduplicated": cells_deduplicated,
                 "cells_from_cache": cells_from_cache,
                 "cells_from_resume": cells_from_resume,
-                "total_cells": len(cell_indices),
+                "total_cells": total_cells,
             },
         }
 
@@ -223,13 +406,11 @@ class TensorEngine:
 
     def _load_lens_catalog(self, catalog_path: Path) -> Dict[str, str]:
         """Load precomputed lens catalog."""
-        catalog = {}
-        with open(catalog_path, "r") as f:
-            for line in f:
-                entry = json.loads(line)
-                lens_id = entry["lens_id"]
-                catalog[lens_id] = entry["text"]
-        return catalog
+        # Lens ids are interned since they are reused as cache-key inputs
+        return {
+            sys.intern(entry["lens_id"]): entry["text"]
+            for entry in jsonio.read_jsonl(catalog_path)
+        }
 
     def _get_source(self, source_spec: Dict[str, str]) -> Any:
         """Get source data based on specification."""
@@ -306,63 +487,407 @@ class TensorEngine:
 
         return dims
 
-    def _apply_pruning(self, dims: List[int], config: Dict[str, Any]) -> List[Tuple[int, ...]]:
-        """Apply pruning to reduce cell count."""
+    def _apply_pruning(
+        self,
+        dims: List[int],
+        config: Dict[str, Any],
+        features: Optional[Callable[[Tuple[int, ...]], Tuple[Any, ...]]] = None,
+    ) -> List[Tuple[int, ...]]:
+        """
+        Apply pruning to reduce cell count.
+
+        Picks up to max_pairs cells greedily for coverage, so the budget
+        spreads across distinct operand pairs instead of the first rows of the
+        index space: each pick is the first cell with the most feature values
+        (the index coordinates unless `features` is given) not yet covered. A
+        feature's coverage resets once all of its values have been picked. Set
+        strategy="first" in the config for plain first-N selection.
+        """
         max_pairs = config.get("max_pairs", 64)
         config.get("top_k", 8)
 
-        # Generate all indices
-        all_indices = list(itertools.product(*[range(d) for d in dims]))
-
-        # Apply max_pairs limit
-        if len(all_indices) > max_pairs:
-            # Could implement smarter selection here
-            # For now, just take first max_pairs
-            all_indices = all_indices[:max_pairs]
-
-        return all_indices
+        all_indices = itertools.product(*[range(d) for d in dims])
+        if config.get("strategy") == "first":
+            return list(itertools.islice(all_indices, max_pairs))
+
+        candidates = list(all_indices)
+        if len(candidates) <= max_pairs:
+            return candidates
+
+        keys = [features(idx) for idx in candidates] if features else candidates
+        width = len(keys[0])
+        cardinality = [len({key[j] for key in keys}) for j in range(width)]
+        covered = [set() for _ in range(width)]
+
+        remaining = list(range(len(candidates)))
+        selected = []
+        while len(selected) < max_pairs:
+            best_pos, best_score = 0, -1
+            for pos, i in enumerate(remaining):
+                score = sum(value not in seen for value, seen in zip(keys[i], covered))
+                if score > best_score:
+                    best_pos, best_score = pos, score
+                    if score == width:
+                        break
+            chosen = remaining.pop(best_pos)
+            selected.append(chosen)
+            for j, value in enumerate(keys[chosen]):
+                covered[j].add(value)
+                if len(covered[j]) == cardinality[j]:
+                    covered[j].clear()
+
+        return [candidates[i] for i in sorted(selected)]
 
     def _compute_cache_key(
         self,
-        tensor_name: str,
+        key_builder: Callable[[Tuple[int, ...], str, str, str], str],
         idx: Tuple[int, ...],
         left_source: Any,
         right_source: Any,
-        matrix_for_lens: Dict[str, Any],
+        lens_table: _LensTable,
     ) -> str:
-        """Compute complete cache key for a cell including all dependencies."""
+        """Compute complete cache key for a cell including all dependencies.
+
+        key_builder comes from CellCache.make_key_builder for this tensor and
+        already covers the model and prompt parameters.
+        """
         # Get operand values
         left_value = self._get_operand_value(left_source, idx, "left")
         right_value = self._get_operand_value(right_source, idx, "right")
 
-        # Compute operands hash
+        # Compute operands hash; text operands recur across a tensor sweep, so
+        # their hash is memoized under the (left, right) pair itself
         operands = {"left": left_value, "right": right_value}
-        operands_hash = self.cache.compute_operands_hash(operands)
+        operands_key = (
+            (left_value, right_value)
+            if isinstance(left_value, str) and isinstance(right_value, str)
+            else None
+        )
+        operands_hash = self.cache.compute_operands_hash(operands, operands_key)
 
         # Get lens ID
-        lens_id = self._compute_lens_id(matrix_for_lens, idx)
+        lens_id = lens_table.lens_id(idx)
 
-        # Get stable snapshot hash from Phase 1 output (if available)
-        snapshot_hash = self._get_snapshot_hash()
+        return key_builder(idx, operands_hash, lens_id, self._snapshot_hash)
 
-        # Get kernel hash from Phase 1 output (if available)
-        kernel_hash = self._get_kernel_hash()
+    def _compute_pending_cells(
+        self,
+        name: str,
+        cells: Dict[Tuple[int, ...], Any],
+        pending: List[Tuple[Tuple[int, ...], str]],
+        left_source: Any,
+        right_source: Any,
+        lens_table: _LensTable,
+    ) -> Tuple[int, int]:
+        """
+        Compute the cells no resume trace or cache entry covered, in place.
 
-        # Get lens catalog digest
-        lens_catalog_digest = self._get_lens_catalog_digest()
+        Returns:
+            Tuple of (cells computed, cells filled by deduplication)
+        """
+        # Identical (left, right, lens) triples get the same answer; compute each once
+        duplicates = {}
+        if self.dedupe_operands:
+            pending, duplicates = self._dedupe_pending_cells(
+                pending, left_source, right_source, lens_table
+            )
 
-        return self.cache.compute_cache_key(
-            tensor_name=tensor_name,
-            indices=idx,
-            operands_hash=operands_hash,
-            lens_id=lens_id,
-            snapshot_hash=snapshot_hash,
-            model=self.model,
-            temperature=self.temperature,
-            top_p=self.top_p,
-            kernel_hash=kernel_hash,
-            lens_catalog_digest=lens_catalog_digest,
+        # Compute remaining cells (last resort) - calls are network-bound, so they
+        # run on up to `parallel` workers
+        groups = self._group_pending_cells(pending, lens_table)
+        if self.parallel > 1 and len(groups) > 1:
+            executor = ThreadPoolExecutor(max_workers=min(self.parallel, len(groups)))
+            try:
+                futures = [
+                    executor.submit(
+                        self._compute_and_store_cells,
+                        name, group, left_source, right_source, lens_table,
+                    )
+                    for group in groups
+                ]
+                for future in futures:
+                    cells.update(future.result())
+            finally:
+                # Don't keep spending on queued cells once one has failed (e.g. budget)
+                executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            for group in groups:
+                cells.update(
+                    self._compute_and_store_cells(
+                        name, group, left_source, right_source, lens_table
+                    )
+                )
+        cells_computed = len(pending)
+
+        # Fan deduplicated results out to their duplicate indices
+        cells_deduplicated = 0
+        for idx, copies in duplicates.items():
+            for dup_idx, dup_cache_key in copies:
+                cell_value = {**cells[idx], "index": dup_idx}
+                self._persist_cell(name, dup_idx, dup_cache_key, cell_value)
+                cells[dup_idx] = cell_value
+                cells_deduplicated += 1
+
+        return cells_computed, cells_deduplicated
+
+    def _lookup_cell(
+        self,
+        tensor_name: str,
+        idx: Tuple[int, ...],
+        cache_key: str,
+        completed_cells: set,
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Find a previously computed cell.
+
+        Returns:
+            ("resume" | "cache", result) on a hit, (None, None) otherwise
+        """
+        # Check resume first (saved cell traces)
+        if self.resumable_runner:
+            # Use canonical cell key from ResumableRunner
+            cell_key_resume = "_".join(map(str, idx))
+            if cell_key_resume in completed_cells:
+                resumed_result = self.resumable_runner.load_cell_result(tensor_name, idx)
+                if resumed_result:
+                    return "resume", resumed_result
+
+        # Check cache second (disk/memory cache)
+        cached_result = self.cache.get(cache_key)
+        if cached_result:
+            return "cache", cached_result
+
+        return None, None
+
+    def _dedupe_pending_cells(
+        self,
+        pending: List[Tuple[Tuple[int, ...], str]],
+        left_source: Any,
+        right_source: Any,
+        lens_table: _LensTable,
+    ) -> Tuple[
+        List[Tuple[Tuple[int, ...], str]],
+        Dict[Tuple[int, ...], List[Tuple[Tuple[int, ...], str]]],
+    ]:
+        """
+        Collapse pending cells with identical (left, right, lens_id) triples.
+
+        Returns:
+            Tuple of (cells to compute, representative idx -> duplicate
+            (idx, cache_key) pairs that reuse its result)
+        """
+        representatives: Dict[Tuple[str, str, str], Tuple[int, ...]] = {}
+        unique = []
+        duplicates: Dict[Tuple[int, ...], List[Tuple[Tuple[int, ...], str]]] = {}
+        for idx, cache_key in pending:
+            triple = (
+                self._get_operand_value(left_source, idx, "left"),
+                self._get_operand_value(right_source, idx, "right"),
+                lens_table.lens_id(idx),
+            )
+            representative = representatives.get(triple)
+            if representative is None:
+                representatives[triple] = idx
+                unique.append((idx, cache_key))
+            else:
+                duplicates.setdefault(representative, []).append((idx, cache_key))
+        return unique, duplicates
+
+    def _group_pending_cells(
+        self, pending: List[Tuple[Tuple[int, ...], str]], lens_table: _LensTable
+    ) -> List[List[Tuple[Tuple[int, ...], str]]]:
+        """
+        Split pending (idx, cache_key) pairs into LLM call groups.
+
+        Without batching every cell is its own group. With batching, cells are
+        bucketed by lens (so one lens text serves the whole call) and each bucket
+        is chunked into groups of at most batch_size.
+        """
+        if self.batch_size <= 1:
+            return [[cell] for cell in pending]
+
+        by_lens: Dict[str, List[Tuple[Tuple[int, ...], str]]] = {}
+        for idx, cache_key in pending:
+            lens_id = lens_table.lens_id(idx)
+            by_lens.setdefault(lens_id, []).append((idx, cache_key))
+
+        groups = []
+        for bucket in by_lens.values():
+            for start in range(0, len(bucket), self.batch_size):
+                groups.append(bucket[start : start + self.batch_size])
+        return groups
+
+    def _compute_and_store_cells(
+        self,
+        tensor_name: str,
+        group: List[Tuple[Tuple[int, ...], str]],
+        left_source: Any,
+        right_source: Any,
+        lens_table: _LensTable,
+    ) -> Dict[Tuple[int, ...], Dict[str, Any]]:
+        """Compute a group of cells and persist them to the cache and resume traces."""
+        if len(group) == 1:
+            idx, cache_key = group[0]
+            computed = {
+                idx: self._compute_tensor_cell(
+                    tensor_name, idx, left_source, right_source, lens_table, cache_key
+                )
+            }
+        else:
+            computed = self._compute_tensor_cells_batch(
+                tensor_name, group, left_source, right_source, lens_table
+            )
+
+        for idx, cache_key in group:
+            self._persist_cell(tensor_name, idx, cache_key, computed[idx])
+
+        return computed
+
+    def _persist_cell(
+        self, tensor_name: str, idx: Tuple[int, ...], cache_key: str, cell_value: Dict[str, Any]
+    ):
+        """Persist a computed cell, via the background writer when one is running."""
+        if self._writer:
+            self._writer.submit(tensor_name, idx, cache_key, cell_value)
+        else:
+            self._store_cell(tensor_name, idx, cache_key, cell_value)
+
+    def _store_cell(
+        self, tensor_name: str, idx: Tuple[int, ...], cache_key: str, cell_value: Dict[str, Any]
+    ):
+        """Persist a computed cell to the cache and resume traces."""
+        # Save to cache
+        self.cache.put(cache_key, cell_value)
+
+        # Save to resume traces
+        if self.resumable_runner:
+            self.resumable_runner.save_cell_result(tensor_name, idx, cell_value)
+
+    def _compute_tensor_cells_batch(
+        self,
+        tensor_name: str,
+        batch: List[Tuple[Tuple[int, ...], str]],
+        left_source: Any,
+        right_source: Any,
+        lens_table: _LensTable,
+    ) -> Dict[Tuple[int, ...], Dict[str, Any]]:
+        """
+        Compute several cells that share a lens in a single LLM call.
+
+        The snapshot and lens text are sent once for the whole batch. Any cell
+        the response does not cover (or an unparseable response) falls back to
+        the single-cell path.
+
+        Args:
+            tensor_name: Name of tensor being computed
+            batch: (idx, cache_key) pairs sharing one lens
+            left_source: Left operand data
+            right_source: Right operand data
+            lens_table: Lens lookup for this tensor
+
+        Returns:
+            Mapping of cell index to cell computation result
+        """
+        lens_id, lens_text = lens_table.lens(batch[0][0])
+        operands = {
+            idx: (
+                self._get_operand_value(left_source, idx, "left"),
+                self._get_operand_value(right_source, idx, "right"),
+            )
+            for idx, _ in batch
+        }
+
+        cell_lines = []
+        for n, (idx, _) in enumerate(batch, 1):
+            left_value, right_value = operands[idx]
+            cell_lines.append(
+                f"{n}. Cell {tensor_name}{list(idx)}\n"
+                f"   Left operand: {left_value}\n"
+                f"   Right operand: {right_value}"
+            )
+        user_message = (
+            f"Compute the following {len(batch)} cells of tensor {tensor_name} "
+            "using semantic cross product.\n\n"
+            + "\n\n".join(cell_lines)
+            + f"""
+
+For each cell, apply the semantic cross product operation to create a
+hierarchical semantic relationship between its operands.
+
+{lens_text}
+
+Consider how the left operand provides context that transforms or
+extends the meaning of the right operand in this hierarchical structure.
+
+Return JSON only: {{"tensor":"{tensor_name}","cells":[{{"index":[...],"value":"..."}}, ...]}} with exactly one entry per cell above."""
+        )
+
+        response = call_responses(
+            instructions=self.snapshot,
+            input=user_message,
+            response_format=self._get_batch_response_format(tensor_name, len(batch)),
         )
+        metadata = response.get("raw", {}).get("metadata", {})
+
+        # Track budget once for the whole batch
+        if self.budget_tracker:
+            self.budget_tracker.record_usage(metadata, self.model)
+
+        values = {}
+        try:
+            parsed = jsonio.loads(response.get("output_text", ""))
+            entries = parsed.get("cells", []) if isinstance(parsed, dict) else []
+        except ValueError:
+            entries = []
+        if not isinstance(entries, list):
+            entries = []
+        # Keep only entries for requested cells carrying a non-empty string
+        # value; anything else is recomputed on the single-cell path
+        for entry in entries:
+            if not (_is_cell_result(entry)[0] and entry["value"]):
+                continue
+            index = entry.get("index")
+            if not isinstance(index, list):
+                continue
+            try:
+                idx = tuple(index)
+                if idx in operands:
+                    values[idx] = entry["value"]
+            except TypeError:
+                # Unhashable index components (nested lists/dicts)
+                continue
+
+        # Trace if configured
+        if self.tracer:
+            self.tracer.trace_stage(
+                stage=f"tensor_cell_{tensor_name}",
+                context={
+                    "tensor": tensor_name,
+                    "indices": [idx for idx, _ in batch],
+                    "lens_id": lens_id,
+                },
+                result={"cells": entries},
+                metadata=metadata,
+            )
+
+        cell_metadata = {**metadata, "batch_size": len(batch)}
+        computed = {}
+        for idx, cache_key in batch:
+            if idx not in values:
+                computed[idx] = self._compute_tensor_cell(
+                    tensor_name, idx, left_source, right_source, lens_table, cache_key
+                )
+                continue
+            left_value, right_value = operands[idx]
+            computed[idx] = {
+                "index": idx,
+                "value": values[idx],
+                "left_operand": left_value,
+                "right_operand": right_value,
+                "lens_text": lens_text,
+                "metadata": cell_metadata,
+            }
+        return computed
 
     def _compute_tensor_cell(
         self,
@@ -370,7 +895,7 @@ class TensorEngine:
         idx: Tuple[int, ...],
         left_source: Any,
         right_source: Any,
-        matrix_for_lens: Dict[str, Any],
+        lens_table: _LensTable,
         cache_key: str,
     ) -> Dict[str, Any]:
         """
@@ -381,7 +906,7 @@ class TensorEngine:
             idx: Cell index tuple
             left_source: Left operand data
             right_source: Right operand data
-            matrix_for_lens: Matrix to derive lens from
+            lens_table: Lens lookup for this tensor
 
         Returns:
             Cell computation result
@@ -393,15 +918,11 @@ class TensorEngine:
         left_value = self._get_operand_value(left_source, idx, "left")
         right_value = self._get_operand_value(right_source, idx, "right")
 
-        # Get lens text
-        lens_text = self._get_lens_text(matrix_for_lens, idx)
-
-        # Build user message
-        user_message = self._build_cell_prompt(tensor_name, idx, left_value, right_value, lens_text)
+        # Get lens (id is reused for tracing)
+        lens_id, lens_text = lens_table.lens(idx)
 
-        # Add JSON contract
-        json_contract = self._get_cell_contract(tensor_name)
-        full_message = f"{user_message}\n\n{json_contract}"
+        # Build user message (JSON contract included)
+        full_message = self._build_cell_prompt(tensor_name, idx, left_value, right_value, lens_text)
 
         # Parse response with repair if needed
         def adapter_call(instructions=None, input=None):
@@ -409,45 +930,40 @@ class TensorEngine:
             if not instructions or not input:
                 raise ValueError("Must provide instructions and input for Responses API")
             
-            # P0-3: Use strict JSON schema for tensor cell responses
-            response_format = {
-                "type": "json_schema",
-                "json_schema": {
-                    "name": f"{tensor_name}_cell_response",
-                    "description": f"Response schema for {tensor_name} tensor cell computation",
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "result": {"type": "string", "description": "Computed cell value"},
-                            "reasoning": {"type": "string", "description": "Optional reasoning for the computation"},
-                            "hierarchical_path": {"type": "string", "description": "Cell location in tensor structure"}
-                        },
-                        "required": ["result"],
-                        "additionalProperties": False
-                    },
-                    "strict": True
-                }
-            }
-            
             response = call_responses(
                 instructions=instructions,
                 input=input,
-                response_format=response_format
+                response_format=self._get_cell_response_format(tensor_name)
             )
             # Convert to expected format for repair mechanism
             return {"content": response.get("output_text", "")}, response.get("raw", {}).get("metadata", {})
 
-        # Create schema hint
-        schema_hint = create_tensor_cell_schema_hint(tensor_name)
-
-        # Use Responses API format - no messages array
-        result, metadata = try_parse_json_or_repair(
-            instructions=system_message,
-            input_text=full_message,
-            adapter_call=adapter_call,
-            schema_hint=schema_hint,
-            max_repair_attempts=self.max_repair,
-        )
+        response, metadata = adapter_call(instructions=system_message, input=full_message)
+
+        # Strict-schema output is normally clean JSON: parse it directly and only
+        # enter the repair loop (replaying this response as its first attempt)
+        # when it is not a usable cell object
+        try:
+            result = jsonio.loads(response["content"])
+        except ValueError:
+            result = None
+        if not _is_cell_result(result)[0]:
+            first_attempt = [(response, metadata)]
+
+            def replaying_adapter_call(instructions=None, input=None):
+                if first_attempt:
+                    return first_attempt.pop()
+                return adapter_call(instructions=instructions, input=input)
+
+            # Use Responses API format - no messages array
+            result, metadata = try_parse_json_or_repair(
+                instructions=system_message,
+                input_text=full_message,
+                adapter_call=replaying_adapter_call,
+                schema_hint=self._get_schema_hint(tensor_name),
+                max_repair_attempts=self.max_repair,
+                validate=_is_cell_result,
+            )
 
         # Track budget (single source of truth)
         if self.budget_tracker:
@@ -460,7 +976,7 @@ class TensorEngine:
                 context={
                     "tensor": tensor_name,
                     "index": idx,
-                    "lens_id": self._compute_lens_id(matrix_for_lens, idx),
+                    "lens_id": lens_id,
                 },
                 result=result,
                 metadata=metadata,
@@ -475,6 +991,78 @@ class TensorEngine:
             "metadata": metadata,
         }
 
+    def _get_cell_response_format(self, tensor_name: str) -> Dict[str, Any]:
+        """Strict response schema for single-cell calls, built once per tensor."""
+        response_format = self._response_formats.get(tensor_name)
+        if response_format is None:
+            # P0-3: Use strict JSON schema for tensor cell responses
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": f"{tensor_name}_cell_response",
+                    "description": f"Response schema for {tensor_name} tensor cell computation",
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "tensor": {"type": "string", "description": "Tensor name"},
+                            "value": {"type": "string", "description": "Computed cell value"},
+                            "confidence": {"type": "number", "description": "Confidence in 0.0-1.0"}
+                        },
+                        "required": ["tensor", "value", "confidence"],
+                        "additionalProperties": False
+                    },
+                    "strict": True
+                }
+            }
+            self._response_formats[tensor_name] = response_format
+        return response_format
+
+    def _get_batch_response_format(self, tensor_name: str, size: int) -> Dict[str, Any]:
+        """Strict response schema for a batch of `size` cells, built once per shape."""
+        key = (tensor_name, size)
+        response_format = self._batch_response_formats.get(key)
+        if response_format is None:
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": f"{tensor_name}_cell_batch_response",
+                    "description": f"Response schema for a batch of {tensor_name} tensor cells",
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "cells": {
+                                "type": "array",
+                                "minItems": size,
+                                "maxItems": size,
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "index": {"type": "array", "items": {"type": "integer"}},
+                                        "value": {"type": "string"},
+                                    },
+                                    "required": ["index", "value"],
+                                    "additionalProperties": False,
+                                },
+                            }
+                        },
+                        "required": ["cells"],
+                        "additionalProperties": False,
+                    },
+                    "strict": True,
+                },
+            }
+            self._batch_response_formats[key] = response_format
+        return response_format
+
+    def _get_schema_hint(self, tensor_name: str) -> str:
+        """Repair schema hint for a tensor's cells, built once per tensor."""
+        schema_hint = self._schema_hints.get(tensor_name)
+        if schema_hint is None:
+            schema_hint = self._schema_hints[tensor_name] = create_tensor_cell_schema_hint(
+                tensor_name
+            )
+        return schema_hint
+
     def _get_snapshot_hash(self) -> str:
         """Get stable snapshot hash from Phase 1 output, fallback to content hash."""
         # Try to get from Phase 1 metadata
@@ -484,7 +1072,7 @@ class TensorEngine:
                 return meta["snapshot_hash"]
 
         # Fallback to hashing the snapshot content (less stable)
-        return hashlib.sha256(self.snapshot.encode()).hexdigest()
+        return content_digest(self.snapshot)
 
     def _get_kernel_hash(self) -> str:
         """Get kernel hash from Phase 1 output."""
@@ -500,37 +1088,62 @@ class TensorEngine:
 
         # Sort keys for deterministic hash
         catalog_str = json.dumps(self.lens_catalog, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(catalog_str.encode()).hexdigest()
+        return content_digest(catalog_str)
 
     def _get_operand_value(self, source: Any, idx: Tuple[int, ...], side: str) -> str:
         """Extract operand value from source at index."""
+        entry = self._operand_accessors.get((id(source), side))
+        if entry is None or entry[0] is not source:
+            # Keep a reference to the source so its id() cannot be reused
+            entry = (source, self._build_operand_accessor(source, side))
+            self._operand_accessors[(id(source), side)] = entry
+        return entry[1](idx)
+
+    def _build_operand_accessor(
+        self, source: Any, side: str
+    ) -> Callable[[Tuple[int, ...]], Any]:
+        """
+        Build an index -> operand value function for one source and side.
+
+        Matrix elements are copied once into tuples of tuples so per-cell
+        extraction is plain indexing, with no dict lookups.
+        """
         if side == "left":
             # For left operand, use appropriate indices
             if isinstance(source, list):
                 # Array source
-                return source[idx[0]]
+                values = tuple(source)
+                return lambda idx: values[idx[0]]
             elif isinstance(source, dict):
                 # Matrix or tensor source
                 if "elements" in source:
                     # Matrix
-                    row_idx = idx[0] if len(idx) > 0 else 0
-                    col_idx = idx[1] if len(idx) > 1 else 0
-                    return source["elements"][row_idx][col_idx]
+                    elements = tuple(map(tuple, source["elements"]))
+                    return lambda idx: elements[idx[0] if len(idx) > 0 else 0][
+                        idx[1] if len(idx) > 1 else 0
+                    ]
                 elif "cells" in source:
                     # Tensor
-                    return source["cells"][idx[: len(source["dims"])]]
+                    cells = source["cells"]
+                    n_dims = len(source["dims"])
+                    return lambda idx: cells[idx[:n_dims]]
 
         elif side == "right":
             # For right operand, use remaining indices
             if isinstance(source, dict):
                 if "elements" in source:
                     # Matrix - use last indices
-                    n_left_dims = len(idx) - 2  # Assuming matrix is 2D
-                    row_idx = idx[n_left_dims] if n_left_dims < len(idx) else 0
-                    col_idx = idx[n_left_dims + 1] if n_left_dims + 1 < len(idx) else 0
-                    return source["elements"][row_idx][col_idx]
+                    elements = tuple(map(tuple, source["elements"]))
+
+                    def right_value(idx: Tuple[int, ...]) -> Any:
+                        n_left_dims = len(idx) - 2  # Assuming matrix is 2D
+                        row_idx = idx[n_left_dims] if n_left_dims < len(idx) else 0
+                        col_idx = idx[n_left_dims + 1] if n_left_dims + 1 < len(idx) else 0
+                        return elements[row_idx][col_idx]
 
-        return "undefined"
+                    return right_value
+
+        return lambda idx: "undefined"
 
     def _get_lens_text(self, matrix: Dict[str, Any], idx: Tuple[int, ...]) -> str:
         """
@@ -573,7 +1186,12 @@ class TensorEngine:
         )
 
     def _compute_lens_id(self, matrix: Dict[str, Any], idx: Tuple[int, ...]) -> str:
-        """Compute lens ID for caching."""
+        """
+        Compute lens ID for caching.
+
+        Stays SHA-256: ids must match those written to lens catalogs by
+        `chirality lenses build`.
+        """
         rows = matrix.get("rows", [])
         cols = matrix.get("cols", [])
         station = matrix.get("station", "")
@@ -602,24 +1220,11 @@ class TensorEngine:
         right_value: str,
         lens_text: str,
     ) -> str:
-        """Build prompt for cell computation."""
-        return f"""
-Compute tensor cell {tensor_name}{list(idx)} using semantic cross product.
-
-Left operand: {left_value}
-Right operand: {right_value}
-
-Apply the semantic cross product operation to create a hierarchical
-semantic relationship between these operands.
-
-{lens_text}
-
-Consider how the left operand provides context that transforms or
-extends the meaning of the right operand in this hierarchical structure.
-"""
-
-    def _get_cell_contract(self, tensor_name: str) -> str:
-        """Get JSON contract for cell response."""
-        return (
-            f"""Return JSON only: {{"tensor":"{tensor_name}","value":"...","confidence":0.0-1.0}}"""
-        )
+        """Build prompt for cell computation, including its JSON contract."""
+        return _CELL_PROMPT_TEMPLATE % {
+            "tensor": tensor_name,
+            "index": list(idx),
+            "left": left_value,
+            "right": right_value,
+            "lens": lens_text,
+        }
@@ -5,11 +5,55 @@ Provides token, cost, and time guards to prevent runaway expenses
 during Phase 1 and Phase 2 operations.
 """
 
+import threading
 import time
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Callable, Optional, Dict, Any, Iterable, Tuple
 from dataclasses import dataclass
 from pathlib import Path
-from .pricing import get_model_pricing, calculate_cost
+from .pricing import get_model_pricing_copy, get_model_rates, calculate_cost
+from ..lib import jsonio
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+_UNLIMITED = float("inf")
+_NO_DEADLINE_NS = (1 << 63) - 1
+
+
+def _no_utilization(used: float) -> None:
+    return None
+
+
+def _utilization(budget: Optional[float]) -> Callable[[float], Optional[float]]:
+    """Build the used/budget ratio for a budget, or a None-returning stub if unset."""
+    if not budget:
+        return _no_utilization
+    return lambda used: used / budget
+
+
+@lru_cache(maxsize=8)
+def _get_encoder(model: str):
+    """Load the BPE encoder for a model once per process."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Models newer than the installed tiktoken share the o200k vocabulary
+        return tiktoken.get_encoding("o200k_base")
+
+
+def estimate_tokens(text: str, model: str) -> int:
+    """
+    Count the tokens in text for a model.
+
+    Uses tiktoken when installed; otherwise falls back to the usual
+    four-characters-per-token approximation.
+    """
+    if tiktoken is None:
+        return max(1, len(text) // 4) if text else 0
+    return len(_get_encoder(model).encode(text))
 
 
 @dataclass
@@ -25,16 +69,30 @@ class BudgetConfig:
 
     def __post_init__(self):
         if self.model_pricing is None:
-            self.model_pricing = get_model_pricing()
+            self.model_pricing = get_model_pricing_copy()
 
 
 class BudgetTracker:
     """
     Tracks and enforces budgets during LLM operations.
 
-    Thread-safe for concurrent operations within a single process.
+    Thread-safe for concurrent operations within a single process: usage is
+    accumulated per thread without locking and merged when read.
     """
 
+    @classmethod
+    def for_config(cls, config: BudgetConfig, phase: str = "unknown") -> "BudgetTracker":
+        """
+        Create the tracker suited to a budget configuration.
+
+        With no limits configured there is nothing to enforce, so the
+        accumulate-only NullBudgetTracker (same counters and status shape)
+        is returned instead.
+        """
+        if not (config.token_budget or config.cost_budget or config.time_budget):
+            return NullBudgetTracker(config, phase)
+        return cls(config, phase)
+
     def __init__(self, config: BudgetConfig, phase: str = "unknown"):
         """
         Initialize budget tracker.
@@ -46,15 +104,102 @@ class BudgetTracker:
         self.config = config
         self.phase = phase
 
-        # Counters
-        self.token_count = 0
-        self.input_tokens = 0
-        self.output_tokens = 0
-        self.cost_spent = 0.0
+        # Wall-clock start for reference; elapsed time is measured on the
+        # monotonic clock so clock adjustments cannot trip the time budget
         self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
+
+        # Limits snapshotted once; an unset budget is an infinite limit
+        self._token_limit = config.token_budget or _UNLIMITED
+        self._cost_limit = config.cost_budget or _UNLIMITED
+        self._enforce_usage = bool(config.token_budget or config.cost_budget)
+        self._deadline_ns = (
+            self._start_ns + int(config.time_budget * 1_000_000_000)
+            if config.time_budget
+            else _NO_DEADLINE_NS
+        )
+
+        # Utilization formulas for get_status, resolved once: a missing
+        # budget reports None without re-checking the config on every call
+        self._token_utilization = _utilization(config.token_budget)
+        self._cost_utilization = _utilization(config.cost_budget)
+        self._time_utilization = _utilization(config.time_budget)
 
-        # Operation counter for provenance
-        self.operation_count = 0
+        # model -> (input, cached_input, output) per-token rates
+        self._rate_cache: Dict[str, Tuple[float, float, float]] = {}
+
+        # Per-thread tallies [tokens, input, output, cost, operations]. Each
+        # worker only ever writes its own list, so recording takes no lock;
+        # the totals below are summed across threads when read.
+        self._local = threading.local()
+        self._tallies = []
+        self._register_lock = threading.Lock()
+
+    # Copy/pickle support: the per-thread tallies are merged into one carried
+    # over total, and the thread-local, lock and utilization closures rebuilt
+    _RUNTIME_STATE = (
+        "_local",
+        "_tallies",
+        "_register_lock",
+        "_token_utilization",
+        "_cost_utilization",
+        "_time_utilization",
+    )
+
+    def __getstate__(self):
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in self._RUNTIME_STATE
+        }
+        state["_totals"] = [self._total(field) for field in range(5)]
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        totals = state.pop("_totals")
+        self.__dict__.update(state)
+        self._token_utilization = _utilization(self.config.token_budget)
+        self._cost_utilization = _utilization(self.config.cost_budget)
+        self._time_utilization = _utilization(self.config.time_budget)
+        self._local = threading.local()
+        self._tallies = [totals]
+        self._register_lock = threading.Lock()
+
+    def _tally(self) -> list:
+        """Return the calling thread's tally, registering it on first use."""
+        try:
+            return self._local.tally
+        except AttributeError:
+            tally = [0, 0, 0, 0.0, 0]
+            self._local.tally = tally
+            with self._register_lock:
+                self._tallies.append(tally)
+            return tally
+
+    def _total(self, field: int):
+        return sum(tally[field] for tally in list(self._tallies))
+
+    @property
+    def token_count(self) -> int:
+        return self._total(0)
+
+    @property
+    def input_tokens(self) -> int:
+        return self._total(1)
+
+    @property
+    def output_tokens(self) -> int:
+        return self._total(2)
+
+    @property
+    def cost_spent(self) -> float:
+        return self._total(3)
+
+    @property
+    def operation_count(self) -> int:
+        """Operation counter for provenance."""
+        return self._total(4)
 
     def record_usage(self, metadata: Dict[str, Any], model: str = "gpt-4"):
         """
@@ -73,82 +218,198 @@ class BudgetTracker:
         completion_tokens = metadata.get("completion_tokens", 0)
         cached_tokens = metadata.get("cached_tokens", 0)  # New cached input tokens
 
-        # Update counters
-        self.token_count += total_tokens
-        self.input_tokens += prompt_tokens
-        self.output_tokens += completion_tokens
-        self.operation_count += 1
+        # Calculate cost from the model's cached rates (same formula as calculate_cost)
+        rates = self._rate_cache.get(model)
+        if rates is None:
+            rates = self._rates(model)
+        input_rate, cached_rate, output_rate = rates
+        cost = (
+            (prompt_tokens - cached_tokens) * input_rate
+            + cached_tokens * cached_rate
+            + completion_tokens * output_rate
+        )
+
+        # Update this thread's counters
+        tally = self._tally()
+        tally[0] += total_tokens
+        tally[1] += prompt_tokens
+        tally[2] += completion_tokens
+        tally[3] += cost
+        tally[4] += 1
+
+        # Check budgets against the merged totals
+        self._check_budgets()
+
+    def _rates(self, model: str) -> Tuple[float, float, float]:
+        """Per-token rates for a model, resolved from the pricing table once."""
+        rates = self._rate_cache.get(model)
+        if rates is None:
+            rates = self._rate_cache[model] = get_model_rates(model)
+        return rates
+
+    def record_usage_batch(self, items: Iterable[Dict[str, Any]], model: str = "gpt-4"):
+        """
+        Record usage from many LLM calls and check budgets once.
+
+        Counters are summed in one pass and priced together, which assumes
+        linear per-token pricing (true for every model in pricing.py). Budgets
+        are enforced at the end of the batch, not between its items.
+
+        Args:
+            items: LLM response metadata dicts with token counts
+            model: Model identifier for cost calculation
+
+        Raises:
+            RuntimeError: If any budget is exceeded
+        """
+        total_tokens = prompt_tokens = completion_tokens = cached_tokens = count = 0
+        for metadata in items:
+            total_tokens += metadata.get("total_tokens", 0)
+            prompt_tokens += metadata.get("prompt_tokens", 0)
+            completion_tokens += metadata.get("completion_tokens", 0)
+            cached_tokens += metadata.get("cached_tokens", 0)
+            count += 1
+
+        if not count:
+            return
 
-        # Calculate cost using centralized pricing
         cost = calculate_cost(model, prompt_tokens, completion_tokens, cached_tokens)
-        self.cost_spent += cost
 
-        # Check budgets
+        tally = self._tally()
+        tally[0] += total_tokens
+        tally[1] += prompt_tokens
+        tally[2] += completion_tokens
+        tally[3] += cost
+        tally[4] += count
+
         self._check_budgets()
 
-    def _check_budgets(self):
-        """Check all budget limits and raise if exceeded."""
+    def estimate_and_reserve(
+        self, prompt_text: str, model: str = "gpt-4", expected_output_tokens: int = 0
+    ) -> int:
+        """
+        Pre-flight check for a prompt before it is sent.
 
-        # Token budget
-        if self.config.token_budget and self.token_count > self.config.token_budget:
+        Projects the tokens and cost of the call onto the current totals and
+        raises if that would exceed a budget, so an oversized prompt is
+        rejected before it is paid for. Nothing is recorded; record_usage
+        reconciles the actual usage after the call.
+
+        Args:
+            prompt_text: Full prompt text to be sent
+            model: Model identifier for tokenization and cost calculation
+            expected_output_tokens: Anticipated completion length
+
+        Returns:
+            Estimated prompt token count
+
+        Raises:
+            RuntimeError: If the projected usage would exceed a budget
+        """
+        prompt_tokens = estimate_tokens(prompt_text, model)
+        projected_tokens = self.token_count + prompt_tokens + expected_output_tokens
+
+        if self.config.token_budget and projected_tokens > self.config.token_budget:
             raise RuntimeError(
-                f"Token budget exceeded in {self.phase}: "
-                f"{self.token_count:,} > {self.config.token_budget:,}. "
-                f"Completed {self.operation_count} operations. "
+                f"Token budget would be exceeded in {self.phase}: "
+                f"{projected_tokens:,} > {self.config.token_budget:,} "
+                f"(prompt ~{prompt_tokens:,} tokens). "
                 "Increase --token-budget or reduce scope."
             )
 
-        # Cost budget
-        if self.config.cost_budget and self.cost_spent > self.config.cost_budget:
-            raise RuntimeError(
-                f"Cost budget exceeded in {self.phase}: "
-                f"${self.cost_spent:.4f} > ${self.config.cost_budget:.4f}. "
-                f"Used {self.token_count:,} tokens in {self.operation_count} operations. "
-                "Increase --cost-budget or reduce scope."
+        if self.config.cost_budget:
+            projected_cost = self.cost_spent + calculate_cost(
+                model, prompt_tokens, expected_output_tokens, 0
             )
-
-        # Time budget
-        if self.config.time_budget:
-            elapsed = time.time() - self.start_time
-            if elapsed > self.config.time_budget:
+            if projected_cost > self.config.cost_budget:
                 raise RuntimeError(
-                    f"Time budget exceeded in {self.phase}: "
-                    f"{elapsed:.1f}s > {self.config.time_budget}s. "
-                    f"Completed {self.operation_count} operations using {self.token_count:,} tokens. "
-                    "Increase --time-budget or reduce scope."
+                    f"Cost budget would be exceeded in {self.phase}: "
+                    f"${projected_cost:.4f} > ${self.config.cost_budget:.4f} "
+                    f"(prompt ~{prompt_tokens:,} tokens). "
+                    "Increase --cost-budget or reduce scope."
                 )
 
+        return prompt_tokens
+
+    def _check_budgets(self):
+        """Check all budget limits and raise if exceeded."""
+        # Tokens and cost are merged in one pass, only when a limit needs them
+        if self._enforce_usage:
+            token_count = 0
+            cost_spent = 0.0
+            for tally in self._tallies:
+                token_count += tally[0]
+                cost_spent += tally[3]
+            if token_count > self._token_limit:
+                self._raise_token_budget()
+            if cost_spent > self._cost_limit:
+                self._raise_cost_budget()
+        if time.monotonic_ns() > self._deadline_ns:
+            self._raise_time_budget()
+
+    # Cold paths: message formatting only happens once a budget is blown
+
+    def _raise_token_budget(self):
+        raise RuntimeError(
+            f"Token budget exceeded in {self.phase}: "
+            f"{self.token_count:,} > {self.config.token_budget:,}. "
+            f"Completed {self.operation_count} operations. "
+            "Increase --token-budget or reduce scope."
+        )
+
+    def _raise_cost_budget(self):
+        raise RuntimeError(
+            f"Cost budget exceeded in {self.phase}: "
+            f"${self.cost_spent:.4f} > ${self.config.cost_budget:.4f}. "
+            f"Used {self.token_count:,} tokens in {self.operation_count} operations. "
+            "Increase --cost-budget or reduce scope."
+        )
+
+    def _raise_time_budget(self):
+        elapsed = self._elapsed()
+        raise RuntimeError(
+            f"Time budget exceeded in {self.phase}: "
+            f"{elapsed:.1f}s > {self.config.time_budget}s. "
+            f"Completed {self.operation_count} operations using {self.token_count:,} tokens. "
+            "Increase --time-budget or reduce scope."
+        )
+
+    def _elapsed(self) -> float:
+        """Seconds since the tracker started, from the monotonic clock."""
+        return (time.monotonic_ns() - self._start_ns) / 1e9
+
+    def _totals(self) -> list:
+        """Merge the per-thread tallies in a single pass."""
+        totals = [0, 0, 0, 0.0, 0]
+        for tally in list(self._tallies):
+            for field, value in enumerate(tally):
+                totals[field] += value
+        return totals
+
     def get_status(self) -> Dict[str, Any]:
         """Get current budget status for logging."""
-        elapsed = time.time() - self.start_time
+        elapsed = self._elapsed()
+        token_count, input_tokens, output_tokens, cost_spent, operation_count = self._totals()
 
         return {
             "phase": self.phase,
-            "operations": self.operation_count,
+            "operations": operation_count,
             "tokens": {
-                "total": self.token_count,
-                "input": self.input_tokens,
-                "output": self.output_tokens,
+                "total": token_count,
+                "input": input_tokens,
+                "output": output_tokens,
                 "budget": self.config.token_budget,
-                "utilization": (
-                    self.token_count / self.config.token_budget
-                    if self.config.token_budget
-                    else None
-                ),
+                "utilization": self._token_utilization(token_count),
             },
             "cost": {
-                "spent": self.cost_spent,
+                "spent": cost_spent,
                 "budget": self.config.cost_budget,
-                "utilization": (
-                    self.cost_spent / self.config.cost_budget if self.config.cost_budget else None
-                ),
+                "utilization": self._cost_utilization(cost_spent),
             },
             "time": {
                 "elapsed": elapsed,
                 "budget": self.config.time_budget,
-                "utilization": (
-                    elapsed / self.config.time_budget if self.config.time_budget else None
-                ),
+                "utilization": self._time_utilization(elapsed),
             },
         }
 
@@ -156,8 +417,17 @@ class BudgetTracker:
         """Save budget status to output directory."""
         status_file = Path(output_dir) / "budget_status.json"
         status_file.parent.mkdir(parents=True, exist_ok=True)
+        status_file.write_bytes(jsonio.dumps_pretty(self.get_status()))
 
-        import json
 
-        with open(status_file, "w") as f:
-            json.dump(self.get_status(), f, indent=2)
+class NullBudgetTracker(BudgetTracker):
+    """
+    BudgetTracker for runs with no token, cost or time budget.
+
+    Usage is still accumulated for status and logs; the budget check is a
+    no-op. BudgetTracker.for_config() returns this class when config sets
+    no limits.
+    """
+
+    def _check_budgets(self):
+        pass
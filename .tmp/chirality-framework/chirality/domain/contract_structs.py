@@ -0,0 +1,150 @@
+"""
+msgspec mirrors of the Phase-2 contracts for internal hot paths.
+
+The pydantic models in contracts.py stay the external-facing schema. These
+Structs carry the same fields for bulk tensor generation and JSON
+round-trips, where validation and serialization run in msgspec's C core,
+and convert to the pydantic models at API boundaries. As with any msgspec
+Struct, fields are validated by decode()/from_model(), not by __init__.
+
+Requires msgspec (pip install chirality-framework[fast]).
+"""
+
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+try:
+    import msgspec
+except ImportError as e:
+    raise ImportError(
+        "msgspec package required for contract structs. "
+        "Install with: pip install chirality-framework[fast]"
+    ) from e
+
+from pydantic import BaseModel
+
+from .contracts import (
+    ComponentType,
+    Phase2Contract,
+    SolutionStatement,
+    StationType,
+    TensorM,
+    TensorN,
+    TensorType,
+    TensorU,
+    TensorW,
+)
+
+
+class TensorMStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Methods tensor (mirrors contracts.TensorM)."""
+
+    tensor_type: TensorType = TensorType.M
+    dimensions: Tuple[int, int]
+    components: Tuple[ComponentType, ...]
+    stations: Tuple[StationType, ...]
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class TensorWStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Workflows tensor (mirrors contracts.TensorW)."""
+
+    tensor_type: TensorType = TensorType.W
+    dimensions: Tuple[int, int]
+    workflow_stages: Tuple[str, ...]
+    dependencies: Dict[str, List[str]] = msgspec.field(default_factory=dict)
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class TensorUStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Utilities tensor (mirrors contracts.TensorU)."""
+
+    tensor_type: TensorType = TensorType.U
+    dimensions: Tuple[int, int]
+    utility_functions: Tuple[str, ...]
+    parameters: Dict[str, Any] = msgspec.field(default_factory=dict)
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class TensorNStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Networks tensor (mirrors contracts.TensorN)."""
+
+    tensor_type: TensorType = TensorType.N
+    dimensions: Tuple[int, int]
+    network_nodes: Tuple[str, ...]
+    connections: Tuple[Tuple[str, str], ...]
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class SolutionStatementStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Final solution statement (mirrors contracts.SolutionStatement)."""
+
+    problem_id: str
+    solution_text: str
+    confidence: Annotated[float, msgspec.Meta(ge=0.0, le=1.0)]
+    supporting_tensors: List[TensorType]
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class Phase2ContractStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Complete Phase-2 contract (mirrors contracts.Phase2Contract)."""
+
+    tensor_m: Optional[TensorMStruct] = None
+    tensor_w: Optional[TensorWStruct] = None
+    tensor_u: Optional[TensorUStruct] = None
+    tensor_n: Optional[TensorNStruct] = None
+    solution: Optional[SolutionStatementStruct] = None
+    generation_metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+# Struct type -> pydantic model at the API boundary
+_MODELS: Dict[type, Type[BaseModel]] = {
+    TensorMStruct: TensorM,
+    TensorWStruct: TensorW,
+    TensorUStruct: TensorU,
+    TensorNStruct: TensorN,
+    SolutionStatementStruct: SolutionStatement,
+    Phase2ContractStruct: Phase2Contract,
+}
+_STRUCTS: Dict[Type[BaseModel], type] = {model: struct for struct, model in _MODELS.items()}
+
+_ENCODER = msgspec.json.Encoder()
+_DECODERS: Dict[type, "msgspec.json.Decoder"] = {}
+
+S = TypeVar("S", bound=msgspec.Struct)
+
+
+def encode(struct: msgspec.Struct) -> bytes:
+    """Serialize a contract struct to JSON bytes."""
+    return _ENCODER.encode(struct)
+
+
+def decode(data: bytes, struct_type: Type[S]) -> S:
+    """Parse and validate JSON into a contract struct (decoder compiled once per type)."""
+    decoder = _DECODERS.get(struct_type)
+    if decoder is None:
+        decoder = _DECODERS.setdefault(struct_type, msgspec.json.Decoder(struct_type))
+    return decoder.decode(data)
+
+
+def to_model(struct: msgspec.Struct) -> BaseModel:
+    """Convert a contract struct to its pydantic model."""
+    return _MODELS[type(struct)].model_validate(msgspec.to_builtins(struct))
+
+
+def from_model(model: BaseModel) -> msgspec.Struct:
+    """Convert a pydantic contract model to its struct."""
+    return msgspec.convert(model.model_dump(mode="json"), _STRUCTS[type(model)])
+
+
+__all__ = [
+    "TensorMStruct",
+    "TensorWStruct",
+    "TensorUStruct",
+    "TensorNStruct",
+    "SolutionStatementStruct",
+    "Phase2ContractStruct",
+    "encode",
+    "decode",
+    "to_model",
+    "from_model",
+]
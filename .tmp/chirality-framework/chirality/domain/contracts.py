@@ -5,11 +5,18 @@ Defines stable JSON schemas for tensor operations (M, W, U, N, Solution).
 These contracts must remain stable for Phase-2 branch-wise generation.
 """
 
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Dict, Any, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
+# (rows, cols); a fixed-length tuple so validation needs no list coercion
+Dimensions = Annotated[
+    Tuple[int, int],
+    Field(..., min_length=2, max_length=2, description="Tensor dimensions (rows, cols)"),
+]
+
+
 class TensorType(str, Enum):
     """Tensor types for Phase-2 operations."""
 
@@ -43,19 +50,23 @@ class StationType(str, Enum):
 class TensorM(BaseModel):
     """Methods tensor schema for Phase-2."""
 
+    model_config = ConfigDict(frozen=True)
+
     tensor_type: TensorType = TensorType.M
-    dimensions: tuple[int, int] = Field(..., description="Tensor dimensions (rows, cols)")
-    components: List[ComponentType] = Field(..., description="Component sequence")
-    stations: List[StationType] = Field(..., description="Station sequence")
+    dimensions: Dimensions
+    components: Tuple[ComponentType, ...] = Field(..., description="Component sequence")
+    stations: Tuple[StationType, ...] = Field(..., description="Station sequence")
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class TensorW(BaseModel):
     """Workflows tensor schema for Phase-2."""
 
+    model_config = ConfigDict(frozen=True)
+
     tensor_type: TensorType = TensorType.W
-    dimensions: tuple[int, int] = Field(..., description="Tensor dimensions (rows, cols)")
-    workflow_stages: List[str] = Field(..., description="Workflow stage names")
+    dimensions: Dimensions
+    workflow_stages: Tuple[str, ...] = Field(..., description="Workflow stage names")
     dependencies: Dict[str, List[str]] = Field(default_factory=dict)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
@@ -63,9 +74,11 @@ class TensorW(BaseModel):
 class TensorU(BaseModel):
     """Utilities tensor schema for Phase-2."""
 
+    model_config = ConfigDict(frozen=True)
+
     tensor_type: TensorType = TensorType.U
-    dimensions: tuple[int, int] = Field(..., description="Tensor dimensions (rows, cols)")
-    utility_functions: List[str] = Field(..., description="Utility function names")
+    dimensions: Dimensions
+    utility_functions: Tuple[str, ...] = Field(..., description="Utility function names")
     parameters: Dict[str, Any] = Field(default_factory=dict)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
@@ -73,10 +86,12 @@ class TensorU(BaseModel):
 class TensorN(BaseModel):
     """Networks tensor schema for Phase-2."""
 
+    model_config = ConfigDict(frozen=True)
+
     tensor_type: TensorType = TensorType.N
-    dimensions: tuple[int, int] = Field(..., description="Tensor dimensions (rows, cols)")
-    network_nodes: List[str] = Field(..., description="Network node identifiers")
-    connections: List[tuple[str, str]] = Field(..., description="Node connections")
+    dimensions: Dimensions
+    network_nodes: Tuple[str, ...] = Field(..., description="Network node identifiers")
+    connections: Tuple[Tuple[str, str], ...] = Field(..., description="Node connections")
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -93,6 +108,8 @@ class SolutionStatement(BaseModel):
 class Phase2Contract(BaseModel):
     """Complete Phase-2 contract schema."""
 
+    model_config = ConfigDict(frozen=True)
+
     tensor_m: Optional[TensorM] = None
     tensor_w: Optional[TensorW] = None
     tensor_u: Optional[TensorU] = None
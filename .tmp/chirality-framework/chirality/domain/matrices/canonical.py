@@ -9,199 +9,198 @@ unchanging inputs that produce predictable outputs through deterministic
 semantic operations.
 """
 
+import sys
+from functools import lru_cache, partial
+from typing import Optional
+
 from ..types import Matrix, Cell
 
+# One provenance dict shared by every canonical cell (treat as read-only); a
+# plain dict so cells stay copyable, picklable and JSON-serializable
+_CANONICAL_PROVENANCE = {"source": sys.intern("canonical_matrix")}
+
 
 def _create_cell(row: int, col: int, value: str) -> Cell:
     """Helper to create a cell with minimal provenance."""
-    return Cell(row=row, col=col, value=value, provenance={"source": "canonical_matrix"})
+    return Cell(row=row, col=col, value=sys.intern(value), provenance=_CANONICAL_PROVENANCE)
 
 
-def _create_matrix_cells(content: list[list[str]]) -> list[list[Cell]]:
-    """Convert 2D string array to 2D Cell array."""
-    return [
-        [_create_cell(row, col, content[row][col]) for col in range(len(content[row]))]
+def _create_matrix_cells(content: list[list[str]]) -> tuple[tuple[Cell, ...], ...]:
+    """Convert 2D string array to a frozen 2D Cell grid."""
+    return tuple(
+        tuple(_create_cell(row, col, content[row][col]) for col in range(len(content[row])))
         for row in range(len(content))
-    ]
-
-
-# Fixed canonical Matrix A (3x4)
-MATRIX_A = Matrix(
-    name="A",
-    station="Problem Statement",
-    row_labels=["normative", "operative", "iterative"],
-    col_labels=["guiding", "applying", "judging", "reflecting"],
-    cells=_create_matrix_cells(
-        [
-            ["objectives", "actions", "benchmarks", "feedback"],
-            ["standards", "methods", "criteria", "adaptation"],
-            ["developments", "coordination", "evaluation", "refinement"],
-        ]
-    ),
-)
+    )
+
+
+@lru_cache(maxsize=None)
+def _empty_cells(rows: int, cols: int) -> tuple[tuple[Cell, ...], ...]:
+    """Empty-valued cell grid; matrices of the same shape share one grid."""
+    return _create_matrix_cells([[""] * cols for _ in range(rows)])
+
+
+def _empty_matrix(name: str, station: Optional[str], row_labels: list[str], col_labels: list[str]) -> Matrix:
+    """Canonical matrix whose cells are computed by the pipeline (values start empty)."""
+    return Matrix(
+        name=name,
+        station=station,
+        row_labels=row_labels,
+        col_labels=col_labels,
+        cells=_empty_cells(len(row_labels), len(col_labels)),
+    )
+
+
+def _build_A() -> Matrix:
+    """Fixed canonical Matrix A (3x4)."""
+    return Matrix(
+        name="A",
+        station="Problem Statement",
+        row_labels=["normative", "operative", "iterative"],
+        col_labels=["guiding", "applying", "judging", "reflecting"],
+        cells=_create_matrix_cells(
+            [
+                ["objectives", "actions", "benchmarks", "feedback"],
+                ["standards", "methods", "criteria", "adaptation"],
+                ["developments", "coordination", "evaluation", "refinement"],
+            ]
+        ),
+    )
+
+
+def _build_B() -> Matrix:
+    """Fixed canonical Matrix B (4x4)."""
+    return Matrix(
+        name="B",
+        station="Problem Statement",
+        row_labels=["data", "information", "knowledge", "wisdom"],
+        col_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
+        cells=_create_matrix_cells(
+            [
+                ["necessary", "sufficient", "complete", "consistent"],
+                ["contingent", "actionable", "contextual", "congruent"],
+                ["purposeful", "effective", "comprehensive", "coherent"],
+                ["constitutive", "optimal", "holistic", "principled"],
+            ]
+        ),
+    )
+
+
+def _build_J() -> Matrix:
+    """
+    Fixed canonical Matrix J (3x4) - Truncated B without "wisdom" row.
 
-# Fixed canonical Matrix B (4x4)
-MATRIX_B = Matrix(
-    name="B",
-    station="Problem Statement",
-    row_labels=["data", "information", "knowledge", "wisdom"],
-    col_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
-    cells=_create_matrix_cells(
-        [
-            ["necessary", "sufficient", "complete", "consistent"],
-            ["contingent", "actionable", "contextual", "congruent"],
-            ["purposeful", "effective", "comprehensive", "coherent"],
-            ["constitutive", "optimal", "holistic", "principled"],
-        ]
+    A view over B: the rows are the very same Cell objects, not copies.
+    """
+    matrix_b = _matrix("B")
+    return Matrix(
+        name="J",
+        station=None,
+        row_labels=matrix_b.row_labels[:3],  # No "wisdom" row
+        col_labels=matrix_b.col_labels,
+        cells=matrix_b.cells[:3],
+    )
+
+
+# Matrices computed by the pipeline (cells start empty):
+# name -> (station, row_labels, col_labels)
+_EMPTY_MATRIX_SPECS = {
+    # C (3x4) - Problem Statement - computed from A · B
+    "C": (
+        "problem statement",
+        ["normative", "operative", "iterative"],
+        ["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
     ),
-)
-
-# Fixed canonical Matrix J (3x4) - Truncated B without "wisdom" row
-MATRIX_J = Matrix(
-    name="J",
-    station=None,
-    row_labels=["data", "information", "knowledge"],  # No "wisdom" row
-    col_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
-    cells=_create_matrix_cells(
-        [
-            ["necessary", "sufficient", "complete", "consistent"],
-            ["contingent", "actionable", "contextual", "congruent"],
-            ["purposeful", "effective", "comprehensive", "coherent"],
-        ]
+    # F (3x4) - Requirements - computed from C ⊙ J
+    "F": (
+        "requirements",
+        ["data", "information", "knowledge"],
+        ["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
     ),
-)
+    # D (3x4) - Objectives - computed from A + F
+    "D": (
+        "objectives",
+        ["normative", "operative", "iterative"],
+        ["guiding", "applying", "judging", "reflecting"],
+    ),
+    # K (4x3) - Transpose of D
+    "K": (
+        None,
+        ["guiding", "applying", "judging", "reflecting"],
+        ["normative", "operative", "iterative"],
+    ),
+    # X (4x4) - Verification - computed from K · J
+    "X": (
+        "verification",
+        ["guiding", "applying", "judging", "reflecting"],
+        ["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
+    ),
+    # Z (4x4) - Validation - computed from X with station shift
+    "Z": (
+        "validation",
+        ["guiding", "applying", "judging", "reflecting"],
+        ["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
+    ),
+    # G (3x4) - First 3 rows of Z, Z[0:3, :]
+    "G": (
+        None,
+        ["guiding", "applying", "judging"],
+        ["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
+    ),
+    # P (1x4) - Fourth row of Z, Z[3, :]
+    "P": (
+        None,
+        ["reflecting"],
+        ["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
+    ),
+    # T (4x3) - Transpose of J
+    "T": (
+        None,
+        ["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
+        ["data", "information", "knowledge"],
+    ),
+    # E (3x3) - Evaluation - computed from G · T
+    "E": (
+        "evaluation",
+        ["guiding", "applying", "judging"],
+        ["data", "information", "knowledge"],
+    ),
+}
 
-# Matrix C (3x4) - Problem Statement
-MATRIX_C = Matrix(
-    name="C",
-    station="problem statement",
-    row_labels=["normative", "operative", "iterative"],
-    col_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
-    cells=_create_matrix_cells([
-        ["", "", "", ""],  # Empty cells - computed from A · B
-        ["", "", "", ""],
-        ["", "", "", ""],
-    ]),
+_BUILDERS = {"A": _build_A, "B": _build_B, "J": _build_J}
+_BUILDERS.update(
+    {name: partial(_empty_matrix, name, *spec) for name, spec in _EMPTY_MATRIX_SPECS.items()}
 )
 
-# Matrix F (3x4) - Requirements
-MATRIX_F = Matrix(
-    name="F",
-    station="requirements",
-    row_labels=["data", "information", "knowledge"],
-    col_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
-    cells=_create_matrix_cells([
-        ["", "", "", ""],  # Empty cells - computed from C ⊙ J
-        ["", "", "", ""],
-        ["", "", "", ""],
-    ]),
-)
+# Matrices are built on first access (MATRIX_X attribute or get_canonical_matrix)
+_CANONICAL_MATRICES: dict[str, Matrix] = {}
 
-# Matrix D (3x4) - Objectives
-MATRIX_D = Matrix(
-    name="D",
-    station="objectives",
-    row_labels=["normative", "operative", "iterative"],
-    col_labels=["guiding", "applying", "judging", "reflecting"],
-    cells=_create_matrix_cells([
-        ["", "", "", ""],  # Empty cells - computed from A + F
-        ["", "", "", ""],
-        ["", "", "", ""],
-    ]),
-)
+__all__ = [
+    "MATRIX_A", "MATRIX_B", "MATRIX_J",
+    "MATRIX_C", "MATRIX_F", "MATRIX_D",
+    "MATRIX_K", "MATRIX_X", "MATRIX_Z",
+    "MATRIX_G", "MATRIX_P", "MATRIX_T", "MATRIX_E",
+    "get_canonical_matrix", "get_matrix_info", "validate_canonical_matrices",
+]
 
-# Matrix K (4x3) - Transpose of D
-MATRIX_K = Matrix(
-    name="K",
-    station=None,
-    row_labels=["guiding", "applying", "judging", "reflecting"],
-    col_labels=["normative", "operative", "iterative"],
-    cells=_create_matrix_cells([
-        ["", "", ""],  # Empty cells - transpose(D)
-        ["", "", ""],
-        ["", "", ""],
-        ["", "", ""],
-    ]),
-)
 
-# Matrix X (4x4) - Verification
-MATRIX_X = Matrix(
-    name="X",
-    station="verification",
-    row_labels=["guiding", "applying", "judging", "reflecting"],
-    col_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
-    cells=_create_matrix_cells([
-        ["", "", "", ""],  # Empty cells - computed from K · J
-        ["", "", "", ""],
-        ["", "", "", ""],
-        ["", "", "", ""],
-    ]),
-)
+def _matrix(name: str) -> Matrix:
+    """Return the canonical matrix, building it on first use."""
+    matrix = _CANONICAL_MATRICES.get(name)
+    if matrix is None:
+        matrix = _CANONICAL_MATRICES.setdefault(name, _BUILDERS[name]())
+    return matrix
 
-# Matrix Z (4x4) - Validation
-MATRIX_Z = Matrix(
-    name="Z",
-    station="validation",
-    row_labels=["guiding", "applying", "judging", "reflecting"],
-    col_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
-    cells=_create_matrix_cells([
-        ["", "", "", ""],  # Empty cells - computed from X with station shift
-        ["", "", "", ""],
-        ["", "", "", ""],
-        ["", "", "", ""],
-    ]),
-)
 
-# Matrix G (3x4) - First 3 rows of Z
-MATRIX_G = Matrix(
-    name="G",
-    station=None,
-    row_labels=["guiding", "applying", "judging"],
-    col_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
-    cells=_create_matrix_cells([
-        ["", "", "", ""],  # Empty cells - Z[0:3, :]
-        ["", "", "", ""],
-        ["", "", "", ""],
-    ]),
-)
+def __getattr__(name: str):
+    """Resolve MATRIX_<name> lazily (PEP 562)."""
+    if name.startswith("MATRIX_") and name[7:] in _BUILDERS:
+        return _matrix(name[7:])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Matrix P (1x4) - Fourth row of Z
-MATRIX_P = Matrix(
-    name="P",
-    station=None,
-    row_labels=["reflecting"],
-    col_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
-    cells=_create_matrix_cells([
-        ["", "", "", ""],  # Empty cells - Z[3, :]
-    ]),
-)
 
-# Matrix T (4x3) - Transpose of J
-MATRIX_T = Matrix(
-    name="T",
-    station=None,
-    row_labels=["necessity (vs contingency)", "sufficiency", "completeness", "consistency"],
-    col_labels=["data", "information", "knowledge"],
-    cells=_create_matrix_cells([
-        ["", "", ""],  # Empty cells - transpose(J)
-        ["", "", ""],
-        ["", "", ""],
-        ["", "", ""],
-    ]),
-)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Matrix E (3x3) - Evaluation
-MATRIX_E = Matrix(
-    name="E",
-    station="evaluation",
-    row_labels=["guiding", "applying", "judging"],
-    col_labels=["data", "information", "knowledge"],
-    cells=_create_matrix_cells([
-        ["", "", ""],  # Empty cells - computed from G · T
-        ["", "", ""],
-        ["", "", ""],
-    ]),
-)
 
 def get_canonical_matrix(name: str) -> Matrix:
     """
@@ -216,18 +215,11 @@ def get_canonical_matrix(name: str) -> Matrix:
     Raises:
         ValueError: If matrix name is not recognized
     """
-    matrices = {
-        "A": MATRIX_A, "B": MATRIX_B, "J": MATRIX_J,
-        "C": MATRIX_C, "F": MATRIX_F, "D": MATRIX_D,
-        "K": MATRIX_K, "X": MATRIX_X, "Z": MATRIX_Z, 
-        "G": MATRIX_G, "P": MATRIX_P, "T": MATRIX_T, "E": MATRIX_E
-    }
-
-    if name not in matrices:
-        available = ", ".join(sorted(matrices.keys()))
+    if name not in _BUILDERS:
+        available = ", ".join(sorted(_BUILDERS.keys()))
         raise ValueError(f"Unknown canonical matrix: {name}. Available: {available}")
 
-    return matrices[name]
+    return _matrix(name)
 
 
 def get_matrix_info(name: str) -> dict:
@@ -258,6 +250,16 @@ def validate_canonical_matrices() -> None:
 
     This is a sanity check to ensure the fixed matrices are properly defined.
     """
+    # Module globals bypass __getattr__, so build every matrix explicitly
+    (
+        MATRIX_A, MATRIX_B, MATRIX_J, MATRIX_C, MATRIX_F, MATRIX_D, MATRIX_K,
+        MATRIX_X, MATRIX_Z, MATRIX_G, MATRIX_P, MATRIX_T, MATRIX_E,
+    ) = (_matrix(name) for name in "ABJCFDKXZGPTE")
+
+    # Labels are interned, so equal labels are the same object across matrices
+    assert MATRIX_A.row_labels[0] is sys.intern("normative"), "Matrix A labels should be interned"
+    assert MATRIX_X.col_labels[0] is MATRIX_B.col_labels[0], "Shared labels should be one object"
+
     # Validate Matrix A (3x4)
     assert MATRIX_A.shape == (3, 4), f"Matrix A should be 3x4, got {MATRIX_A.shape}"
     assert len(MATRIX_A.row_labels) == 3, "Matrix A should have 3 row labels"
@@ -273,12 +275,9 @@ def validate_canonical_matrices() -> None:
     assert len(MATRIX_J.row_labels) == 3, "Matrix J should have 3 row labels"
     assert len(MATRIX_J.col_labels) == 4, "Matrix J should have 4 column labels"
 
-    # Ensure J is properly truncated B (first 3 rows)
+    # Ensure J is properly truncated B (first 3 rows, shared not copied)
     for i in range(3):
-        for j in range(4):
-            assert (
-                MATRIX_B.cells[i][j].value == MATRIX_J.cells[i][j].value
-            ), f"Matrix J cell [{i}][{j}] should match Matrix B"
+        assert MATRIX_J.cells[i] is MATRIX_B.cells[i], f"Matrix J row {i} should be Matrix B row {i}"
 
     # Validate Matrix C (3x4) - Problem Statement
     assert MATRIX_C.shape == (3, 4), f"Matrix C should be 3x4, got {MATRIX_C.shape}"
@@ -325,16 +324,6 @@ if __name__ == "__main__":
     # Run validation if script is executed directly
     validate_canonical_matrices()
     print("✓ All canonical matrices validated successfully")
-    print(f"✓ Matrix A: {MATRIX_A.shape} - {MATRIX_A.station}")
-    print(f"✓ Matrix B: {MATRIX_B.shape} - {MATRIX_B.station}")
-    print(f"✓ Matrix J: {MATRIX_J.shape} - {MATRIX_J.station}")
-    print(f"✓ Matrix C: {MATRIX_C.shape} - {MATRIX_C.station}")
-    print(f"✓ Matrix F: {MATRIX_F.shape} - {MATRIX_F.station}")
-    print(f"✓ Matrix D: {MATRIX_D.shape} - {MATRIX_D.station}")
-    print(f"✓ Matrix K: {MATRIX_K.shape} - {MATRIX_K.station}")
-    print(f"✓ Matrix X: {MATRIX_X.shape} - {MATRIX_X.station}")
-    print(f"✓ Matrix Z: {MATRIX_Z.shape} - {MATRIX_Z.station}")
-    print(f"✓ Matrix G: {MATRIX_G.shape} - {MATRIX_G.station}")
-    print(f"✓ Matrix P: {MATRIX_P.shape} - {MATRIX_P.station}")
-    print(f"✓ Matrix T: {MATRIX_T.shape} - {MATRIX_T.station}")
-    print(f"✓ Matrix E: {MATRIX_E.shape} - {MATRIX_E.station}")
+    for matrix_name in "ABJCFDKXZGPTE":
+        matrix = _matrix(matrix_name)
+        print(f"✓ Matrix {matrix_name}: {matrix.shape} - {matrix.station}")
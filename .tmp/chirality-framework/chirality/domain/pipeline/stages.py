@@ -5,65 +5,119 @@ Defines the canonical stages without any implementation details.
 Pure business logic that describes WHAT happens at each stage.
 """
 
-from typing import Dict, List, Any, Optional
-from enum import Enum
+from typing import Dict, List, Any, Optional, Tuple
+from enum import IntEnum
 from dataclasses import dataclass
 
 from ..semantics.operations import SemanticOperationType
 
 
-class PipelineStage(Enum):
-    """The three canonical stages of the Chirality Framework pipeline."""
+class PipelineStage(IntEnum):
+    """
+    The three canonical stages of the Chirality Framework pipeline.
+
+    Values are execution-order indexes, so a stage indexes its definition
+    directly; the string identifier used in logs and provenance keys is
+    available as ``stage.label``.
+    """
+
+    STAGE_1_CONSTRUCT = 0
+    STAGE_2_SEMANTIC = 1
+    STAGE_3_COMBINED_LENSED = 2
+
+    @property
+    def label(self) -> str:
+        """String identifier of the stage (e.g. "stage_1_construct")."""
+        return _STAGE_LABELS[self]
 
-    STAGE_1_CONSTRUCT = "stage_1_construct"
-    STAGE_2_SEMANTIC = "stage_2_semantic"
-    STAGE_3_COMBINED_LENSED = "stage_3_combined_lensed"
+    # IntEnum's str()/format() changed in Python 3.11 (name vs. number);
+    # render the label on every version instead
+    def __str__(self) -> str:
+        return _STAGE_LABELS[self]
 
+    def __format__(self, format_spec: str) -> str:
+        return format(_STAGE_LABELS[self], format_spec)
 
-@dataclass
+
+_STAGE_LABELS: Tuple[str, ...] = (
+    "stage_1_construct",
+    "stage_2_semantic",
+    "stage_3_combined_lensed",
+)
+
+
+@dataclass(frozen=True)
 class StageDefinition:
-    """Defines what happens at a pipeline stage."""
+    """Defines what happens at a pipeline stage (immutable)."""
+
+    # Declared by hand: dataclass(slots=True) needs Python 3.10+
+    __slots__ = (
+        "stage",
+        "description",
+        "is_llm_required",
+        "operation_type",
+        "expected_inputs",
+        "expected_outputs",
+        # Not a dataclass field: required inputs as a set, derived in
+        # __post_init__, so validation is a single subset test
+        "required_inputs",
+    )
 
     stage: PipelineStage
     description: str
     is_llm_required: bool
     operation_type: Optional[SemanticOperationType]
-    expected_inputs: List[str]
-    expected_outputs: List[str]
+    expected_inputs: Tuple[str, ...]
+    expected_outputs: Tuple[str, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "required_inputs", frozenset(self.expected_inputs))
+
+    # Copy/pickle support, as dataclass(slots=True) generates it: frozen
+    # instances must be restored through object.__setattr__
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
 
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
-# Domain rules for each stage
-STAGE_DEFINITIONS = {
-    PipelineStage.STAGE_1_CONSTRUCT: StageDefinition(
+
+# Domain rules for each stage, indexed by PipelineStage
+_STAGE_DEFS: Tuple[StageDefinition, ...] = (
+    StageDefinition(
         stage=PipelineStage.STAGE_1_CONSTRUCT,
         description="Mechanical generation of k-products or direct pairs",
         is_llm_required=False,
         operation_type=None,  # Mechanical only
-        expected_inputs=["source_matrices", "row_index", "col_index"],
-        expected_outputs=["texts", "metadata", "terms_used", "warnings"],
+        expected_inputs=("source_matrices", "row_index", "col_index"),
+        expected_outputs=("texts", "metadata", "terms_used", "warnings"),
     ),
-    PipelineStage.STAGE_2_SEMANTIC: StageDefinition(
+    StageDefinition(
         stage=PipelineStage.STAGE_2_SEMANTIC,
         description="LLM resolves concepts via operation-specific strategies",
         is_llm_required=True,
         operation_type=None,  # Varies by matrix type
-        expected_inputs=["stage_1_output", "component_id"],
-        expected_outputs=["text", "metadata", "terms_used", "warnings"],
+        expected_inputs=("stage_1_output", "component_id"),
+        expected_outputs=("text", "metadata", "terms_used", "warnings"),
     ),
-    PipelineStage.STAGE_3_COMBINED_LENSED: StageDefinition(
+    StageDefinition(
         stage=PipelineStage.STAGE_3_COMBINED_LENSED,
         description="Single unified semantic operation combining row × column × station perspectives",
         is_llm_required=True,
         operation_type=SemanticOperationType.LENSING,
-        expected_inputs=["stage_2_output", "row_label", "col_label", "station_context"],
-        expected_outputs=["text", "metadata", "terms_used", "warnings"],
+        expected_inputs=("stage_2_output", "row_label", "col_label", "station_context"),
+        expected_outputs=("text", "metadata", "terms_used", "warnings"),
     ),
-}
+)
+
+# Mapping view kept for callers that look definitions up by stage
+STAGE_DEFINITIONS = {definition.stage: definition for definition in _STAGE_DEFS}
 
 
 def get_stage_definition(stage: PipelineStage) -> StageDefinition:
     """Get the domain definition for a pipeline stage."""
-    return STAGE_DEFINITIONS[stage]
+    return _STAGE_DEFS[stage]
 
 
 def validate_stage_inputs(stage: PipelineStage, inputs: Dict[str, Any]) -> List[str]:
@@ -78,17 +132,35 @@ def validate_stage_inputs(stage: PipelineStage, inputs: Dict[str, Any]) -> List[
         List of validation errors (empty if valid)
     """
     definition = get_stage_definition(stage)
-    errors = []
 
-    # Check required inputs are present
-    for required_input in definition.expected_inputs:
-        if required_input not in inputs:
-            errors.append(f"Missing required input '{required_input}' for {stage.value}")
+    # Fast path: every required input is present
+    if definition.required_inputs <= inputs.keys():
+        return []
+
+    # Report the missing inputs in declaration order
+    return [
+        f"Missing required input '{required_input}' for {stage.label}"
+        for required_input in definition.expected_inputs
+        if required_input not in inputs
+    ]
+
+
+# All matrices follow the 3-stage pipeline
+# (except Z which has special handling in Stage 3)
+_DEFAULT_STAGES: Tuple[PipelineStage, ...] = (
+    PipelineStage.STAGE_1_CONSTRUCT,
+    PipelineStage.STAGE_2_SEMANTIC,
+    PipelineStage.STAGE_3_COMBINED_LENSED,
+)
+
+# Domain rule: Only D uses mechanical addition in Stage 2
+_MECHANICAL_MATRICES = frozenset({"D"})
 
-    return errors
+# Domain rule: Only Z uses station shift instead of combined lensing
+_SPECIAL_LENSING_MATRICES = frozenset({"Z"})
 
 
-def get_matrix_pipeline_stages(component_id: str) -> List[PipelineStage]:
+def get_matrix_pipeline_stages(component_id: str) -> Tuple[PipelineStage, ...]:
     """
     Get the pipeline stages for a matrix component according to domain rules.
 
@@ -96,24 +168,16 @@ def get_matrix_pipeline_stages(component_id: str) -> List[PipelineStage]:
         component_id: Matrix component ('C', 'D', 'F', 'X', 'Z', 'E')
 
     Returns:
-        List of stages in execution order
+        Stages in execution order (a shared, immutable tuple)
     """
-    # All matrices follow the 3-stage pipeline
-    # (except Z which has special handling in Stage 3)
-    return [
-        PipelineStage.STAGE_1_CONSTRUCT,
-        PipelineStage.STAGE_2_SEMANTIC,
-        PipelineStage.STAGE_3_COMBINED_LENSED,
-    ]
+    return _DEFAULT_STAGES
 
 
 def is_mechanical_matrix(component_id: str) -> bool:
     """Check if a matrix uses mechanical operations (no LLM in Stage 2)."""
-    # Domain rule: Only D uses mechanical addition in Stage 2
-    return component_id == "D"
+    return component_id in _MECHANICAL_MATRICES
 
 
 def uses_special_lensing(component_id: str) -> bool:
     """Check if a matrix uses special lensing instead of combined lensing."""
-    # Domain rule: Only Z uses station shift instead of combined lensing
-    return component_id == "Z"
+    return component_id in _SPECIAL_LENSING_MATRICES
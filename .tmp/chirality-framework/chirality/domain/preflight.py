@@ -8,7 +8,9 @@ matrices are compatible for the intended operation type:
 - preflight_addition: Addition (+) requires identical shapes but labels can differ
 """
 
-from typing import Dict, List, Any
+import sys
+from functools import lru_cache
+from typing import Dict, List, Any, Sequence, Tuple
 
 
 class PreflightError(ValueError):
@@ -16,6 +18,10 @@ class PreflightError(ValueError):
     pass
 
 
+# Fields every matrix structure must carry
+_REQUIRED_FIELDS = ("name",)
+
+
 def validate_matrix_structure(matrix: Dict[str, Any], expected_name: str) -> None:
     """
     Validate basic matrix structure has required fields.
@@ -27,17 +33,7 @@ def validate_matrix_structure(matrix: Dict[str, Any], expected_name: str) -> Non
     Raises:
         PreflightError: If matrix structure is invalid
     """
-    required_fields = ["name"]
-    for field in required_fields:
-        if field not in matrix:
-            raise PreflightError(f"Matrix {expected_name} missing required field: {field}")
-    
-    # Must have either rows/cols or elements structure
-    has_labels = "rows" in matrix and "cols" in matrix
-    has_elements = "elements" in matrix
-    
-    if not has_labels and not has_elements:
-        raise PreflightError(f"Matrix {expected_name} must have either rows/cols or elements structure")
+    _validate_and_extract(matrix, expected_name)
 
 
 def extract_matrix_info(matrix: Dict[str, Any]) -> Dict[str, Any]:
@@ -45,6 +41,8 @@ def extract_matrix_info(matrix: Dict[str, Any]) -> Dict[str, Any]:
     Extract row and column information from matrix structure.
     
     Handles both direct rows/cols labels and inferred from elements.
+    Labels are interned, so comparisons against other interned labels
+    (e.g. the canonical matrices) resolve by identity.
     
     Args:
         matrix: Matrix data structure
@@ -52,26 +50,61 @@ def extract_matrix_info(matrix: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict with 'rows', 'cols', 'row_count', 'col_count'
     """
-    if "rows" in matrix and "cols" in matrix:
-        rows = matrix["rows"]
-        cols = matrix["cols"]
-    elif "elements" in matrix:
-        elements = matrix["elements"]
-        if not elements or not elements[0]:
-            raise PreflightError(f"Matrix {matrix.get('name', 'unknown')} has empty elements")
-        rows = [f"row_{i}" for i in range(len(elements))]
-        cols = [f"col_{j}" for j in range(len(elements[0]))]
-    else:
-        raise PreflightError(f"Matrix {matrix.get('name', 'unknown')} missing row/col information")
+    rows, cols = _get_rows_cols(matrix)
     
     return {
-        "rows": rows,
-        "cols": cols, 
+        "rows": [sys.intern(row) for row in rows],
+        "cols": [sys.intern(col) for col in cols], 
         "row_count": len(rows),
         "col_count": len(cols)
     }
 
 
+@lru_cache(maxsize=64)
+def _synthetic_labels(prefix: str, count: int) -> Tuple[str, ...]:
+    """Placeholder labels (row_0, row_1, ...) for matrices given only as elements."""
+    return tuple(sys.intern(f"{prefix}_{i}") for i in range(count))
+
+
+def _element_labels(matrix: Dict[str, Any]) -> Tuple[Sequence[str], Sequence[str]]:
+    """Placeholder (rows, cols) labels sized from a matrix's elements."""
+    elements = matrix["elements"]
+    if not elements or not elements[0]:
+        raise PreflightError(f"Matrix {matrix.get('name', 'unknown')} has empty elements")
+    return _synthetic_labels("row", len(elements)), _synthetic_labels("col", len(elements[0]))
+
+
+def _get_rows_cols(matrix: Dict[str, Any]) -> Tuple[Sequence[str], Sequence[str]]:
+    """Return a matrix's (rows, cols) labels, synthesizing them from elements if needed."""
+    if "rows" in matrix and "cols" in matrix:
+        return matrix["rows"], matrix["cols"]
+    elif "elements" in matrix:
+        return _element_labels(matrix)
+    else:
+        raise PreflightError(f"Matrix {matrix.get('name', 'unknown')} missing row/col information")
+
+
+def _validate_and_extract(
+    matrix: Dict[str, Any], expected_name: str
+) -> Tuple[Sequence[str], Sequence[str]]:
+    """Validate matrix structure and return its (rows, cols) labels in one pass."""
+    for field in _REQUIRED_FIELDS:
+        if field not in matrix:
+            raise PreflightError(f"Matrix {expected_name} missing required field: {field}")
+
+    # Must have either rows/cols or elements structure
+    if "rows" in matrix and "cols" in matrix:
+        return matrix["rows"], matrix["cols"]
+    if "elements" in matrix:
+        return _element_labels(matrix)
+    raise PreflightError(f"Matrix {expected_name} must have either rows/cols or elements structure")
+
+
+def _labels_differ(labels_a: Sequence[str], labels_b: Sequence[str]) -> bool:
+    """Compare equal-length label sequences, stopping at the first mismatch."""
+    return labels_a is not labels_b and any(a != b for a, b in zip(labels_a, labels_b))
+
+
 def preflight_hadamard(matrix_a: Dict[str, Any], matrix_b: Dict[str, Any]) -> None:
     """
     Validates strict label+shape equality for element-wise operations.
@@ -88,43 +121,39 @@ def preflight_hadamard(matrix_a: Dict[str, Any], matrix_b: Dict[str, Any]) -> No
     Raises:
         PreflightError: If matrices are not compatible for element-wise operation
     """
-    # Validate basic structure
-    validate_matrix_structure(matrix_a, matrix_a.get("name", "A"))
-    validate_matrix_structure(matrix_b, matrix_b.get("name", "B"))
-    
-    # Extract matrix information
-    info_a = extract_matrix_info(matrix_a)
-    info_b = extract_matrix_info(matrix_b)
+    # Validate basic structure and extract matrix information
+    rows_a, cols_a = _validate_and_extract(matrix_a, matrix_a.get("name", "A"))
+    rows_b, cols_b = _validate_and_extract(matrix_b, matrix_b.get("name", "B"))
     
     # Check dimensions
-    if info_a["row_count"] != info_b["row_count"]:
+    if len(rows_a) != len(rows_b):
         raise PreflightError(
             f"Element-wise operation requires equal row count: "
-            f"{matrix_a['name']} has {info_a['row_count']}, "
-            f"{matrix_b['name']} has {info_b['row_count']}"
+            f"{matrix_a['name']} has {len(rows_a)}, "
+            f"{matrix_b['name']} has {len(rows_b)}"
         )
     
-    if info_a["col_count"] != info_b["col_count"]:
+    if len(cols_a) != len(cols_b):
         raise PreflightError(
             f"Element-wise operation requires equal column count: "
-            f"{matrix_a['name']} has {info_a['col_count']}, "
-            f"{matrix_b['name']} has {info_b['col_count']}"
+            f"{matrix_a['name']} has {len(cols_a)}, "
+            f"{matrix_b['name']} has {len(cols_b)}"
         )
     
     # Check row labels match exactly
-    if info_a["rows"] != info_b["rows"]:
+    if _labels_differ(rows_a, rows_b):
         raise PreflightError(
             f"Element-wise operation requires identical row labels: "
-            f"{matrix_a['name']} has {info_a['rows']}, "
-            f"{matrix_b['name']} has {info_b['rows']}"
+            f"{matrix_a['name']} has {list(rows_a)}, "
+            f"{matrix_b['name']} has {list(rows_b)}"
         )
     
     # Check column labels match exactly  
-    if info_a["cols"] != info_b["cols"]:
+    if _labels_differ(cols_a, cols_b):
         raise PreflightError(
             f"Element-wise operation requires identical column labels: "
-            f"{matrix_a['name']} has {info_a['cols']}, "
-            f"{matrix_b['name']} has {info_b['cols']}"
+            f"{matrix_a['name']} has {list(cols_a)}, "
+            f"{matrix_b['name']} has {list(cols_b)}"
         )
 
 
@@ -143,20 +172,16 @@ def preflight_dot(left_matrix: Dict[str, Any], right_matrix: Dict[str, Any]) ->
     Raises:
         PreflightError: If matrices are not conformable for multiplication
     """
-    # Validate basic structure
-    validate_matrix_structure(left_matrix, left_matrix.get("name", "Left"))
-    validate_matrix_structure(right_matrix, right_matrix.get("name", "Right"))
-    
-    # Extract matrix information
-    left_info = extract_matrix_info(left_matrix)
-    right_info = extract_matrix_info(right_matrix)
+    # Validate basic structure and extract matrix information
+    _, left_cols = _validate_and_extract(left_matrix, left_matrix.get("name", "Left"))
+    right_rows, _ = _validate_and_extract(right_matrix, right_matrix.get("name", "Right"))
     
     # Check conformable dimensions
-    if left_info["col_count"] != right_info["row_count"]:
+    if len(left_cols) != len(right_rows):
         raise PreflightError(
             f"Matrix multiplication requires conformable dimensions: "
-            f"{left_matrix['name']} has {left_info['col_count']} columns, "
-            f"{right_matrix['name']} has {right_info['row_count']} rows"
+            f"{left_matrix['name']} has {len(left_cols)} columns, "
+            f"{right_matrix['name']} has {len(right_rows)} rows"
         )
 
 
@@ -175,25 +200,21 @@ def preflight_addition(matrix_a: Dict[str, Any], matrix_b: Dict[str, Any]) -> No
     Raises:
         PreflightError: If matrices have incompatible shapes for addition
     """
-    # Validate basic structure
-    validate_matrix_structure(matrix_a, matrix_a.get("name", "A"))
-    validate_matrix_structure(matrix_b, matrix_b.get("name", "B"))
-    
-    # Extract matrix information
-    info_a = extract_matrix_info(matrix_a)
-    info_b = extract_matrix_info(matrix_b)
+    # Validate basic structure and extract matrix information
+    rows_a, cols_a = _validate_and_extract(matrix_a, matrix_a.get("name", "A"))
+    rows_b, cols_b = _validate_and_extract(matrix_b, matrix_b.get("name", "B"))
     
     # Check dimensions (labels can differ for addition)
-    if info_a["row_count"] != info_b["row_count"]:
+    if len(rows_a) != len(rows_b):
         raise PreflightError(
             f"Matrix addition requires equal row count: "
-            f"{matrix_a['name']} has {info_a['row_count']}, "
-            f"{matrix_b['name']} has {info_b['row_count']}"
+            f"{matrix_a['name']} has {len(rows_a)}, "
+            f"{matrix_b['name']} has {len(rows_b)}"
         )
     
-    if info_a["col_count"] != info_b["col_count"]:
+    if len(cols_a) != len(cols_b):
         raise PreflightError(
             f"Matrix addition requires equal column count: "
-            f"{matrix_a['name']} has {info_a['col_count']}, "
-            f"{matrix_b['name']} has {info_b['col_count']}"
+            f"{matrix_a['name']} has {len(cols_a)}, "
+            f"{matrix_b['name']} has {len(cols_b)}"
         )
\ No newline at end of file
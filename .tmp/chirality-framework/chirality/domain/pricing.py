@@ -4,7 +4,8 @@ Model pricing definitions for budget calculations.
 Single source of truth for per-token pricing across all OpenAI models.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 # Current OpenAI pricing (per-token; derived from per-1M list)
 MODEL_PRICING: Dict[str, Dict[str, float]] = {
@@ -71,15 +72,51 @@ MODEL_PRICING: Dict[str, Dict[str, float]] = {
     },
 }
 
+# Flat (input, cached_input, output) rates per model, resolved once at import;
+# cached input falls back to the regular input rate
+_PRICING_TUPLES: Dict[str, Tuple[float, float, float]] = {
+    model: (
+        pricing["input"],
+        pricing.get("cached_input", pricing["input"]),
+        pricing.get("output", 0.0),
+    )
+    for model, pricing in MODEL_PRICING.items()
+}
+
+_TOKEN_TYPE_INDEX: Dict[str, int] = {"input": 0, "cached_input": 1, "output": 2}
+
+_FREE: Tuple[float, float, float] = (0.0, 0.0, 0.0)
 
-def get_model_pricing() -> Dict[str, Dict[str, float]]:
+# Read-only view of the pricing table handed out by get_model_pricing
+_PRICING_VIEW: Mapping[str, Mapping[str, float]] = MappingProxyType(
+    {model: MappingProxyType(pricing) for model, pricing in MODEL_PRICING.items()}
+)
+
+
+def get_model_pricing() -> Mapping[str, Mapping[str, float]]:
     """
     Get the current model pricing table.
 
+    The table is a shared read-only view; callers that need to modify,
+    copy or serialize it should use get_model_pricing_copy().
+
     Returns:
-        Dictionary mapping model names to pricing structures
+        Mapping of model names to pricing structures
     """
-    return MODEL_PRICING.copy()
+    return _PRICING_VIEW
+
+
+def get_model_pricing_copy() -> Dict[str, Dict[str, float]]:
+    """
+    Get a private, plain-dict copy of the model pricing table.
+
+    Used as the default for config fields, which must stay copyable,
+    picklable and serializable.
+
+    Returns:
+        Dictionary of model names to pricing structures
+    """
+    return {model: dict(pricing) for model, pricing in MODEL_PRICING.items()}
 
 
 def get_model_price(model: str, token_type: str) -> float:
@@ -96,17 +133,30 @@ def get_model_price(model: str, token_type: str) -> float:
     Raises:
         KeyError: If model or token type not found
     """
-    if model not in MODEL_PRICING:
+    rates = _PRICING_TUPLES.get(model)
+    if rates is None:
         raise KeyError(f"Unknown model: {model}")
 
-    pricing = MODEL_PRICING[model]
-    if token_type not in pricing:
-        # Fall back to regular input price for cached_input if not available
-        if token_type == "cached_input" and "input" in pricing:
-            return pricing["input"]
+    index = _TOKEN_TYPE_INDEX.get(token_type)
+    if index is None:
         raise KeyError(f"Unknown token type '{token_type}' for model '{model}'")
 
-    return pricing[token_type]
+    return rates[index]
+
+
+def get_model_rates(model: str) -> Tuple[float, float, float]:
+    """
+    Get the per-token (input, cached_input, output) rates for a model.
+
+    Cached input falls back to the regular input rate; unknown models are free.
+
+    Args:
+        model: Model identifier
+
+    Returns:
+        Tuple of (input, cached_input, output) prices per token in USD
+    """
+    return _PRICING_TUPLES.get(model, _FREE)
 
 
 def calculate_cost(
@@ -124,17 +174,15 @@ def calculate_cost(
     Returns:
         Total cost in USD
     """
-    if model not in MODEL_PRICING:
+    # Failed and fully cached calls report no tokens; skip the table lookup
+    if not (prompt_tokens or completion_tokens):
         return 0.0
 
-    pricing = MODEL_PRICING[model]
+    input_rate, cached_rate, output_rate = _PRICING_TUPLES.get(model, _FREE)
 
     # Calculate cost considering cached vs regular input tokens
-    regular_input_tokens = prompt_tokens - cached_tokens
-    cost = (
-        regular_input_tokens * pricing.get("input", 0)
-        + cached_tokens * pricing.get("cached_input", pricing.get("input", 0))
-        + completion_tokens * pricing.get("output", 0)
+    return (
+        (prompt_tokens - cached_tokens) * input_rate
+        + cached_tokens * cached_rate
+        + completion_tokens * output_rate
     )
-
-    return cost
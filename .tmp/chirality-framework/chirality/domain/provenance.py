@@ -15,6 +15,7 @@ def create_provenance(
     stage_data: Dict[str, Any],
     sources: Optional[List[str]] = None,
     traced: bool = False,
+    timestamp: Optional[str] = None,
     **extras,
 ) -> Dict[str, Any]:
     """
@@ -26,66 +27,47 @@ def create_provenance(
         stage_data: Dictionary containing stage-specific data (stage_1_*, stage_2_*, etc.)
         sources: List of source matrix names used in computation
         traced: Whether this operation was traced
+        timestamp: ISO-8601 timestamp shared by a batch of cells; computed per call if omitted
         **extras: Additional provenance fields (e.g., "problem" for D synthesis)
 
     Returns:
         Canonical provenance dictionary
     """
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc).isoformat()
+
     provenance = {
         # Required fields for validation
         "operation": operation,
         "sources": sources or [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": timestamp,
         # Core tracking fields
         "coordinates": coordinates,
         "traced": traced,
-        # Stage-specific data
-        **stage_data,
-        # Additional fields
-        **extras,
     }
+    # Stage-specific data
+    provenance.update(stage_data)
+    # Additional fields
+    if extras:
+        provenance.update(extras)
 
     return provenance
 
 
 # Canonical provenance field definitions
-REQUIRED_FIELDS = ["operation", "sources", "timestamp"]
-CORE_FIELDS = ["coordinates", "traced"]
+REQUIRED_FIELDS = frozenset({"operation", "sources", "timestamp"})
+CORE_FIELDS = frozenset({"coordinates", "traced"})
+
+# Stage fields shared by every computed matrix, in pipeline order
+_STANDARD_STAGES = (
+    "stage_1_construct",
+    "stage_2_semantic",
+    "stage_3_column_lensed",
+    "stage_4_row_lensed",
+    "stage_5_final_synthesis",
+)
 # Universal provenance structure for all matrices
 STAGE_FIELDS = {
-    "compute_C": [
-        "stage_1_construct",
-        "stage_2_semantic",
-        "stage_3_column_lensed",
-        "stage_4_row_lensed",
-        "stage_5_final_synthesis",
-    ],
-    "compute_F": [
-        "stage_1_construct",
-        "stage_2_semantic",
-        "stage_3_column_lensed",
-        "stage_4_row_lensed",
-        "stage_5_final_synthesis",
-    ],
-    "compute_D": [
-        "stage_1_construct",
-        "stage_2_semantic",
-        "stage_3_column_lensed",
-        "stage_4_row_lensed",
-        "stage_5_final_synthesis",
-    ],
-    "compute_X": [
-        "stage_1_construct",
-        "stage_2_semantic",
-        "stage_3_column_lensed",
-        "stage_4_row_lensed",
-        "stage_5_final_synthesis",
-    ],
-    "compute_E": [
-        "stage_1_construct",
-        "stage_2_semantic",
-        "stage_3_column_lensed",
-        "stage_4_row_lensed",
-        "stage_5_final_synthesis",
-    ],
+    operation: _STANDARD_STAGES
+    for operation in ("compute_C", "compute_F", "compute_D", "compute_X", "compute_E")
 }
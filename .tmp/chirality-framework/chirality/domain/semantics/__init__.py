@@ -5,16 +5,34 @@ This module contains the semantic-first implementations for Phase 1 operations,
 including lens generation/application and semantic arithmetic.
 """
 
-from .lens import generate_lens, apply_lens, generate_matrix_lenses, apply_matrix_lenses
-from .operations import semantic_multiply, semantic_add, create_k_products, create_addition_sentence
+from .lens import (
+    generate_lens,
+    generate_row_lenses,
+    apply_lens,
+    generate_matrix_lenses,
+    apply_matrix_lenses,
+    set_lens_cache_dir,
+    clear_lens_cache,
+)
+from .operations import (
+    semantic_multiply,
+    semantic_add,
+    create_k_products,
+    iter_k_products,
+    create_addition_sentence,
+)
 
 __all__ = [
     "generate_lens", 
+    "generate_row_lenses",
     "apply_lens", 
     "generate_matrix_lenses", 
     "apply_matrix_lenses",
+    "set_lens_cache_dir",
+    "clear_lens_cache",
     "semantic_multiply",
     "semantic_add",
     "create_k_products", 
+    "iter_k_products",
     "create_addition_sentence"
 ]
@@ -8,9 +8,114 @@ This is the semantic-first approach - we prompt the LLM to perform
 semantic operations rather than implementing them in Python logic.
 """
 
-from typing import List
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+from ...infrastructure.caching import CellCache, content_digest
+from ...infrastructure.llm.config import get_config
 from ...infrastructure.llm.openai_adapter import call_responses
 from ...infrastructure.prompts.registry import get_registry
+from ...lib import jsonio
+
+
+# Bump whenever the lens generation prompt below changes so cached lenses are not reused
+LENS_PROMPT_VERSION = "1"
+
+# Prompt templates are built once at import; bump LENS_PROMPT_VERSION when the lens prompts change
+_LENS_INSTRUCTIONS = "You are generating semantic lenses for the Chirality Framework using semantic multiplication to find the intersection of ontological meanings."
+
+_APPLY_LENS_INSTRUCTIONS = "You are applying semantic lenses in the Chirality Framework to interpret content through specific ontological perspectives."
+
+_LENS_TEMPLATE = """
+Generate a semantic lens using the formula: [station_meaning * row_name * column_name *]
+
+Station: "{station}"
+Row ontology: "{row_name}" 
+Column ontology: "{col_name}"
+
+Apply semantic multiplication to find the intersection of these three concepts:
+1. The meaning of "{station}" in the context of knowledge work
+2. The ontological meaning of "{row_name}"  
+3. The ontological meaning of "{col_name}"
+
+Return exactly one interpretive lens statement that captures the essence of this semantic intersection. The lens should be concise, semantically rich, and suitable for interpreting content through this combined perspective.
+
+Do not include ontological identifiers or explanations - just the semantic meaning at the nexus of these aspects.
+"""
+
+_ROW_LENSES_TEMPLATE = """
+Generate semantic lenses using the formula: [station_meaning * row_name * column_name *]
+
+Station: "{station}"
+Row ontology: "{row_name}"
+Column ontologies:
+{column_lines}
+
+For each column ontology, apply semantic multiplication to find the intersection of:
+1. The meaning of "{station}" in the context of knowledge work
+2. The ontological meaning of "{row_name}"
+3. The ontological meaning of that column
+
+Each lens is exactly one interpretive lens statement that captures the essence of this semantic intersection. Lenses should be concise, semantically rich, and suitable for interpreting content through the combined perspective.
+
+Do not include ontological identifiers or explanations - just the semantic meaning at the nexus of these aspects.
+
+Return JSON only: {{"lenses": [<one lens string per column ontology, in the order listed>]}}
+"""
+
+_APPLY_LENS_TEMPLATE = """
+Apply the following interpretive lens to the given content:
+
+Content to interpret: "{content}"
+
+Interpretive lens: "{lens}"
+
+Interpret the content through this lens to produce a lensed interpretation. Your output should be a brief but semantically rich statement that captures the essence of the content when viewed through this lens.
+
+Focus on the semantic meaning that emerges from applying the lens perspective to the content. Do not include lens labels or meta-commentary - just the interpreted meaning.
+"""
+
+# Optional on-disk layer for warm restarts (enabled via set_lens_cache_dir or CHIRALITY_LENS_CACHE_DIR)
+_lens_disk_cache: Optional[CellCache] = None
+
+
+def set_lens_cache_dir(cache_dir: Optional[Union[str, Path]]) -> None:
+    """
+    Persist generated lenses under cache_dir so they survive across runs.
+
+    Args:
+        cache_dir: Directory for the lens cache store, or None to disable the disk layer
+    """
+    global _lens_disk_cache
+    # The in-process memo already bounds memory, so the disk layer keeps none of its own
+    _lens_disk_cache = CellCache(Path(cache_dir), max_memory_entries=0) if cache_dir else None
+
+
+set_lens_cache_dir(os.getenv("CHIRALITY_LENS_CACHE_DIR"))
+
+
+def clear_lens_cache() -> None:
+    """Forget lenses memoized in this process (the disk layer is left intact)."""
+    _generate_lens_cached.cache_clear()
+    _generate_row_lenses_cached.cache_clear()
+
+
+def _through_disk_cache(key_text: str, field: str, produce: Callable[[], Any]) -> Any:
+    """Return the value cached on disk under key_text, producing and storing it on a miss."""
+    disk_cache = _lens_disk_cache
+    if disk_cache is None:
+        return produce()
+
+    cache_key = content_digest(key_text)
+    cached = disk_cache.get(cache_key)
+    if cached is not None:
+        return cached[field]
+
+    value = produce()
+    disk_cache.put(cache_key, {field: value})
+    return value
 
 
 def generate_lens(station: str, row_name: str, col_name: str) -> str:
@@ -20,6 +125,8 @@ def generate_lens(station: str, row_name: str, col_name: str) -> str:
     
     This prompts the LLM to create a semantic intersection of the station,
     row ontology, and column ontology to form an interpretive lens.
+    Lenses are memoized per (station, row, column, model, prompt version),
+    so repeated coordinates only reach the LLM once.
     
     Args:
         station: Station name (e.g., "Problem Statement", "Requirements", etc.)
@@ -29,37 +136,38 @@ def generate_lens(station: str, row_name: str, col_name: str) -> str:
     Returns:
         A semantic lens as a single, coherent statement
     """
-    # Load system context for semantic operations
-    registry = get_registry()
-    
-    # Create the prompt for lens generation
-    user_message = f"""
-Generate a semantic lens using the formula: [station_meaning * row_name * column_name *]
+    return _generate_lens_cached(station, row_name, col_name, get_config().model, LENS_PROMPT_VERSION)
 
-Station: "{station}"
-Row ontology: "{row_name}" 
-Column ontology: "{col_name}"
 
-Apply semantic multiplication to find the intersection of these three concepts:
-1. The meaning of "{station}" in the context of knowledge work
-2. The ontological meaning of "{row_name}"  
-3. The ontological meaning of "{col_name}"
+@functools.lru_cache(maxsize=4096)
+def _generate_lens_cached(
+    station: str, row_name: str, col_name: str, model: str, prompt_version: str
+) -> str:
+    """Resolve a lens from the disk cache, falling back to the LLM."""
+    return _through_disk_cache(
+        f"{station}|{row_name}|{col_name}|{model}|{prompt_version}",
+        "lens",
+        lambda: _request_lens(station, row_name, col_name),
+    )
 
-Return exactly one interpretive lens statement that captures the essence of this semantic intersection. The lens should be concise, semantically rich, and suitable for interpreting content through this combined perspective.
 
-Do not include ontological identifiers or explanations - just the semantic meaning at the nexus of these aspects.
-"""
+def _request_lens(station: str, row_name: str, col_name: str) -> str:
+    """Issue the lens generation call to the LLM."""
+    # Load system context for semantic operations
+    registry = get_registry()
+    
+    # Create the prompt for lens generation
+    user_message = _LENS_TEMPLATE.format(station=station, row_name=row_name, col_name=col_name)
 
     # Call LLM to generate lens using Responses API
-    instructions = "You are generating semantic lenses for the Chirality Framework using semantic multiplication to find the intersection of ontological meanings."
-    
     response = call_responses(
-        instructions=instructions,
+        instructions=_LENS_INSTRUCTIONS,
         input=user_message
     )
     
     # Extract the lens from response
-    lens = response.get("output_text", "").strip()
+    text = response.get("output_text")
+    lens = text.strip() if text else ""
     
     if not lens:
         raise ValueError(f"Failed to generate lens for station='{station}', row='{row_name}', col='{col_name}'")
@@ -67,6 +175,76 @@ Do not include ontological identifiers or explanations - just the semantic meani
     return lens
 
 
+def generate_row_lenses(station: str, row_name: str, col_names: Sequence[str]) -> List[str]:
+    """
+    Generate the lenses for every column of one matrix row in a single LLM call.
+
+    Applies the same normative formula as generate_lens, but the station and
+    row context (and the instructions) are sent once for all columns.
+    Results are memoized like generate_lens.
+
+    Args:
+        station: Station name for the matrix
+        row_name: Row ontology name
+        col_names: Column ontology names, in matrix order
+
+    Returns:
+        List of lenses, one per column
+    """
+    return list(
+        _generate_row_lenses_cached(
+            station, row_name, tuple(col_names), get_config().model, LENS_PROMPT_VERSION
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate_row_lenses_cached(
+    station: str, row_name: str, col_names: Tuple[str, ...], model: str, prompt_version: str
+) -> Tuple[str, ...]:
+    """Resolve a row of lenses from the disk cache, falling back to the LLM."""
+    return tuple(
+        _through_disk_cache(
+            "|".join(("row", station, row_name, *col_names, model, prompt_version)),
+            "lenses",
+            lambda: _request_row_lenses(station, row_name, col_names),
+        )
+    )
+
+
+def _request_row_lenses(station: str, row_name: str, col_names: Tuple[str, ...]) -> List[str]:
+    """Issue one lens generation call covering all columns of a row."""
+    column_lines = "\n".join(f'{j + 1}. "{col_name}"' for j, col_name in enumerate(col_names))
+
+    # Create the prompt for row lens generation
+    user_message = _ROW_LENSES_TEMPLATE.format(
+        station=station, row_name=row_name, column_lines=column_lines
+    )
+
+    # Call LLM to generate the row's lenses using Responses API
+    response = call_responses(
+        instructions=_LENS_INSTRUCTIONS,
+        input=user_message,
+        expects_json=True
+    )
+
+    try:
+        lenses = jsonio.loads(response.get("output_text") or "{}").get("lenses")
+    except (ValueError, AttributeError):
+        lenses = None
+
+    if not isinstance(lenses, list) or len(lenses) != len(col_names):
+        raise ValueError(
+            f"Failed to generate {len(col_names)} lenses for station='{station}', row='{row_name}'"
+        )
+
+    lenses = [lens.strip() if isinstance(lens, str) else "" for lens in lenses]
+    if not all(lenses):
+        raise ValueError(f"Empty lens generated for station='{station}', row='{row_name}'")
+
+    return lenses
+
+
 def apply_lens(content: str, lens: str) -> str:
     """
     Apply a semantic lens to interpret content through that lens.
@@ -81,28 +259,17 @@ def apply_lens(content: str, lens: str) -> str:
     Returns:
         The lensed interpretation as a coherent statement
     """
-    user_message = f"""
-Apply the following interpretive lens to the given content:
-
-Content to interpret: "{content}"
-
-Interpretive lens: "{lens}"
-
-Interpret the content through this lens to produce a lensed interpretation. Your output should be a brief but semantically rich statement that captures the essence of the content when viewed through this lens.
-
-Focus on the semantic meaning that emerges from applying the lens perspective to the content. Do not include lens labels or meta-commentary - just the interpreted meaning.
-"""
+    user_message = _APPLY_LENS_TEMPLATE.format(content=content, lens=lens)
 
     # Call LLM to apply lens using Responses API
-    instructions = "You are applying semantic lenses in the Chirality Framework to interpret content through specific ontological perspectives."
-    
     response = call_responses(
-        instructions=instructions,
+        instructions=_APPLY_LENS_INSTRUCTIONS,
         input=user_message
     )
     
     # Extract the lensed interpretation
-    lensed = response.get("output_text", "").strip()
+    text = response.get("output_text")
+    lensed = text.strip() if text else ""
     
     if not lensed:
         raise ValueError(f"Failed to apply lens to content: '{content[:50]}...'")
@@ -110,28 +277,43 @@ Focus on the semantic meaning that emerges from applying the lens perspective to
     return lensed
 
 
-def generate_matrix_lenses(station: str, row_labels: List[str], col_labels: List[str]) -> List[List[str]]:
+def generate_matrix_lenses(
+    station: str, row_labels: List[str], col_labels: List[str], max_workers: int = 8
+) -> List[List[str]]:
     """
     Generate lenses for all cells in a matrix using the explicit lens API.
+
+    Each row is resolved with one LLM call (see generate_row_lenses), and rows
+    are dispatched concurrently on a thread pool (the adapter's shared rate
+    limiter paces the requests).
     
     Args:
         station: Station name for the matrix
         row_labels: List of row ontology labels
         col_labels: List of column ontology labels
+        max_workers: Maximum concurrent row calls (1 = sequential)
         
     Returns:
         2D list of lenses, one for each matrix cell
     """
-    lenses = []
-    
-    for row_name in row_labels:
-        row_lenses = []
-        for col_name in col_labels:
-            lens = generate_lens(station, row_name, col_name)
-            row_lenses.append(lens)
-        lenses.append(row_lenses)
-    
-    return lenses
+    # Only distinct rows are scheduled; cached ones return without a network call
+    distinct_rows = list(dict.fromkeys(row_labels))
+    col_names = tuple(col_labels)
+    if not col_names:
+        return [[] for _ in row_labels]
+
+    def _row_lenses(row_name):
+        return generate_row_lenses(station, row_name, col_names)
+
+    workers = min(max_workers, len(distinct_rows))
+    if workers <= 1:
+        resolved = [_row_lenses(row_name) for row_name in distinct_rows]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            resolved = list(executor.map(_row_lenses, distinct_rows))
+    lenses = dict(zip(distinct_rows, resolved))
+
+    return [list(lenses[row_name]) for row_name in row_labels]
 
 
 def apply_matrix_lenses(
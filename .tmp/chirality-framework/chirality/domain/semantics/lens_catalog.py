@@ -6,12 +6,31 @@ creating a canonized set of lenses that can be analyzed for stable "attractors"
 over time.
 """
 
-import json
 import hashlib
-from typing import Dict, List, Callable, Any
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Callable, Any, Optional, Tuple, TypeVar, Union
 from datetime import datetime, timezone
 
+from ...infrastructure.llm.config import get_config
+from ...infrastructure.prompts.json_tails import TAIL_LENSES_GENERATE
 from ...infrastructure.prompts.registry import get_registry
+from ...lib import jsonio
+
+T = TypeVar("T")
+
+# Bump when the catalog prompts or cache key derivation change so stale entries are never matched
+LENS_CATALOG_CACHE_VERSION = "v4"
+
+# Content-addressed store of generated station lenses (pass cache_dir=None to bypass)
+LENS_CATALOG_CACHE_DIR = Path(
+    os.getenv("CHIRALITY_LENS_CATALOG_CACHE", Path.home() / ".cache" / "chirality" / "lens_catalog")
+)
 
 # Station-specific schemas (single source of truth)
 STATION_SCHEMAS = {
@@ -32,66 +51,118 @@ STATION_SCHEMAS = {
 
 def generate_lens_catalog(
     stations: List[str],
-    call_llm: Callable[[str, str, str], Dict[str, Any]]
+    call_llm: Callable[[str, str, str], Dict[str, Any]],
+    max_workers: int = 5,
+    cache_dir: Optional[Path] = LENS_CATALOG_CACHE_DIR,
+    cache_ttl: Optional[float] = None,
+    batch: bool = True,
 ) -> tuple[Dict[str, List[List[str]]], Dict[str, Any]]:
     """
     Generate complete lens catalog for all stations using Phase 1 system prompt.
     
     This creates a canonized lens catalog that can be reused across runs and
-    analyzed for stable semantic "attractors" over time.
+    analyzed for stable semantic "attractors" over time. Uncached stations are
+    requested together in a single call; any station whose matrix comes back
+    missing or mis-shaped is regenerated by its own call, run concurrently.
     
     Args:
         stations: List of station names 
-        call_llm: Function to call LLM with (message, tail, operation_id)
+        call_llm: Function to call LLM with (message, tail, operation_id);
+            must be safe to call from multiple threads
+        max_workers: Maximum concurrent station calls (1 = sequential)
+        cache_dir: Directory of cached station lenses keyed by system prompt,
+            station schema and model; None always calls the LLM
+        cache_ttl: Maximum age in seconds of a usable cache entry (None = no expiry)
+        batch: Request all uncached stations in one call (False = one call per station)
         
     Returns:
         Tuple of (catalog, metadata) where catalog is {station: [[lens_strings]]}
     """
     
-    catalog = {}
     for station in stations:
         if station not in STATION_SCHEMAS:
             raise ValueError(f"Unknown station schema: {station}")
+    
+    # Get system prompt hash (requires registry access)
+    try:
+        registry = get_registry()
+        system_prompt = registry.get_text("system")
+        prompt_hash = _hash_text(system_prompt)
+    except (OSError, ValueError, KeyError):
+        # Missing or invalid registry assets, or no "system" asset
+        prompt_hash = "unknown"
+    model = get_config().model
+    
+    def _station_key(station: str) -> str:
         schema = STATION_SCHEMAS[station]
-        rows, cols = schema["rows"], schema["cols"]
-        catalog[station] = [[None] * len(cols) for _ in rows]
+        return _hash_text(
+            f"{LENS_CATALOG_CACHE_VERSION}|{prompt_hash}|{station}|"
+            f"{jsonio.dumps(schema, sort_keys=True)}|{model}"
+        )
     
-    for station in stations:
+    def _station_lenses(station: str) -> List[List[str]]:
+        return _cached_call(
+            _station_key(station), lambda: _request_station_lenses(station), cache_dir, cache_ttl
+        )
+    
+    def _request_station_lenses(station: str) -> List[List[str]]:
         # Get station-specific schema
         schema = STATION_SCHEMAS[station]
-        station_rows, station_cols = schema["rows"], schema["cols"]
+        station_rows = schema["rows"]
         
-        # Generate lenses for one station at a time for reliability
-        message = _build_catalog_prompt_for_station(station, station_rows, station_cols)
-        tail = _get_lens_catalog_tail(station, station_rows, station_cols)
+        message = _PROMPT_CACHE[station]
+        tail = _TAIL_CACHE[station]
         
         response = call_llm(message, tail, f"{station.lower().replace(' ', '_')}_lens_catalog")
         
         # Extract lenses from response
         if "lenses" in response and len(response["lenses"]) == len(station_rows):
-            lenses = response["lenses"]
-            
             # Handle case where LLM returns triple-nested instead of double-nested array
-            if (len(lenses) > 0 and isinstance(lenses[0], list) and len(lenses[0]) > 0 
-                and isinstance(lenses[0][0], list) and len(lenses[0][0]) > 0
-                and isinstance(lenses[0][0][0], str)):
-                # Triple-nested: [[[str]]] -> flatten to [[str]]
-                lenses = [row[0] if isinstance(row[0], list) else row for row in lenses]
-            
-            catalog[station] = lenses
-        else:
-            raise ValueError(f"Invalid lens catalog response for station '{station}': {response}")
+            return _flatten_if_needed(response["lenses"])
+        raise ValueError(f"Invalid lens catalog response for station '{station}': {response}")
     
-    # Generate metadata for tracking and canonization
-    # Get system prompt hash (requires registry access)
-    try:
-        from ...infrastructure.prompts.registry import get_registry
-        registry = get_registry()
-        system_prompt = registry.get_text("system")
-        prompt_hash = _hash_text(system_prompt)
-    except:
-        prompt_hash = "unknown"
+    catalog: Dict[str, List[List[str]]] = {}
+    pending = list(dict.fromkeys(stations))
+    if cache_dir is not None:
+        for station in pending:
+            cached = _cache_load(_station_key(station), cache_dir, cache_ttl)
+            if cached is not _MISSING:
+                catalog[station] = cached
+        pending = [station for station in pending if station not in catalog]
+    
+    # One round trip for every uncached station; only stations that come back
+    # missing or mis-shaped fall through to their own per-station calls
+    if batch and len(pending) > 1:
+        try:
+            response = call_llm(
+                _build_catalog_prompt_all_stations(pending),
+                _get_lens_catalog_all_tail(pending),
+                "all_stations_lens_catalog",
+            )
+            catalogs = response.get("catalogs")
+        except Exception as e:
+            print(f"Warning: Batched lens catalog call failed, falling back to per-station: {e}",
+                  file=sys.stderr)
+            catalogs = None
+        if isinstance(catalogs, dict):
+            for station in pending:
+                lenses = _checked_station_lenses(station, catalogs.get(station))
+                if lenses is not None:
+                    catalog[station] = lenses
+                    if cache_dir is not None:
+                        _cache_store(_station_key(station), lenses, cache_dir)
+            pending = [station for station in pending if station not in catalog]
     
+    workers = min(max_workers, len(pending))
+    if workers <= 1:
+        results = [_station_lenses(station) for station in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_station_lenses, pending))
+    catalog.update(zip(pending, results))
+    catalog = {station: catalog[station] for station in stations}
+    
+    # Generate metadata for tracking and canonization
     meta = {
         "version": "v2",
         "prompt_hash": prompt_hash,
@@ -131,22 +202,142 @@ Return the complete {len(rows)}×{len(cols)} lens matrix for the "{station}" sta
 """
 
 
+def _lenses_placeholder(n_rows: int, n_cols: int) -> List[List[str]]:
+    """R×C matrix of "..." placeholders for JSON tail contracts (rows are distinct lists)."""
+    return [["..."] * n_cols for _ in range(n_rows)]
+
+
 def _get_lens_catalog_tail(station: str, rows: List[str], cols: List[str]) -> str:
     """Get JSON tail for lens catalog generation."""
-    rows_json = json.dumps(rows)
-    cols_json = json.dumps(cols)
-    lenses_template = "[[" + ",".join(['"..."'] * len(cols)) + "]]" * len(rows)
-    lenses_template = lenses_template.replace("]][[", "],[")
-    lenses_template = f"[{lenses_template}]"
+    rows_json = jsonio.dumps(rows)
+    cols_json = jsonio.dumps(cols)
+    lenses_template = jsonio.dumps(_lenses_placeholder(len(rows), len(cols)))
     
     return f'''Return JSON only using this contract: {{"artifact":"lens_catalog","station":"{station}","rows":{rows_json},"cols":{cols_json},"lenses":{lenses_template}}}'''
 
 
+def _build_catalog_prompt_all_stations(stations: List[str]) -> str:
+    """Build one prompt requesting the lens matrices of several stations at once."""
+    request = {
+        "artifact": "lens_catalog_all",
+        "stations": [
+            {"station": station, "rows": STATION_SCHEMAS[station]["rows"], "cols": STATION_SCHEMAS[station]["cols"]}
+            for station in stations
+        ],
+    }
+    return f"""
+Generate interpretive lenses for each station below using the normative formula:
+[station_meaning * row_name * column_name]
+
+Request: {jsonio.dumps(request)}
+
+For every station, and for each cell position of its matrix, create a lens by
+finding the semantic intersection of:
+1. The meaning of the station in knowledge work context
+2. The row ontology meaning  
+3. The column ontology meaning
+
+Each station's matrix must have exactly its listed rows × columns, one lens per cell.
+
+Each lens should be:
+- A concise, semantically rich statement
+- Distinct from other lenses of the same station (no duplicates)
+- Suitable for interpreting content through this combined perspective
+- Free of ontological identifiers (just the semantic meaning)
+
+Return the complete lens matrix for every requested station.
+"""
+
+
+def _get_lens_catalog_all_tail(stations: List[str]) -> str:
+    """Get JSON tail for batched lens catalog generation."""
+    catalogs_template = jsonio.dumps({
+        station: _lenses_placeholder(len(STATION_SCHEMAS[station]["rows"]), len(STATION_SCHEMAS[station]["cols"]))
+        for station in stations
+    })
+    
+    return f'''Return JSON only using this contract: {{"artifact":"lens_catalog_all","catalogs":{catalogs_template}}}'''
+
+
+def _checked_station_lenses(station: str, lenses: Any) -> Optional[List[List[str]]]:
+    """Return a station's lens matrix if it matches the station schema, else None."""
+    schema = STATION_SCHEMAS[station]
+    if not isinstance(lenses, list) or len(lenses) != len(schema["rows"]):
+        return None
+    lenses = _flatten_if_needed(lenses)
+    n_cols = len(schema["cols"])
+    for row in lenses:
+        if not isinstance(row, list) or len(row) != n_cols:
+            return None
+        if not all(isinstance(lens, str) for lens in row):
+            return None
+    return lenses
+
+
+# STATION_SCHEMAS is static, so every station's prompt and JSON tail are built once
+_PROMPT_CACHE: Dict[str, str] = {
+    station: _build_catalog_prompt_for_station(station, schema["rows"], schema["cols"])
+    for station, schema in STATION_SCHEMAS.items()
+}
+_TAIL_CACHE: Dict[str, str] = {
+    station: _get_lens_catalog_tail(station, schema["rows"], schema["cols"])
+    for station, schema in STATION_SCHEMAS.items()
+}
+
+
 def _hash_text(text: str) -> str:
     """Generate SHA256 hash of text for tracking changes."""
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+_MISSING = object()
+
+
+def _cached_call(key: str, thunk: Callable[[], T], cache_dir: Optional[Path], ttl: Optional[float]) -> T:
+    """
+    Return the JSON result cached under key, or compute it with thunk and store it.
+
+    Entries older than ttl seconds (by file mtime) are recomputed. Writes are
+    atomic (temporary file + rename) so concurrent runs never see partial entries.
+    """
+    if cache_dir is None:
+        return thunk()
+
+    result = _cache_load(key, cache_dir, ttl)
+    if result is _MISSING:
+        result = thunk()
+        _cache_store(key, result, cache_dir)
+    return result
+
+
+def _cache_load(key: str, cache_dir: Path, ttl: Optional[float]) -> Any:
+    """Return the entry cached under key, or _MISSING if absent, stale or unreadable."""
+    cache_path = Path(cache_dir) / f"{key}.json"
+    try:
+        if ttl is None or time.time() - cache_path.stat().st_mtime <= ttl:
+            return jsonio.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        # Missing, unreadable or corrupted entry: caller regenerates
+        pass
+    return _MISSING
+
+
+def _cache_store(key: str, result: Any, cache_dir: Path) -> None:
+    """Atomically write result under key; failures are logged, never raised."""
+    cache_path = Path(cache_dir) / f"{key}.json"
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="wb", dir=cache_path.parent, prefix=f".{key}_", suffix=".tmp", delete=False
+        ) as tmp_file:
+            tmp_file.write(jsonio.dumps_bytes(result))
+            tmp_path = tmp_file.name
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # Log error but don't fail the generation
+        print(f"Warning: Failed to write lens cache file {cache_path}: {e}", file=sys.stderr)
+
+
 def validate_lens_catalog(catalog: Dict[str, List[List[str]]], stations: List[str]) -> List[str]:
     """
     Validate lens catalog structure and content using station-specific schemas.
@@ -157,9 +348,15 @@ def validate_lens_catalog(catalog: Dict[str, List[List[str]]], stations: List[st
     
     errors = []
     
-    # Check structure
-    if set(catalog.keys()) != set(stations):
-        errors.append(f"Catalog stations {set(catalog.keys())} don't match expected {set(stations)}")
+    # Check structure (difference lists are only built on a mismatch)
+    if len(catalog) != len(stations) or not all(station in catalog for station in stations):
+        expected = set(stations)
+        missing = [station for station in stations if station not in catalog]
+        extra = [station for station in catalog if station not in expected]
+        if missing:
+            errors.append(f"Catalog is missing stations: {missing}")
+        if extra:
+            errors.append(f"Catalog has unexpected stations: {extra}")
     
     for station, station_lenses in catalog.items():
         if station not in STATION_SCHEMAS:
@@ -173,24 +370,27 @@ def validate_lens_catalog(catalog: Dict[str, List[List[str]]], stations: List[st
             errors.append(f"Station '{station}': expected {len(expected_rows)} rows, got {len(station_lenses)}")
             continue
             
-        # Collect all lenses for this station
-        flat_lenses = []
+        # Collect the distinct lenses for this station
+        unique_lenses = set()
         
         for i, row_lenses in enumerate(station_lenses):
             if len(row_lenses) != len(expected_cols):
                 errors.append(f"Station '{station}' row {i}: expected {len(expected_cols)} columns, got {len(row_lenses)}")
                 continue
-                
-            for j, lens in enumerate(row_lenses):
-                # Check for empty strings
-                if not lens or not lens.strip():
-                    errors.append(f"Station '{station}' cell [{i},{j}]: empty lens")
-                else:
-                    flat_lenses.append(lens.strip())
+            
+            stripped = [lens.strip() if lens else "" for lens in row_lenses]
+            # Check for empty strings
+            if "" in stripped:
+                errors.extend(
+                    f"Station '{station}' cell [{i},{j}]: empty lens"
+                    for j, lens in enumerate(stripped) if not lens
+                )
+            unique_lenses.update(stripped)
+        unique_lenses.discard("")
         
         # Check uniqueness within station
-        if flat_lenses:
-            unique_count = len(set(flat_lenses))
+        if unique_lenses:
+            unique_count = len(unique_lenses)
             expected_count = len(expected_rows) * len(expected_cols)
             
             # Require at least 10 unique lenses per station (or 80% if less than 12 cells)
@@ -206,6 +406,7 @@ def validate_lens_catalog(catalog: Dict[str, List[List[str]]], stations: List[st
 
 # New spec-driven lens generation utilities
 
+@lru_cache(maxsize=4)
 def _extract_spec_block(full: str,
                         start: str = "<!-- LENS_GEN:BEGIN -->",
                         end: str = "<!-- LENS_GEN:END -->") -> str:
@@ -216,8 +417,14 @@ def _extract_spec_block(full: str,
     return full
 
 
+@lru_cache(maxsize=1)
 def prompt_hash_for_lenses() -> str:
-    """SHA-256 of the normative spec lens block (for provenance)."""
+    """
+    SHA-256 of the normative spec lens block (for provenance).
+
+    Computed once per process; call prompt_hash_for_lenses.cache_clear() if the
+    registry's normative_spec is reloaded.
+    """
     spec = get_registry().get_text("normative_spec")
     block = _extract_spec_block(spec)
     return hashlib.sha256(block.encode("utf-8")).hexdigest()
@@ -227,13 +434,72 @@ def generate_lens_matrix_llm(*,
                              station: str,
                              rows: List[str],
                              cols: List[str],
-                             call_json_tail: Callable[[str, str, str], Dict]) -> List[List[str]]:
+                             call_json_tail: Callable[[str, str, str], Dict],
+                             cache_dir: Optional[Path] = LENS_CATALOG_CACHE_DIR,
+                             cache_ttl: Optional[float] = None) -> List[List[str]]:
     """
     Generate a complete lenses matrix for a station using normative_spec.txt.
     The prompt text comes from the spec (with variable substitution).
+
+    Results are cached under cache_dir keyed by spec block, station, label sets
+    and model (see generate_lens_catalog for cache_dir/cache_ttl). Labels are
+    compared ignoring case, surrounding whitespace and order, and entries are
+    stored in that canonical order, so a request that only reorders or
+    re-spaces the same rows/cols reuses the cached matrix, permuted to match.
     """
     spec = get_registry().get_text("normative_spec")
     block = _extract_spec_block(spec)
+
+    row_keys = [_normalize_label(row) for row in rows]
+    col_keys = [_normalize_label(col) for col in cols]
+    row_order = sorted(range(len(rows)), key=row_keys.__getitem__)
+    col_order = sorted(range(len(cols)), key=col_keys.__getitem__)
+    labels = {"rows": [row_keys[i] for i in row_order], "cols": [col_keys[j] for j in col_order]}
+    key = _hash_text(
+        f"{LENS_CATALOG_CACHE_VERSION}|{prompt_hash_for_lenses()}|{_normalize_label(station)}|"
+        f"{jsonio.dumps(labels)}|{get_config().model}"
+    )
+
+    def _canonical_matrix() -> List[List[str]]:
+        lenses = _request_lens_matrix(block, station, rows, cols, call_json_tail)
+        return [[lenses[i][j] for j in col_order] for i in row_order]
+
+    canonical = _cached_call(key, _canonical_matrix, cache_dir, cache_ttl)
+
+    # Map the canonical layout back to the requested row/col order
+    row_slot = {i: slot for slot, i in enumerate(row_order)}
+    col_slot = {j: slot for slot, j in enumerate(col_order)}
+    return [
+        [canonical[row_slot[i]][col_slot[j]] for j in range(len(cols))]
+        for i in range(len(rows))
+    ]
+
+
+def _flatten_if_needed(lenses: Any) -> Any:
+    """Flatten triple-nested arrays if LLM returns [[[str]]] instead of [[str]]."""
+    # Probe the first cell; the common, already-correct case stops here
+    try:
+        first = lenses[0][0]
+    except (IndexError, KeyError, TypeError):
+        return lenses
+    if not isinstance(first, list) or not first or not isinstance(first[0], str):
+        return lenses
+
+    # Flatten: [[[str]]] -> [[str]]
+    return [row[0] if row and isinstance(row[0], list) and row[0] else row for row in lenses]
+
+
+def _normalize_label(label: str) -> str:
+    """Case- and whitespace-insensitive form of an ontology label for cache keys."""
+    return " ".join(label.split()).casefold()
+
+
+def _request_lens_matrix(block: str,
+                         station: str,
+                         rows: List[str],
+                         cols: List[str],
+                         call_json_tail: Callable[[str, str, str], Dict]) -> List[List[str]]:
+    """Ask the LLM for a station's lens matrix and validate its shape."""
     templ = (block
              .replace("{{STATION}}", station)
              .replace("{{ROWS_LINE}}", ", ".join(rows))
@@ -254,7 +520,7 @@ def generate_lens_matrix_llm(*,
 
     preamble = (
         templ + "\n\n"
-        "REQUEST_JSON:\n" + json.dumps(request_json, ensure_ascii=False)
+        "REQUEST_JSON:\n" + jsonio.dumps(request_json)
     )
 
     result = call_json_tail(
@@ -265,20 +531,6 @@ def generate_lens_matrix_llm(*,
     lenses = result["lenses"]
 
     # Handle triple-nesting and validate shape + content
-    def _flatten_if_needed(lenses_raw):
-        """Flatten triple-nested arrays if LLM returns [[[str]]] instead of [[str]]."""
-        if not lenses_raw or not isinstance(lenses_raw, list):
-            return lenses_raw
-            
-        # Check if triple-nested: [[[str]]] pattern
-        if (len(lenses_raw) > 0 and isinstance(lenses_raw[0], list) 
-            and len(lenses_raw[0]) > 0 and isinstance(lenses_raw[0][0], list)
-            and len(lenses_raw[0][0]) > 0 and isinstance(lenses_raw[0][0][0], str)):
-            # Flatten: [[[str]]] -> [[str]]
-            return [row[0] if isinstance(row[0], list) and len(row[0]) > 0 else row for row in lenses_raw]
-        
-        return lenses_raw
-    
     lenses = _flatten_if_needed(lenses)
     
     # Validate shape + content  
@@ -291,3 +543,51 @@ def generate_lens_matrix_llm(*,
     if any((not s) or (not str(s).strip()) for row in lenses for s in row):
         raise ValueError(f"Empty lens string found in {station}")
     return lenses
+
+
+def generate_lens_matrices_llm(*,
+                               stations: Union[Dict[str, Tuple[List[str], List[str]]], List[str]],
+                               call_json_tail: Callable[[str, str, str], Dict],
+                               max_workers: int = 5,
+                               cache_dir: Optional[Path] = LENS_CATALOG_CACHE_DIR,
+                               cache_ttl: Optional[float] = None) -> Dict[str, List[List[str]]]:
+    """
+    Generate lens matrices for several stations concurrently.
+
+    Each station is resolved by generate_lens_matrix_llm on a thread pool;
+    call_json_tail must be safe to call from multiple threads.
+
+    Args:
+        stations: Mapping of station name -> (rows, cols), or station names
+            whose rows/cols are taken from STATION_SCHEMAS
+        call_json_tail: JSON-tail LLM call (preamble, tail, operation_id)
+        max_workers: Maximum concurrent station calls (1 = sequential)
+        cache_dir: Lens cache directory (None always calls the LLM)
+        cache_ttl: Maximum age in seconds of a usable cache entry
+
+    Returns:
+        Dict of station name -> lenses matrix, in the order given
+    """
+    def _matrix(item):
+        station, (rows, cols) = item
+        return generate_lens_matrix_llm(station=station, rows=rows, cols=cols,
+                                        call_json_tail=call_json_tail,
+                                        cache_dir=cache_dir, cache_ttl=cache_ttl)
+
+    if isinstance(stations, dict):
+        items = list(stations.items())
+    else:
+        unknown = [station for station in stations if station not in STATION_SCHEMAS]
+        if unknown:
+            raise ValueError(f"Unknown station schema: {unknown[0]}")
+        items = [
+            (station, (STATION_SCHEMAS[station]["rows"], STATION_SCHEMAS[station]["cols"]))
+            for station in dict.fromkeys(stations)
+        ]
+    workers = min(max_workers, len(items))
+    if workers <= 1:
+        results = [_matrix(item) for item in items]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_matrix, items))
+    return {station: lenses for (station, _), lenses in zip(items, results)}
@@ -6,8 +6,9 @@ It has no external dependencies - only pure functions that define what operation
 mean in the context of the Chirality Framework.
 """
 
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Iterable, Iterator
 from enum import Enum
+from itertools import product
 
 
 class SemanticOperationType(Enum):
@@ -85,7 +86,24 @@ def create_k_products(row_terms: List[str], col_terms: List[str]) -> List[Tuple[
     Returns:
         List of (row_term, col_term) pairs for semantic resolution
     """
-    return [(row_term, col_term) for row_term in row_terms for col_term in col_terms]
+    return list(product(row_terms, col_terms))
+
+
+def iter_k_products(row_terms: Iterable[str], col_terms: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily yield k-products in the same order as create_k_products (pure function).
+
+    Use when the pairs are streamed to a resolver, so the R·C pairs are never
+    materialized at once.
+
+    Args:
+        row_terms: Terms from matrix row
+        col_terms: Terms from matrix column
+
+    Returns:
+        Iterator of (row_term, col_term) pairs for semantic resolution
+    """
+    return product(row_terms, col_terms)
 
 
 def create_addition_sentence(part_a: str, part_b: str) -> str:
@@ -80,6 +80,16 @@ STATIONS: List[Tuple[int, str, str, str]] = [
     (11, STATION_RESOLUTION, "Final [N]", "Complete knowledge generation cycle"),
 ]
 
+# Reverse lookups, built once. A matrix listed under several stations (N) maps
+# to the first one in valley order, hence building from the last station back.
+_MATRIX_TO_STATION: Dict[str, str] = {
+    matrix: station
+    for station, matrices in reversed(STATION_MATRICES.items())
+    for matrix in matrices
+}
+
+_STATION_TO_INDEX: Dict[str, int] = {name: idx for idx, name, _, _ in STATIONS}
+
 
 def get_station_for_matrix(matrix_name: str) -> str:
     """
@@ -94,10 +104,10 @@ def get_station_for_matrix(matrix_name: str) -> str:
     Raises:
         ValueError: If matrix is not found in any station
     """
-    for station, matrices in STATION_MATRICES.items():
-        if matrix_name in matrices:
-            return station
-    raise ValueError(f"Matrix {matrix_name} not found in any station")
+    try:
+        return _MATRIX_TO_STATION[matrix_name]
+    except KeyError:
+        raise ValueError(f"Matrix {matrix_name} not found in any station") from None
 
 
 def get_station_index(station_name: str) -> int:
@@ -113,10 +123,10 @@ def get_station_index(station_name: str) -> int:
     Raises:
         ValueError: If station name is not recognized
     """
-    for idx, name, _, _ in STATIONS:
-        if name == station_name:
-            return idx
-    raise ValueError(f"Unknown station: {station_name}")
+    try:
+        return _STATION_TO_INDEX[station_name]
+    except KeyError:
+        raise ValueError(f"Unknown station: {station_name}") from None
 
 
 def format_valley_summary(current_station: Optional[str] = None) -> str:
@@ -5,12 +5,21 @@ Contains only the essential data structures: Cell, Matrix.
 All abstractions removed - this is a fixed algorithm, not a flexible framework.
 """
 
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
-from .pricing import get_model_pricing
+from .pricing import get_model_pricing_copy
 
+# dataclass(slots=True) is Python 3.10+; on 3.9 instances keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """Intern exact str values; anything else (None, non-strings) passes through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(**_SLOTS)
 class RichResult:
     """
     Structured result object containing both text output and associated metadata.
@@ -32,7 +41,7 @@ class RichResult:
     metadata: Dict[str, Any]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Cell:
     """
     Fundamental semantic unit in Chirality Framework semantic calculator.
@@ -55,7 +64,7 @@ class Cell:
     provenance: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Matrix:
     """
     2D semantic matrix for Chirality Framework semantic calculator.
@@ -70,24 +79,42 @@ class Matrix:
         station: Valley station where matrix exists
         row_labels: Ontological labels for rows (e.g. ["Normative", "Operative", "Evaluative"])
         col_labels: Ontological labels for columns (e.g. ["Determinacy", "Sufficiency", etc.])
-        cells: 2D array of cells [row][col]
+        cells: 2D array of cells [row][col] (lists, or tuples for frozen canonical matrices)
+
+    Name, station and labels are interned at construction, so the strings
+    repeated across matrices are stored once and compare by identity. The
+    shape is computed from the labels at the same time; labels are not
+    expected to change afterwards.
     """
 
     name: str
     station: str
     row_labels: List[str]
     col_labels: List[str]
-    cells: List[List[Cell]]
+    cells: Sequence[Sequence[Cell]]
+    _shape: Tuple[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.name = _intern(self.name)
+        self.station = _intern(self.station)
+        self.row_labels = [_intern(label) for label in self.row_labels]
+        self.col_labels = [_intern(label) for label in self.col_labels]
+        self._shape = (len(self.row_labels), len(self.col_labels))
 
     @property
     def shape(self) -> tuple[int, int]:
         """Get matrix dimensions."""
-        return (len(self.row_labels), len(self.col_labels))
+        return self._shape
 
     def get_cell(self, row: int, col: int) -> Optional[Cell]:
         """Get cell at specific position."""
-        if 0 <= row < len(self.cells) and 0 <= col < len(self.cells[row]):
-            return self.cells[row][col]
+        rows, cols = self._shape
+        if 0 <= row < rows and 0 <= col < cols:
+            try:
+                return self.cells[row][col]
+            except IndexError:
+                # Cells grid shorter than its labels (malformed matrix)
+                return None
         return None
 
     def __getitem__(self, key):
@@ -110,22 +137,13 @@ class Matrix:
 
         Returns a new Matrix instance with transposed dimensions, labels, and cells.
         """
-        transposed_cells = []
-
-        for j in range(self.shape[1]):
-            new_row = []
-            for i in range(self.shape[0]):
-                original_cell = self.get_cell(i, j)
-                if original_cell:
-                    new_row.append(
-                        Cell(
-                            row=j,
-                            col=i,
-                            value=original_cell.value,
-                            provenance=original_cell.provenance,
-                        )
-                    )
-            transposed_cells.append(new_row)
+        transposed_cells = [
+            [
+                Cell(row=j, col=i, value=cell.value, provenance=cell.provenance)
+                for i, cell in enumerate(column)
+            ]
+            for j, column in enumerate(zip(*self.cells))
+        ]
 
         return Matrix(
             name=f"{self.name}_transposed",
@@ -136,7 +154,7 @@ class Matrix:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Phase1Config:
     """Configuration for Phase 1 operations."""
 
@@ -150,7 +168,7 @@ class Phase1Config:
     top_p: float = 0.9  # Note: user requested "top-k 0.9" but OpenAI uses top_p
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Phase2Config:
     """Configuration for Phase 2 operations."""
 
@@ -180,4 +198,4 @@ class ChiralityConfig:
     prompt_version: str = "v1"
 
     # Model pricing (per-token; centralized from pricing module)
-    model_pricing: Dict[str, Dict[str, float]] = field(default_factory=get_model_pricing)
+    model_pricing: Dict[str, Dict[str, float]] = field(default_factory=get_model_pricing_copy)
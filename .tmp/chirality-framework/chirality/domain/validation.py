@@ -4,6 +4,7 @@ Validation rules for Chirality Framework v16.0.0 semantic structures.
 Enforces dimensional constraints and operation sequencing.
 """
 
+from collections.abc import Mapping
 from typing import List
 from .types import Cell, Matrix
 
@@ -21,7 +22,7 @@ def validate_cell(cell: Cell) -> List[str]:
     Checks only fields that actually exist on Cell:
     - row/col are non-negative integers
     - value is a non-empty string
-    - provenance is a dict (may be empty)
+    - provenance is a dict or read-only mapping (may be empty)
     """
     errors: List[str] = []
 
@@ -36,7 +37,7 @@ def validate_cell(cell: Cell) -> List[str]:
         errors.append("Cell value must be a non-empty string")
 
     # provenance
-    if not isinstance(cell.provenance, dict):
+    if not isinstance(cell.provenance, Mapping):
         errors.append("Cell provenance must be a dict")
 
     return errors
@@ -50,6 +51,8 @@ def validate_matrix(matrix: Matrix) -> List[str]:
     - name (str), station (str)
     - row_labels/col_labels length matches cells grid
     - cells 2D list shape consistency
+    - each cell (validate_cell's checks), its position and uniqueness,
+      once the cells grid is well formed
     """
     errors: List[str] = []
 
@@ -74,14 +77,17 @@ def validate_matrix(matrix: Matrix) -> List[str]:
         errors.append(f"Invalid dimensions: {matrix.shape}")
 
     # Cells grid
-    if not isinstance(matrix.cells, list) or len(matrix.cells) != rows:
+    cells = matrix.cells
+    grid_ok = isinstance(cells, (list, tuple)) and len(cells) == rows
+    if not grid_ok:
         errors.append("cells must be a 2D list with len == number of rows")
     else:
-        for r, row in enumerate(matrix.cells):
-            if not isinstance(row, list) or len(row) != cols:
+        for r, row in enumerate(cells):
+            if not isinstance(row, (list, tuple)) or len(row) != cols:
                 errors.append(
-                    f"row {r} length mismatch: expected {cols}, got {len(row) if isinstance(row, list) else 'not a list'}"
+                    f"row {r} length mismatch: expected {cols}, got {len(row) if isinstance(row, (list, tuple)) else 'not a list'}"
                 )
+                grid_ok = False
                 break
 
     # Label vs shape coherence
@@ -90,32 +96,57 @@ def validate_matrix(matrix: Matrix) -> List[str]:
     if isinstance(matrix.col_labels, list) and len(matrix.col_labels) != cols:
         errors.append("col_labels length does not match number of columns")
 
-    # Validate cells in 2D structure
-    cell_positions = set()
-    for i, row in enumerate(matrix.cells):
-        if not isinstance(row, list):
-            errors.append(f"Row {i} is not a list")
-            continue
+    # Per-cell checks need a well-formed grid
+    if not grid_ok:
+        return errors
+
+    # Validate cells in one pass (validate_cell's checks inlined, builtins bound
+    # locally); positions claimed so far are a rows*cols bitmap
+    _isinstance, _int, _str, _Mapping = isinstance, int, str, Mapping
+    claimed = bytearray(rows * cols)
+    stray_positions = set()
+    for i, row in enumerate(cells):
         for j, cell in enumerate(row):
+            r, c = cell.row, cell.col
+
             # Validate individual cell
-            cell_errors = validate_cell(cell)
-            errors.extend([f"Cell ({i},{j}): {e}" for e in cell_errors])
+            if not _isinstance(r, _int) or r < 0:
+                errors.append(f"Cell ({i},{j}): Invalid row position: {r}")
+            if not _isinstance(c, _int) or c < 0:
+                errors.append(f"Cell ({i},{j}): Invalid column position: {c}")
+            value = cell.value
+            if not _isinstance(value, _str) or not value.strip():
+                errors.append(f"Cell ({i},{j}): Cell value must be a non-empty string")
+            if not _isinstance(cell.provenance, _Mapping):
+                errors.append(f"Cell ({i},{j}): Cell provenance must be a dict")
+
+            if r == i and c == j:
+                # In bounds by construction; only a mis-positioned earlier cell
+                # can have claimed this position already
+                slot = i * cols + j
+                if claimed[slot]:
+                    errors.append(f"Duplicate cell at position {(r, c)}")
+                claimed[slot] = 1
+                continue
 
             # Check that cell position matches its array indices
-            if cell.row != i or cell.col != j:
-                errors.append(
-                    f"Cell at [{i}][{j}] has mismatched position: ({cell.row}, {cell.col})"
-                )
+            errors.append(f"Cell at [{i}][{j}] has mismatched position: ({r}, {c})")
 
-            # Check bounds (redundant but thorough)
-            if cell.row >= rows or cell.col >= cols:
-                errors.append(f"Cell ({i},{j}) out of bounds: ({cell.row}, {cell.col})")
+            # Check bounds
+            if r >= rows or c >= cols:
+                errors.append(f"Cell ({i},{j}) out of bounds: ({r}, {c})")
 
             # Check duplicates
-            pos = (cell.row, cell.col)
-            if pos in cell_positions:
-                errors.append(f"Duplicate cell at position {pos}")
-            cell_positions.add(pos)
+            pos = (r, c)
+            if _isinstance(r, _int) and _isinstance(c, _int) and 0 <= r < rows and 0 <= c < cols:
+                slot = r * cols + c
+                if claimed[slot]:
+                    errors.append(f"Duplicate cell at position {pos}")
+                claimed[slot] = 1
+            else:
+                if pos in stray_positions:
+                    errors.append(f"Duplicate cell at position {pos}")
+                stray_positions.add(pos)
 
     return errors
 
@@ -8,6 +8,32 @@ Per colleague_1's D2-4 specification:
 Enforces Responses API usage and external parameter control throughout the framework.
 """
 
+import sys
+
+
+# Decoding parameters that must come from configuration, never from code/tests
+FORBIDDEN_DECODING_PARAMS = frozenset({
+    'temperature', 'top_p', 'top_k', 'frequency_penalty',
+    'presence_penalty', 'repetition_penalty', 'min_p',
+    'typical_p', 'entropy_cutoff', 'rep_pen'
+})
+
+# Modules whose presence means a Chat Completions/legacy Completions import
+FORBIDDEN_MODULES = ("openai.chat", "openai.Completion")
+
+# SDK-documented allow-list for Responses API per OpenAI docs
+# Note: 'model' deliberately excluded - adapter controls model selection
+ALLOWED_RESPONSES_PARAMS = frozenset({
+    # Core parameters
+    'instructions', 'input',
+    # Optional control parameters
+    'temperature', 'top_p', 'max_output_tokens',
+    'seed', 'reasoning', 'text', 'response_format',
+    'store', 'metadata', 'verbosity',
+    # Framework control parameters
+    'expects_json'  # Controls JSON format application
+})
+
 
 class APIGuardError(Exception):
     """Raised when forbidden API is used."""
@@ -52,16 +78,11 @@ def no_decoding_overrides(func_name: str, **kwargs):
     Raises:
         DecodingOverrideError: If forbidden parameters are detected
     """
-    forbidden_params = {
-        'temperature', 'top_p', 'top_k', 'frequency_penalty', 
-        'presence_penalty', 'repetition_penalty', 'min_p',
-        'typical_p', 'entropy_cutoff', 'rep_pen'
-    }
-    
-    detected_params = []
-    for param in forbidden_params:
-        if param in kwargs and kwargs[param] is not None:
-            detected_params.append(param)
+    # dict_keys supports set operations directly, so no copy of kwargs is made
+    detected_params = sorted(
+        param for param in kwargs.keys() & FORBIDDEN_DECODING_PARAMS
+        if kwargs[param] is not None
+    )
     
     if detected_params:
         raise DecodingOverrideError(
@@ -85,23 +106,21 @@ def require_responses_api():
         def my_llm_function():
             # Must use client.responses.create(input=...)
             pass
+
+    Forbidden modules are checked once, when the function is decorated, and
+    the function is returned unwrapped; calls made at runtime are covered by
+    install_chat_completions_guard().
     """
 
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            # Check for forbidden imports/calls during runtime
-            import sys
-
-            forbidden_modules = ["openai.chat", "openai.Completion"]
-            for module_name in forbidden_modules:
-                if module_name in sys.modules:
-                    raise APIGuardError(
-                        f"Forbidden module {module_name} detected. "
-                        "Only Responses API is allowed."
-                    )
-            return func(*args, **kwargs)
-
-        return wrapper
+        # Check for forbidden imports at decoration time
+        for module_name in FORBIDDEN_MODULES:
+            if module_name in sys.modules:
+                raise APIGuardError(
+                    f"Forbidden module {module_name} detected. "
+                    "Only Responses API is allowed."
+                )
+        return func
 
     return decorator
 
@@ -160,25 +179,12 @@ def guard_llm_call(func_name: str, **kwargs):
     Raises:
         ValueError: If forbidden or unknown parameters detected
     """
-    # SDK-documented allow-list for Responses API per OpenAI docs
-    # Note: 'model' deliberately excluded - adapter controls model selection
-    allowed_params = {
-        # Core parameters
-        'instructions', 'input',
-        # Optional control parameters  
-        'temperature', 'top_p', 'max_output_tokens',
-        'seed', 'reasoning', 'text', 'response_format',
-        'store', 'metadata', 'verbosity',
-        # Framework control parameters
-        'expects_json'  # Controls JSON format application
-    }
-    
     # Check for unknown parameters
-    unknown_params = set(kwargs.keys()) - allowed_params
+    unknown_params = kwargs.keys() - ALLOWED_RESPONSES_PARAMS
     if unknown_params:
         raise ValueError(
             f"Unknown parameters in {func_name}: {sorted(unknown_params)}. "
-            f"Allowed: {sorted(allowed_params)}. "
+            f"Allowed: {sorted(ALLOWED_RESPONSES_PARAMS)}. "
             f"This maintains SDK compatibility per colleague_1's architecture."
         )
     
@@ -2,20 +2,44 @@
 Caching system for Phase 2 tensor cell computations.
 
 Two-layer caching:
-1. In-memory cache for current run
-2. On-disk cache for cross-run persistence
+1. In-memory LRU cache for current run (bounded)
+2. On-disk SQLite store (one database file) for cross-run persistence
 """
 
 import json
 import hashlib
 import time
 import os
+import sqlite3
 import tempfile
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, Hashable, List, Optional, Tuple
 from pathlib import Path
 import threading
+from collections import OrderedDict
 import sys
 
+from ..lib import jsonio
+
+
+# Bump when cache key derivation changes so stale entries are never matched
+CACHE_KEY_VERSION = "v2"
+
+# Single database file holding every persisted cell, inside CellCache.cache_dir
+DB_FILENAME = "cells.db"
+
+# Bound on memoized operand hashes; the memo is reset when it fills
+OPERANDS_MEMO_MAX_ENTRIES = 65_536
+
+
+def content_digest(text: str) -> str:
+    """
+    Hash text for cache identity.
+
+    Keys are content addresses, not security boundaries, so 128-bit BLAKE2b
+    is used in place of SHA-256.
+    """
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
 
 class CellCache:
     """
@@ -29,22 +53,45 @@ class CellCache:
     - Model and inference parameters
     """
 
-    def __init__(self, cache_dir: Path, enabled: bool = True):
+    def __init__(self, cache_dir: Path, enabled: bool = True, max_memory_entries: int = 10_000):
         """
         Initialize cell cache.
 
         Args:
-            cache_dir: Directory for persistent cache files
+            cache_dir: Directory holding the persistent cache database
             enabled: Whether caching is enabled
+            max_memory_entries: Size bound of the in-memory LRU layer
         """
         self.cache_dir = Path(cache_dir)
         self.enabled = enabled
+        self.max_memory_entries = max_memory_entries
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # In-memory cache for current run
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        # In-memory LRU cache for current run
+        self._memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._lock = threading.Lock()
 
+        # Operand hashes by caller-supplied operands_key (see compute_operands_hash)
+        self._operands_memo: Dict[Hashable, str] = {}
+
+        # Keys known to be on disk (set by scan()); None = unknown, probe the store
+        self._disk_index: Optional[set] = None
+
+        # One connection shared by all threads; sqlite3 calls are serialized by _db_lock
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if enabled:
+            self._db = self._open_db(self.cache_dir / DB_FILENAME)
+
+    @staticmethod
+    def _open_db(db_path: Path) -> sqlite3.Connection:
+        """Open (creating if needed) the cell store in WAL mode."""
+        db = sqlite3.connect(db_path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS cells (k TEXT PRIMARY KEY, v BLOB NOT NULL)")
+        return db
+
     def compute_cache_key(
         self,
         tensor_name: str,
@@ -80,17 +127,57 @@ class CellCache:
             max_tokens: Maximum tokens setting
 
         Returns:
-            SHA256 hash as cache key
+            Content digest as cache key
         """
-        indices_str = "_".join(map(str, indices))
-
-        # Core parameters that affect computation
-        cache_parts = [
-            tensor_name,
-            indices_str,
-            operands_hash,
-            lens_id,
-            snapshot_hash,
+        key_builder = self.make_key_builder(
+            tensor_name=tensor_name,
+            model=model,
+            temperature=temperature,
+            top_p=top_p,
+            kernel_hash=kernel_hash,
+            lens_catalog_digest=lens_catalog_digest,
+            verbosity=verbosity,
+            reasoning_effort=reasoning_effort,
+            max_tokens=max_tokens,
+        )
+        return key_builder(indices, operands_hash, lens_id, snapshot_hash)
+
+    def make_key_builder(
+        self,
+        tensor_name: str,
+        model: str,
+        temperature: float = 0.2,
+        top_p: float = 1.0,
+        kernel_hash: str = "unknown",
+        lens_catalog_digest: str = "none",
+        verbosity: Optional[str] = None,
+        reasoning_effort: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Callable[[Tuple[int, ...], str, str, str], str]:
+        """
+        Build a cache key function for the cells of one tensor.
+
+        The parameters shared by every cell are hashed once; the returned
+        builder(indices, operands_hash, lens_id, snapshot_hash) clones that
+        primed hasher and feeds only the per-cell parts. Keys are identical
+        to compute_cache_key's.
+
+        Args:
+            tensor_name: Name of tensor (M, W, U, N)
+            model: LLM model identifier
+            temperature: Sampling temperature
+            top_p: Nucleus sampling parameter
+            kernel_hash: Kernel hash from prompt assets
+            lens_catalog_digest: Hash of lens catalog
+            verbosity: GPT-5 verbosity setting
+            reasoning_effort: GPT-5 reasoning effort
+            max_tokens: Maximum tokens setting
+
+        Returns:
+            Function computing the content digest cache key of a cell
+        """
+        # Parameters that affect computation, after the per-cell parts
+        suffix_parts = [
             kernel_hash,
             lens_catalog_digest,
             model,
@@ -100,14 +187,25 @@ class CellCache:
 
         # Add optional GPT-5 parameters if present
         if verbosity:
-            cache_parts.append(f"verbosity_{verbosity}")
+            suffix_parts.append(f"verbosity_{verbosity}")
         if reasoning_effort:
-            cache_parts.append(f"reasoning_{reasoning_effort}")
+            suffix_parts.append(f"reasoning_{reasoning_effort}")
         if max_tokens:
-            cache_parts.append(f"max_tokens_{max_tokens}")
+            suffix_parts.append(f"max_tokens_{max_tokens}")
 
-        cache_str = "|".join(cache_parts)
-        return hashlib.sha256(cache_str.encode()).hexdigest()
+        # Same byte stream content_digest hashes for the joined key parts
+        prefix = hashlib.blake2b(f"{CACHE_KEY_VERSION}|{tensor_name}|".encode(), digest_size=16)
+        suffix = ("|" + "|".join(suffix_parts)).encode()
+
+        def build(indices: Tuple[int, ...], operands_hash: str, lens_id: str, snapshot_hash: str) -> str:
+            hasher = prefix.copy()
+            hasher.update(
+                f"{'_'.join(map(str, indices))}|{operands_hash}|{lens_id}|{snapshot_hash}".encode()
+            )
+            hasher.update(suffix)
+            return hasher.hexdigest()
+
+        return build
 
     def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
@@ -125,25 +223,32 @@ class CellCache:
         # Check in-memory cache first
         with self._lock:
             if cache_key in self._memory_cache:
+                self._memory_cache.move_to_end(cache_key)
                 return self._memory_cache[cache_key]
 
-        # Check on-disk cache
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r") as f:
-                    result = json.load(f)
+        # Check on-disk store (the scanned index answers misses without a query)
+        if self._disk_index is not None and cache_key not in self._disk_index:
+            return None
+        try:
+            with self._db_lock:
+                row = self._db.execute("SELECT v FROM cells WHERE k = ?", (cache_key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to read cache entry {cache_key}: {e}", file=sys.stderr)
+            return None
+        if row is None:
+            return None
 
-                # Load into memory cache
-                with self._lock:
-                    self._memory_cache[cache_key] = result
+        try:
+            result = jsonio.loads(row[0])
+        except ValueError:
+            # Corrupted entry, remove it
+            self._delete(cache_key)
+            return None
 
-                return result
-            except (json.JSONDecodeError, FileNotFoundError):
-                # Corrupted cache file, remove it
-                cache_file.unlink(missing_ok=True)
+        # Load into memory cache
+        self._remember(cache_key, result)
 
-        return None
+        return result
 
     def put(self, cache_key: str, result: Dict[str, Any]):
         """
@@ -157,31 +262,82 @@ class CellCache:
             return
 
         # Store in memory cache
-        with self._lock:
-            self._memory_cache[cache_key] = result
+        self._remember(cache_key, result)
 
         # Store on disk
-        cache_file = self.cache_dir / f"{cache_key}.json"
         try:
-            with open(cache_file, "w") as f:
-                json.dump(result, f, indent=2)
+            data = jsonio.dumps_bytes(result)
+            with self._db_lock, self._db:
+                self._db.execute("INSERT OR REPLACE INTO cells (k, v) VALUES (?, ?)", (cache_key, data))
+            if self._disk_index is not None:
+                with self._lock:
+                    self._disk_index.add(cache_key)
         except Exception as e:
             # Log error but don't fail the computation
-            print(f"Warning: Failed to write cache file {cache_file}: {e}", file=sys.stderr)
+            print(f"Warning: Failed to write cache entry {cache_key}: {e}", file=sys.stderr)
+
+    def scan(self):
+        """
+        Index the keys present on disk with a single key scan of the store.
 
-    def compute_operands_hash(self, operands: Dict[str, Any]) -> str:
+        Afterwards get() answers keys absent from the index without querying
+        the database; put() keeps the index current.
+        """
+        if not self.enabled:
+            return
+        with self._db_lock:
+            keys = {k for (k,) in self._db.execute("SELECT k FROM cells")}
+        with self._lock:
+            self._disk_index = keys
+
+    def _delete(self, cache_key: str):
+        """Remove a stored entry and drop it from the disk index."""
+        try:
+            with self._db_lock, self._db:
+                self._db.execute("DELETE FROM cells WHERE k = ?", (cache_key,))
+        except sqlite3.Error:
+            pass
+        if self._disk_index is not None:
+            with self._lock:
+                self._disk_index.discard(cache_key)
+
+    def _remember(self, cache_key: str, result: Dict[str, Any]):
+        """Insert into the memory layer, evicting least recently used entries."""
+        with self._lock:
+            self._memory_cache[cache_key] = result
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self.max_memory_entries:
+                self._memory_cache.popitem(last=False)
+
+    def compute_operands_hash(
+        self, operands: Dict[str, Any], operands_key: Optional[Hashable] = None
+    ) -> str:
         """
         Compute hash of operands for cache key.
 
         Args:
             operands: Dictionary of operand values
+            operands_key: Optional hashable identity of operands (equal keys must
+                mean equal operands); hashes are memoized under it so operands
+                shared by many cells are serialized once
 
         Returns:
-            SHA256 hash of operands
+            Content digest of operands
         """
+        if operands_key is not None:
+            operands_hash = self._operands_memo.get(operands_key)
+            if operands_hash is not None:
+                return operands_hash
+
         # Sort keys for deterministic hash
         operands_str = json.dumps(operands, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(operands_str.encode()).hexdigest()
+        operands_hash = content_digest(operands_str)
+
+        if operands_key is not None:
+            if len(self._operands_memo) >= OPERANDS_MEMO_MAX_ENTRIES:
+                self._operands_memo.clear()
+            self._operands_memo[operands_key] = operands_hash
+        return operands_hash
 
     def clear_memory_cache(self):
         """Clear in-memory cache (keep disk cache)."""
@@ -192,13 +348,19 @@ class CellCache:
         """Clear both memory and disk cache."""
         self.clear_memory_cache()
 
-        # Remove all cache files
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
+        # Remove all stored entries
+        if self._db is not None:
+            with self._db_lock, self._db:
+                self._db.execute("DELETE FROM cells")
+        with self._lock:
+            self._disk_index = None
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        disk_files = len(list(self.cache_dir.glob("*.json")))
+        disk_entries = 0
+        if self._db is not None:
+            with self._db_lock:
+                (disk_entries,) = self._db.execute("SELECT COUNT(*) FROM cells").fetchone()
 
         with self._lock:
             memory_entries = len(self._memory_cache)
@@ -207,9 +369,17 @@ class CellCache:
             "enabled": self.enabled,
             "cache_dir": str(self.cache_dir),
             "memory_entries": memory_entries,
-            "disk_files": disk_files,
+            "disk_entries": disk_entries,
         }
 
+    def close(self):
+        """Close the disk store; the cache behaves as disabled afterwards."""
+        self.enabled = False
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+                self._db = None
+
 
 class ResumableRunner:
     """
@@ -218,29 +388,37 @@ class ResumableRunner:
     Tracks completed cells via:
     - run_manifest.json: Overall progress and metadata
     - cell_traces/: Individual cell results
+
+    Cell traces are group-committed: each is written to a temporary file and
+    becomes visible only when flush() syncs the batch and renames it into place.
     """
 
-    def __init__(self, artifacts_dir: Path):
+    def __init__(self, artifacts_dir: Path, commit_batch_size: int = 64):
         """
         Initialize resumable runner.
 
         Args:
             artifacts_dir: Artifacts directory for the run
+            commit_batch_size: Cell traces buffered before an automatic flush()
         """
         self.artifacts_dir = Path(artifacts_dir)
         self.manifest_path = self.artifacts_dir / "run_manifest.json"
         self.cell_traces_dir = self.artifacts_dir / "cell_traces"
+        self.commit_batch_size = max(1, commit_batch_size)
 
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
         self.cell_traces_dir.mkdir(parents=True, exist_ok=True)
 
+        # Written but uncommitted cell traces: (temporary path, final path)
+        self._pending: List[Tuple[str, Path]] = []
+        self._pending_lock = threading.Lock()
+
     def load_manifest(self) -> Dict[str, Any]:
         """Load run manifest or create empty one."""
         if self.manifest_path.exists():
             try:
-                with open(self.manifest_path, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
+                return jsonio.loads(self.manifest_path.read_bytes())
+            except (ValueError, FileNotFoundError):
                 pass
 
         # Create empty manifest
@@ -260,13 +438,13 @@ class ResumableRunner:
         """Save run manifest atomically."""
         # Atomic write using temporary file + rename
         with tempfile.NamedTemporaryFile(
-            mode="w",
+            mode="wb",
             dir=self.artifacts_dir,
             prefix=f".{self.manifest_path.name}_",
             suffix=".tmp",
             delete=False,
         ) as tmp_file:
-            json.dump(manifest, tmp_file, indent=2)
+            tmp_file.write(jsonio.dumps_bytes(manifest))
             tmp_file.flush()
             os.fsync(tmp_file.fileno())  # Force write to disk
             tmp_path = tmp_file.name
@@ -287,25 +465,21 @@ class ResumableRunner:
         completed = set()
         tensor_dir = self.cell_traces_dir / tensor_name
 
-        if tensor_dir.exists():
-            for cell_file in tensor_dir.glob("*.json"):
-                # Skip temporary files from atomic writes
-                if cell_file.name.startswith(".") and ".tmp" in cell_file.name:
-                    continue
-
-                # Validate file is readable before including
-                try:
-                    with open(cell_file, "r") as f:
-                        json.load(f)
+        # One directory scan; entries are plain names, no Path per file
+        try:
+            entries = os.scandir(tensor_dir)
+        except FileNotFoundError:
+            return completed
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                # Skip temporary files from atomic writes; a trace only gets its
+                # final name by atomic rename, so its contents are not re-read
+                # here (load_cell_result drops any corrupted file it meets)
+                if name.endswith(".json") and not name.startswith("."):
                     # Extract cell key from filename
-                    cell_key = cell_file.stem
-                    completed.add(cell_key)
-                except (json.JSONDecodeError, FileNotFoundError, OSError):
-                    # Corrupted file, clean it up
-                    try:
-                        cell_file.unlink()
-                    except OSError:
-                        pass
+                    completed.add(name[:-5])
 
         return completed
 
@@ -329,6 +503,8 @@ class ResumableRunner:
         Save cell computation result atomically for resume capability.
 
         Uses atomic file replacement to avoid partial writes during crashes.
+        The result is committed with the next flush(), which runs automatically
+        every commit_batch_size cells; call flush() when a tensor finishes.
 
         Args:
             tensor_name: Name of tensor
@@ -350,15 +526,55 @@ class ResumableRunner:
 
         # Atomic write using temporary file + rename
         with tempfile.NamedTemporaryFile(
-            mode="w", dir=tensor_dir, prefix=f".{cell_file.name}_", suffix=".tmp", delete=False
+            mode="wb", dir=tensor_dir, prefix=f".{cell_file.name}_", suffix=".tmp", delete=False
         ) as tmp_file:
-            json.dump(cell_data, tmp_file, indent=2)
-            tmp_file.flush()
-            os.fsync(tmp_file.fileno())  # Force write to disk
+            tmp_file.write(jsonio.dumps_bytes(cell_data))
             tmp_path = tmp_file.name
 
+        with self._pending_lock:
+            self._pending.append((tmp_path, cell_file))
+            batch_full = len(self._pending) >= self.commit_batch_size
+        if batch_full:
+            self.flush()
+
+    def flush(self):
+        """
+        Commit pending cell traces as one group.
+
+        Every pending file is synced, then renamed into place, then each
+        affected directory is synced once, so the whole batch shares a
+        single directory flush instead of paying one per cell.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        for tmp_path, _ in pending:
+            fd = os.open(tmp_path, os.O_RDWR)
+            try:
+                os.fsync(fd)  # Force write to disk
+            finally:
+                os.close(fd)
+
         # Atomic replace
-        os.replace(tmp_path, cell_file)
+        directories = set()
+        for tmp_path, cell_file in pending:
+            os.replace(tmp_path, cell_file)
+            directories.add(cell_file.parent)
+
+        for directory in directories:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                # Directories cannot be opened for syncing on some platforms
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
 
     def load_cell_result(
         self, tensor_name: str, indices: Tuple[int, ...]
@@ -378,10 +594,9 @@ class ResumableRunner:
 
         if cell_file.exists():
             try:
-                with open(cell_file, "r") as f:
-                    cell_data = json.load(f)
+                cell_data = jsonio.loads(cell_file.read_bytes())
                 return cell_data.get("result")
-            except (json.JSONDecodeError, FileNotFoundError):
+            except (ValueError, FileNotFoundError):
                 # Corrupted file, remove it to prevent repeated failures
                 try:
                     cell_file.unlink()
@@ -19,6 +19,7 @@ class LLMConfig:
     top_p: Optional[float] = 0.9
     max_tokens: Optional[int] = None  # Let API determine from context
     seed: Optional[int] = None  # For deterministic testing
+    max_requests_per_minute: Optional[int] = None  # Provider request limit; None = unthrottled
     response_format: Dict[str, Any] = field(default_factory=lambda: {"type": "json_object"})
 
 
@@ -60,6 +61,7 @@ def create_default_config() -> LLMConfig:
         CHIRALITY_TOP_P: Top-p value (default: 0.9)
         CHIRALITY_MAX_TOKENS: Max tokens (default: None)
         CHIRALITY_SEED: Random seed (default: None)
+        CHIRALITY_MAX_RPM: Requests per minute allowed by the account (default: None)
 
     Returns:
         LLMConfig with environment-based or default values
@@ -70,6 +72,7 @@ def create_default_config() -> LLMConfig:
         top_p=float(os.getenv("CHIRALITY_TOP_P", "0.9")),
         max_tokens=_parse_optional_int(os.getenv("CHIRALITY_MAX_TOKENS")),
         seed=_parse_optional_int(os.getenv("CHIRALITY_SEED")),
+        max_requests_per_minute=_parse_optional_int(os.getenv("CHIRALITY_MAX_RPM")),
     )
 
 
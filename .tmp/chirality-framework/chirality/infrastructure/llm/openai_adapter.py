@@ -8,6 +8,7 @@ Enforces JSON output format and global configuration.
 import os
 import time
 import random
+import threading
 from typing import Dict, Any, List, Tuple, Optional
 
 try:
@@ -20,10 +21,112 @@ except ImportError:
     APIConnectionError = Exception
     APIError = Exception
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 on the raw Responses path)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
 from .config import get_config
+from ...lib import jsonio
 from ..api.guards import guard_llm_call, install_all_guards
 
 
+# Chat Completions parameters rejected by the Responses-only entry points
+_CHAT_COMPLETIONS_PARAMS = frozenset({
+    'messages', 'message', 'role', 'content', 'system', 'user', 'assistant',
+    'max_tokens', 'max_completion_tokens', 'function_call', 'functions',
+    'chat', 'completions', 'stream', 'stream_options'
+})
+
+
+class _RequestRateLimiter:
+    """
+    Thread-safe token bucket shared by every caller of the client.
+
+    Paces dispatch to the account's request limit so concurrent workers do not
+    burst into 429s. The rate is halved when the provider rate-limits us (at
+    most once per cooldown window, since concurrent workers report the same
+    429 burst) and recovers additively on each success, up to the configured
+    ceiling. With no configured limit the bucket only engages after the
+    first 429.
+    """
+
+    _MIN_RPM = 6.0
+    _DEFAULT_RPM = 60.0
+    # Minimum spacing between two rate cuts, in seconds
+    _COOLDOWN = 5.0
+
+    def __init__(self, max_rpm: Optional[int] = None):
+        self._ceiling = float(max_rpm) if max_rpm else None
+        self._rpm = self._ceiling
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._cut_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be dispatched."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._rpm is None:
+                        return
+                    rate = self._rpm / 60.0
+                    self._tokens = min(1.0, self._tokens + (now - self._updated) * rate)
+                    self._updated = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait = (1.0 - self._tokens) / rate
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Creep back toward the ceiling after a successful call."""
+        with self._lock:
+            if self._rpm is not None and (self._ceiling is None or self._rpm < self._ceiling):
+                self._rpm += 1.0
+                if self._ceiling is not None:
+                    self._rpm = min(self._rpm, self._ceiling)
+
+    def on_rate_limited(self, retry_after: Optional[float]) -> None:
+        """Halve the rate and pause all callers for the provider's retry window."""
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if now < self._cut_until:
+                # Same burst as the last cut: the rate already reflects it
+                return
+            if self._rpm is None:
+                # First 429 without a configured limit: start from a
+                # conservative default
+                self._rpm = self._DEFAULT_RPM
+            self._rpm = max(self._MIN_RPM, self._rpm / 2.0)
+            self._tokens = 0.0
+            self._updated = now
+            self._cut_until = now + max(retry_after or 0.0, self._COOLDOWN)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Read the Retry-After header from a 429, when present."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
 class LLMClient:
     """
     Wrapper for OpenAI Responses API.
@@ -55,6 +158,7 @@ class LLMClient:
 
         self.client = OpenAI(api_key=api_key)
         self._rf_probed = False
+        self._rate_limiter = _RequestRateLimiter(get_config().max_requests_per_minute)
 
     def _probe_response_format_support(self) -> None:
         # No-op: rely on pinned SDK in the environment; no runtime probing
@@ -93,38 +197,34 @@ class LLMClient:
                     # Standard timeouts for other models: 30s, 40s, 50s, 60s
                     timeout = 30.0 + (attempt * 10.0)
                 
-                # Temporarily set timeout on client
-                original_timeout = getattr(self.client, 'timeout', None)
-                self.client.timeout = timeout
+                # Log timeout info for reasoning models
+                if attempt == 0 and is_reasoning_model:
+                    print(f"🧠 Reasoning model {model_name} using extended timeout: {timeout}s", file=__import__('sys').stderr)
+                elif attempt == 0:
+                    print(f"⚡ Standard model {model_name} using timeout: {timeout}s", file=__import__('sys').stderr)
                 
-                try:
-                    # Log timeout info for reasoning models
-                    if attempt == 0 and is_reasoning_model:
-                        print(f"🧠 Reasoning model {model_name} using extended timeout: {timeout}s", file=__import__('sys').stderr)
-                    elif attempt == 0:
-                        print(f"⚡ Standard model {model_name} using timeout: {timeout}s", file=__import__('sys').stderr)
-                    
-                    # Make the API call
-                    response = self.client.responses.create(**api_params)
-                    
-                    # Success - log latency only in traces (not transcript)
-                    if attempt > 0:
-                        print(f"📡 API success after {attempt} retries", file=__import__('sys').stderr)
-                    
-                    return response
-                    
-                finally:
-                    # Restore original timeout
-                    if original_timeout is not None:
-                        self.client.timeout = original_timeout
+                # Make the API call. The timeout is a per-request option rather than
+                # a mutation of the shared client, which concurrent callers reuse
+                self._rate_limiter.acquire()
+                response = self.client.responses.create(**api_params, timeout=timeout)
+                self._rate_limiter.on_success()
+                
+                # Success - log latency only in traces (not transcript)
+                if attempt > 0:
+                    print(f"📡 API success after {attempt} retries", file=__import__('sys').stderr)
+                
+                return response
                     
             except RateLimitError as e:
                 last_exception = e
                 if attempt == max_retries:
                     break
                     
-                # Exponential backoff with jitter for rate limits
-                backoff_time = (2 ** attempt) + random.uniform(0, 1)
+                # Slow every caller down, then back off this one; the provider's
+                # Retry-After wins over the exponential schedule when given
+                retry_after = _retry_after(e)
+                self._rate_limiter.on_rate_limited(retry_after)
+                backoff_time = retry_after or (2 ** attempt) + random.uniform(0, 1)
                 print(f"⏱️  Rate limit hit, retrying in {backoff_time:.1f}s (attempt {attempt + 1}/{max_retries + 1})", 
                       file=__import__('sys').stderr)
                 time.sleep(backoff_time)
@@ -328,7 +428,7 @@ class LLMClient:
                 # Parse JSON response
                 import json
 
-                response_dict = json.loads(content)
+                response_dict = jsonio.loads(content)
 
             except (json.JSONDecodeError, AttributeError, IndexError) as e:
                 # Provide truncated response for debugging
@@ -410,7 +510,7 @@ class LLMClient:
         # Parse JSON with clear error handling
         if response_format and response_format.get("type") in ["json_object", "json_schema"]:
             try:
-                response_dict = json.loads(output_text) if output_text else {}
+                response_dict = jsonio.loads(output_text) if output_text else {}
             except json.JSONDecodeError as e:
                 # Log raw payload for debugging per colleague_1's guidance
                 response_dict = {
@@ -449,27 +549,25 @@ class LLMClient:
         }
 
         def _do_post():
-            try:
-                import httpx
-                with httpx.Client(timeout=httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0)) as client:
-                    return client.post("https://api.openai.com/v1/responses", headers=headers, json=payload)
-            except ModuleNotFoundError:
-                # Fallback to stdlib
-                import json as _json
-                import urllib.request
-                req = urllib.request.Request(
-                    url="https://api.openai.com/v1/responses",
-                    data=_json.dumps(payload).encode("utf-8"),
-                    headers=headers,
-                    method="POST",
-                )
-                with urllib.request.urlopen(req, timeout=70) as resp:
-                    class _Resp:
-                        status_code = resp.status
-                        text = resp.read().decode("utf-8")
-                        def json(self):
-                            return _json.loads(self.text)
-                    return _Resp()
+            http_client = _get_http_client()
+            if http_client is not None:
+                return http_client.post("https://api.openai.com/v1/responses", headers=headers, json=payload)
+            # Fallback to stdlib when httpx is not installed
+            import json as _json
+            import urllib.request
+            req = urllib.request.Request(
+                url="https://api.openai.com/v1/responses",
+                data=_json.dumps(payload).encode("utf-8"),
+                headers=headers,
+                method="POST",
+            )
+            with urllib.request.urlopen(req, timeout=70) as resp:
+                class _Resp:
+                    status_code = resp.status
+                    text = resp.read().decode("utf-8")
+                    def json(self):
+                        return _json.loads(self.text)
+                return _Resp()
 
         # One retry on 5xx with jitter
         r = _do_post()
@@ -546,14 +644,8 @@ class LLMClient:
             ValueError: If forbidden Chat Completions parameters are provided
         """
         # Self-policing: Check for forbidden Chat Completions parameters
-        forbidden_params = {
-            'messages', 'message', 'role', 'content', 'system', 'user', 'assistant',
-            'max_tokens', 'max_completion_tokens', 'function_call', 'functions',
-            'chat', 'completions', 'stream', 'stream_options'
-        }
-        
         for param in kwargs:
-            if param in forbidden_params:
+            if param in _CHAT_COMPLETIONS_PARAMS:
                 raise ValueError(
                     f"Forbidden Chat Completions parameter '{param}' detected in LLMClient. "
                     f"Chirality Framework requires Responses API with instructions+input format only."
@@ -738,15 +830,41 @@ class LLMClient:
             }
 
 
-# Global client instance
+# Pooled HTTP client for the raw Responses path, so retries and concurrent
+# callers reuse open TLS connections instead of handshaking per request
+_http_client: Optional["httpx.Client"] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> Optional["httpx.Client"]:
+    """Get the shared raw-path HTTP client (None when httpx is unavailable)."""
+    global _http_client
+    if httpx is None:
+        return None
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    http2=_HTTP2,
+                    timeout=httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0),
+                    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+                )
+    return _http_client
+
+
+# Global client instance - one SDK client (and its keep-alive connection pool)
+# shared by every caller, including concurrent Phase 2 cell workers
 _client: Optional[LLMClient] = None
+_client_lock = threading.Lock()
 
 
 def get_client() -> LLMClient:
     """Get global LLM client instance."""
     global _client
     if _client is None:
-        _client = LLMClient()
+        with _client_lock:
+            if _client is None:
+                _client = LLMClient()
     return _client
 
 
@@ -808,14 +926,8 @@ def call_responses(
         ValueError: If forbidden Chat Completions parameters are provided
     """
     # Self-policing: Check for forbidden Chat Completions parameters
-    forbidden_params = {
-        'messages', 'message', 'role', 'content', 'system', 'user', 'assistant',
-        'max_tokens', 'max_completion_tokens', 'function_call', 'functions',
-        'chat', 'completions', 'stream', 'stream_options'
-    }
-    
     for param in kwargs:
-        if param in forbidden_params:
+        if param in _CHAT_COMPLETIONS_PARAMS:
             raise ValueError(
                 f"Forbidden Chat Completions parameter '{param}' detected. "
                 f"Chirality Framework requires Responses API with instructions+input format only. "
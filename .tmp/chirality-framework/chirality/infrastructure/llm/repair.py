@@ -6,8 +6,46 @@ Used by both dialogue runner and cell runner.
 """
 
 import json
+import re
 from typing import Dict, Any, List, Callable, Optional, Tuple
 
+from ...lib import jsonio
+
+# Fenced code block (```json ... ``` or ``` ... ```)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+# Trailing comma before a closing brace/bracket
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
+def _local_json_fix(content: str) -> Optional[Any]:
+    """
+    Recover almost-valid JSON locally, without another LLM round-trip.
+
+    Applies cheap fixes in order: strip markdown fences, trim prose around
+    the outermost JSON object, then drop trailing commas. Returns the parsed
+    value, or None if the content still does not parse.
+    """
+    if not content:
+        return None
+
+    candidate = content.strip()
+    fence = _FENCE_RE.search(candidate)
+    if fence:
+        candidate = fence.group(1).strip()
+
+    start = candidate.find("{")
+    end = candidate.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    candidate = candidate[start : end + 1]
+
+    for attempt in (candidate, _TRAILING_COMMA_RE.sub(r"\1", candidate)):
+        try:
+            return jsonio.loads(attempt)
+        except json.JSONDecodeError:
+            continue
+    return None
+
 
 def try_parse_json_or_repair(
     messages: List[Dict[str, str]] = None,
@@ -16,6 +54,7 @@ def try_parse_json_or_repair(
     max_repair_attempts: int = 1,
     instructions: str = None,
     input_text: str = None,
+    validate: Optional[Callable[[Dict[str, Any]], Tuple[bool, str]]] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Attempt to parse JSON, with repair pass if needed.
@@ -28,6 +67,8 @@ def try_parse_json_or_repair(
                      - {"content": "...json string..."} (legacy/raw)
         schema_hint: Optional schema hint for repair prompt
         max_repair_attempts: Maximum repair attempts
+        validate: Optional (obj) -> (ok, reason) check replacing the built-in
+                  artifact-based validation, for payloads without an artifact key
 
     Returns:
         Tuple of (parsed_json, metadata)
@@ -76,6 +117,10 @@ def try_parse_json_or_repair(
         
         return False, f"unknown artifact '{art}'"
 
+    if validate is None:
+        def validate(obj: Dict[str, Any]) -> Tuple[bool, str]:
+            return _basic_validate(obj, schema_hint)
+
     # First attempt - support both formats
     if instructions is not None and input_text is not None:
         # New format: use instructions + input
@@ -86,7 +131,7 @@ def try_parse_json_or_repair(
 
     # If adapter already returned parsed JSON, validate before accepting.
     if isinstance(response, dict) and "content" not in response and "text" not in response:
-        ok, why = _basic_validate(response, schema_hint)
+        ok, why = validate(response)
         if ok:
             return response, metadata
         # Fall through to repair attempts using the same messages + a repair cue.
@@ -96,14 +141,20 @@ def try_parse_json_or_repair(
     content = response.get("content", response.get("text", ""))
 
     try:
-        parsed = json.loads(content)
-        ok, why = _basic_validate(parsed, schema_hint)
+        parsed = jsonio.loads(content)
+        ok, why = validate(parsed)
         if ok:
             return parsed, metadata
         # If structure wrong, proceed to repair below
         print(f"DEBUG: Parsed JSON failed basic validation ({why}); attempting repair...")
     except json.JSONDecodeError:
-        pass
+        # Almost-valid output (fences, surrounding prose, trailing commas) is
+        # fixed locally before paying for an LLM repair round-trip
+        parsed = _local_json_fix(content)
+        if parsed is not None:
+            ok, why = validate(parsed)
+            if ok:
+                return parsed, metadata
         
     # Original parse failed or validation failed, try repair
     for attempt in range(max_repair_attempts):
@@ -133,19 +184,20 @@ def try_parse_json_or_repair(
         
         # Handle parsed dict response
         if isinstance(response, dict) and "content" not in response and "text" not in response:
-            ok, why = _basic_validate(response, schema_hint)
+            ok, why = validate(response)
             if ok:
                 return response, metadata
             content = json.dumps(response)  # For error reporting
         else:
             content = response.get("content", response.get("text", ""))
             try:
-                parsed = json.loads(content)
-                ok, why = _basic_validate(parsed, schema_hint)
+                parsed = jsonio.loads(content)
+            except json.JSONDecodeError:
+                parsed = _local_json_fix(content)
+            if parsed is not None:
+                ok, why = validate(parsed)
                 if ok:
                     return parsed, metadata
-            except json.JSONDecodeError:
-                pass
 
         if attempt == max_repair_attempts - 1:
             # Last attempt failed, raise with helpful error
@@ -152,24 +152,14 @@ class JSONLTracer:
                 event = self._build_event(stage_type, cell_context, result, extras)
 
                 # Dedupe with correct FIFO
-                if self.dedupe:
-                    if event.event_hash in self.seen_set:
-                        return  # Skip duplicate
-
-                    # Add to both structures
-                    self.seen_order.append(event.event_hash)
-                    self.seen_set.add(event.event_hash)
-
-                    # Evict oldest if over limit
-                    if len(self.seen_set) > self.max_seen:
-                        oldest = self.seen_order.popleft()
-                        self.seen_set.remove(oldest)
+                if self.dedupe and event.event_hash in self.seen_set:
+                    return  # Skip duplicate
 
                 # Get file handle
                 matrix_name = extras.get("component", "unknown")
                 file_handle = self._get_file_handle(matrix_name)
 
-                # Serialize to JSON
+                # Serialize to JSON (stdlib, matching what _compute_hash accepts)
                 json_line = json.dumps(
                     asdict(event), sort_keys=True, separators=(",", ":"), ensure_ascii=False
                 )
@@ -181,6 +171,17 @@ class JSONLTracer:
                 file_handle.write(line_with_newline)
                 file_handle.flush()
 
+                # Mark seen only once written, so a failed event can be retried
+                if self.dedupe:
+                    # Add to both structures
+                    self.seen_order.append(event.event_hash)
+                    self.seen_set.add(event.event_hash)
+
+                    # Evict oldest if over limit
+                    if len(self.seen_set) > self.max_seen:
+                        oldest = self.seen_order.popleft()
+                        self.seen_set.remove(oldest)
+
                 # Check rotation based on actual file size
                 self._check_rotation_needed(matrix_name)
 
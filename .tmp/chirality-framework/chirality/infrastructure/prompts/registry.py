@@ -49,6 +49,7 @@ class PromptRegistry:
         self.assets_dir = Path(assets_dir)
         self.metadata_file = self.assets_dir / "metadata.yml"
         self._assets: Dict[str, AssetInfo] = {}
+        self._kernel_hashes: Dict[Optional[Path], str] = {}
         self._loaded = False
 
     def load(self) -> None:
@@ -108,6 +109,13 @@ class PromptRegistry:
 
         self._loaded = True
 
+    def reload(self) -> None:
+        """Drop cached assets and kernel hashes, then reload from metadata.yml."""
+        self._assets = {}
+        self._kernel_hashes = {}
+        self._loaded = False
+        self.load()
+
     def get(self, asset_id: str) -> AssetInfo:
         """
         Get asset by ID.
@@ -170,6 +178,11 @@ class PromptRegistry:
         if not self._loaded:
             self.load()
 
+        # Asset hashes are fixed once loaded; only the normative spec path varies
+        cached = self._kernel_hashes.get(normative_spec_path)
+        if cached is not None:
+            return cached
+
         # Collect asset hashes in sorted order
         asset_hashes = []
         for asset_id in sorted(self._assets.keys()):
@@ -190,7 +203,9 @@ class PromptRegistry:
                 normative_hash = "missing"
 
         # Compute kernel hash
-        return self._compute_kernel_hash(asset_hashes, normative_hash)
+        kernel_hash = self._compute_kernel_hash(asset_hashes, normative_hash)
+        self._kernel_hashes[normative_spec_path] = kernel_hash
+        return kernel_hash
 
     def _compute_kernel_hash(self, asset_hashes: list[str], normative_hash: str) -> str:
         """
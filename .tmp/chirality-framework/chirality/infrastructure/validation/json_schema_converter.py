@@ -11,14 +11,19 @@ Converts JSON tail contracts to proper OpenAI JSON Schema format.
 
 import json
 import re
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from ..prompts.json_tails import get_tail
 
 
+@lru_cache(maxsize=None)
 def convert_contract_to_json_schema(matrix: str, step: str) -> Dict[str, Any]:
     """
     Convert a JSON tail contract to OpenAI JSON Schema format.
     
+    Results are cached per (matrix, step) and shared between callers;
+    treat the returned schema as read-only.
+    
     Args:
         matrix: Matrix name (e.g., "C")
         step: Step name (e.g., "mechanical")
@@ -152,12 +157,16 @@ def convert_contract_to_json_schema(matrix: str, step: str) -> Dict[str, Any]:
     return schema
 
 
+@lru_cache(maxsize=None)
 def get_response_format_for_stage(matrix: str, step: str) -> Dict[str, Any]:
     """
     Get the response_format parameter for OpenAI API calls.
     
     Per colleague_1's P0-3: Use {"type":"json_schema", "json_schema": <schema>}
     
+    Results are cached per (matrix, step) and shared between callers;
+    treat the returned dict as read-only.
+    
     Args:
         matrix: Matrix name
         step: Step name
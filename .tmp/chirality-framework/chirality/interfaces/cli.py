@@ -65,6 +65,7 @@ def cmd_phase1_dialogue_run(args):
         relaxed_json=getattr(args, 'relaxed_json', False),
         inband_c_normalize=getattr(args, 'inband_c_normalize', False),
         stop_at=getattr(args, 'stop_at', None),
+        parallel_extracts=getattr(args, 'parallel_extracts', False),
     )
 
     log_progress("Running Phase 1 dialogue...")
@@ -384,6 +385,8 @@ def cmd_phase2_run(args):
         top_p=getattr(args, "top_p", args.__dict__.get("top_p", 0.9)),
         budget_config=budget_config,
         parallel=args.parallel,
+        batch_size=args.batch_cells,
+        dedupe_operands=args.dedupe_operands,
         artifacts_dir=artifacts_dir,
         cache_enabled=args.cache,
         resume=args.resume,
@@ -398,6 +401,7 @@ def cmd_phase2_run(args):
             log_success(f"Tensor {result['name']} complete:")
             log_info(f"  - Total cells: {stats.get('total_cells', 0)}")
             log_info(f"  - Computed: {stats.get('cells_computed', 0)}")
+            log_info(f"  - Deduplicated: {stats.get('cells_deduplicated', 0)}")
             log_info(f"  - From cache: {stats.get('cells_from_cache', 0)}")
             log_info(f"  - From resume: {stats.get('cells_from_resume', 0)}")
         except Exception as e:
@@ -479,6 +483,7 @@ def main():
     p1_run.add_argument("--relaxed-json", action="store_true", help="Relax JSON enforcement and schema checks to let the model run free-form")
     p1_run.add_argument("--extract-structured", action="store_true", help="After relaxed run, normalize transcript outputs to strict JSON for DB")
     p1_run.add_argument("--inband-c-normalize", action="store_true", help="Enable in-band Stage-A→Stage-B for Matrix C (default: off)")
+    p1_run.add_argument("--parallel-extracts", action="store_true", help="Run the independent G/P/T extraction stages concurrently (default: off)")
     p1_run.add_argument("--stop-at", choices=["C", "C_interpreted", "E_lensed"], help="Stop early after a given stage (e.g., C_interpreted for Stage-A test)")
 
     p1_snap = subparsers.add_parser("phase1-snapshot", help="Generate Phase 1 snapshot")
@@ -523,6 +528,8 @@ def main():
     p2_run.add_argument("tensor_spec", help="Path to tensor_spec.json")
     p2_run.add_argument("--snapshot", required=True, help="Path to phase1_snapshot.md")
     p2_run.add_argument("--parallel", type=int, default=8, help="Parallel workers")
+    p2_run.add_argument("--batch-cells", type=int, default=1, help="Max cells sharing a lens per LLM call (default: 1, no batching)")
+    p2_run.add_argument("--dedupe-operands", action="store_true", help="Compute cells with identical operands and lens only once (default: off)")
     p2_run.add_argument("--resume", action="store_true", help="Resume from previous incomplete run")
     p2_run.add_argument(
         "--out", default="artifacts/", help="Output directory for caching and resume"
@@ -0,0 +1,74 @@
+"""
+JSON serialization helpers for Chirality Framework.
+
+Uses orjson when installed (pip install chirality-framework[fast]) and falls
+back to the standard library otherwise. Both paths emit compact UTF-8 JSON.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, List, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Serialize obj to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode("utf-8")
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes indented by two spaces, for human-read files."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize obj to a compact UTF-8 JSON line (newline-terminated bytes)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_jsonl(path: Path, records: Iterable[Any], batch_size: int = 256) -> None:
+    """
+    Write records to a JSONL file in binary mode.
+
+    Lines are joined in batches of batch_size so each write() call carries
+    many records, on top of a 1 MiB buffered writer.
+    """
+    with open(path, "wb", buffering=1 << 20) as f:
+        batch = []
+        for record in records:
+            batch.append(dumps_line(record))
+            if len(batch) >= batch_size:
+                f.write(b"".join(batch))
+                batch.clear()
+        if batch:
+            f.write(b"".join(batch))
+
+
+def read_jsonl(path: Path) -> List[Any]:
+    """Read a JSONL file into a list of records, skipping blank lines."""
+    data = Path(path).read_bytes()
+    return [loads(line) for line in data.splitlines() if line.strip()]
@@ -0,0 +1,96 @@
+"""Tests for the Phase 2 cell cache and resume traces."""
+
+from chirality.infrastructure.caching import CellCache, ResumableRunner
+
+
+def _key(cache: CellCache, n: int) -> str:
+    return cache.compute_cache_key(
+        tensor_name="M",
+        indices=(0, n),
+        operands_hash=f"ops{n}",
+        lens_id="lens",
+        snapshot_hash="snap",
+        kernel_hash="kernel",
+        model="m",
+        temperature=0.0,
+        top_p=0.9,
+    )
+
+
+def test_cache_put_get_round_trip_across_instances(tmp_path):
+    cache = CellCache(tmp_path)
+    key = _key(cache, 1)
+    result = {"index": [0, 1], "value": "ünïcode value", "metadata": {"total_tokens": 3}}
+
+    cache.put(key, result)
+    assert cache.get(key) == result
+    cache.close()
+
+    reopened = CellCache(tmp_path)
+    assert reopened.get(key) == result
+    assert reopened.get_stats()["disk_entries"] == 1
+    reopened.close()
+
+
+def test_cache_scan_answers_misses_and_tracks_puts(tmp_path):
+    cache = CellCache(tmp_path)
+    stored, missing, added = _key(cache, 1), _key(cache, 2), _key(cache, 3)
+    cache.put(stored, {"value": "a"})
+    cache.clear_memory_cache()
+
+    cache.scan()
+    assert cache.get(stored) == {"value": "a"}
+    assert cache.get(missing) is None
+
+    cache.put(added, {"value": "b"})
+    cache.clear_memory_cache()
+    assert cache.get(added) == {"value": "b"}
+    cache.close()
+
+
+def test_cache_close_disables_cache(tmp_path):
+    cache = CellCache(tmp_path)
+    key = _key(cache, 1)
+    cache.put(key, {"value": "a"})
+    cache.close()
+
+    assert cache.get(key) is None
+    cache.put(key, {"value": "b"})  # ignored, not an error
+    cache.close()  # idempotent
+
+
+def test_cache_clear_all(tmp_path):
+    cache = CellCache(tmp_path)
+    key = _key(cache, 1)
+    cache.put(key, {"value": "a"})
+    cache.clear_all()
+
+    assert cache.get(key) is None
+    assert cache.get_stats()["disk_entries"] == 0
+    cache.close()
+
+
+def test_resume_sees_only_flushed_cells(tmp_path):
+    runner = ResumableRunner(tmp_path, commit_batch_size=2)
+    for j in range(3):
+        runner.save_cell_result("M", (0, j), {"value": f"v{j}"})
+
+    # The first batch was committed automatically; the third cell is pending
+    resumed = ResumableRunner(tmp_path)
+    assert resumed.get_completed_cells("M") == {"0_0", "0_1"}
+    assert resumed.load_cell_result("M", (0, 1)) == {"value": "v1"}
+    assert resumed.load_cell_result("M", (0, 2)) is None
+
+    runner.flush()
+    assert resumed.get_completed_cells("M") == {"0_0", "0_1", "0_2"}
+    assert resumed.load_cell_result("M", (0, 2)) == {"value": "v2"}
+
+
+def test_resume_drops_corrupted_trace(tmp_path):
+    runner = ResumableRunner(tmp_path)
+    runner.save_cell_result("M", (1, 1), {"value": "v"})
+    runner.flush()
+    runner.compute_cell_path("M", (1, 1)).write_bytes(b"{not json")
+
+    assert runner.load_cell_result("M", (1, 1)) is None
+    assert runner.get_completed_cells("M") == set()
@@ -0,0 +1,240 @@
+"""Behavioural tests for TensorEngine.compute_tensor against a fake LLM."""
+
+import hashlib
+import json
+import re
+import shutil
+
+import pytest
+
+import chirality.application.phase2.tensor_engine as tensor_engine
+from chirality.application.phase2.tensor_engine import TensorEngine, _CellWriter
+
+ROWS = ["r0", "r1", "r2"]
+COLS = ["c0", "c1", "c2", "c3"]
+STATION = "Requirements"
+SPEC = {
+    "name": "M",
+    "op": "cross",
+    "sources": {"a": {"R": "array"}, "b": {"C": "matrix"}},
+    "matrix_operand": "C",
+}
+METADATA = {"total_tokens": 10, "prompt_tokens": 7, "completion_tokens": 3}
+
+_SINGLE_CELL = re.compile(r"Left operand: (.*)\nRight operand: (.*)\n")
+_BATCH_CELL = re.compile(r"Cell \w+(\[[\d, ]+\])\n   Left operand: (.*)\n   Right operand: (.*)")
+_LENS = re.compile(r"lens [0-9a-f]{6}")
+
+
+def _answer(left: str, right: str, lens: str) -> str:
+    """Deterministic cell value, independent of how the cell was requested."""
+    return f"{left} x {right} @ {lens}"
+
+
+class FakeLLM:
+    """Stand-in for call_responses answering single-cell and batch prompts."""
+
+    def __init__(self, fail_after=None, batch_drop_first=False):
+        self.calls = 0
+        self.fail_after = fail_after
+        self.batch_drop_first = batch_drop_first
+
+    def __call__(self, instructions=None, input=None, response_format=None, **kwargs):
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise RuntimeError("LLM unavailable")
+        lens = _LENS.search(input).group(0)
+        if response_format["json_schema"]["name"].endswith("batch_response"):
+            cells = [
+                {"index": json.loads(index), "value": _answer(left, right, lens)}
+                for index, left, right in _BATCH_CELL.findall(input)
+            ]
+            if self.batch_drop_first:
+                # One missing and one unusable entry: both must be recomputed
+                cells[0] = {"index": cells[0]["index"], "value": ""}
+                cells[-1] = {"index": [99, 99, 99], "value": "stray"}
+            payload = {"tensor": "M", "cells": cells}
+        else:
+            left, right = _SINGLE_CELL.search(input).groups()
+            payload = {"tensor": "M", "value": _answer(left, right, lens)}
+        return {"output_text": json.dumps(payload), "raw": {"metadata": dict(METADATA)}}
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    snapshot = tmp_path / "snapshot.md"
+    snapshot.write_text("# Snapshot\nstuff")
+
+    lens_ids = {hashlib.sha256(STATION.encode()).hexdigest()}
+    for r in ROWS:
+        for c in COLS:
+            lens_ids.add(hashlib.sha256(f"{r}|{c}|{STATION}".encode()).hexdigest())
+    catalog = tmp_path / "lens_catalog.jsonl"
+    catalog.write_text(
+        "".join(
+            json.dumps({"lens_id": lens_id, "text": f"lens {lens_id[:6]}"}) + "\n"
+            for lens_id in sorted(lens_ids)
+        )
+    )
+    return tmp_path, snapshot, catalog
+
+
+def _phase1(duplicate_elements=False):
+    elements = [
+        [(f"e{j % 2}" if duplicate_elements else f"e{i}{j}") for j in range(len(COLS))]
+        for i in range(len(ROWS))
+    ]
+    return {
+        "meta": {"snapshot_hash": "s1", "kernel_hash": "k1"},
+        "matrices": {"C": {"rows": ROWS, "cols": COLS, "station": STATION, "elements": elements}},
+    }
+
+
+def _engine(workspace, artifacts="artifacts", duplicate_elements=False, **kwargs):
+    tmp_path, snapshot, catalog = workspace
+    return TensorEngine(
+        snapshot,
+        _phase1(duplicate_elements),
+        lens_catalog_path=catalog,
+        model="m",
+        temperature=0.0,
+        artifacts_dir=tmp_path / artifacts if artifacts else None,
+        **kwargs,
+    )
+
+
+def _cells(result):
+    """Cell contents that must not depend on the execution path."""
+    return {
+        idx: (cell["value"], cell["left_operand"], cell["right_operand"], cell["lens_text"])
+        for idx, cell in result["cells"].items()
+    }
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    def install(**kwargs):
+        fake = FakeLLM(**kwargs)
+        monkeypatch.setattr(tensor_engine, "call_responses", fake)
+        return fake
+
+    return install
+
+
+@pytest.fixture
+def reference(workspace, fake_llm):
+    fake_llm()
+    result = _engine(workspace, artifacts=None, parallel=1).compute_tensor(SPEC)
+    assert result["stats"]["cells_computed"] == result["stats"]["total_cells"]
+    return result
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"parallel": 8},
+        {"parallel": 8, "batch_size": 4},
+        {"parallel": 1, "batch_size": 4},
+        {"parallel": 8, "dedupe_operands": True},
+        {"parallel": 8, "batch_size": 4, "dedupe_operands": True},
+    ],
+)
+def test_execution_paths_match_sequential(workspace, fake_llm, reference, options):
+    fake_llm()
+    result = _engine(workspace, artifacts=None, **options).compute_tensor(SPEC)
+
+    assert list(result["cells"]) == list(reference["cells"])
+    assert _cells(result) == _cells(reference)
+
+
+def test_batch_rejects_unusable_entries(workspace, fake_llm, reference):
+    fake_llm(batch_drop_first=True)
+    result = _engine(workspace, artifacts=None, parallel=4, batch_size=4).compute_tensor(SPEC)
+
+    assert _cells(result) == _cells(reference)
+
+
+def test_dedupe_matches_sequential_on_repeated_operands(workspace, fake_llm):
+    fake = fake_llm()
+    sequential = _engine(workspace, artifacts=None, duplicate_elements=True, parallel=1)
+    expected = sequential.compute_tensor(SPEC)
+    sequential_calls = fake.calls
+
+    fake = fake_llm()
+    deduped = _engine(
+        workspace, artifacts=None, duplicate_elements=True, parallel=8, dedupe_operands=True
+    ).compute_tensor(SPEC)
+
+    assert _cells(deduped) == _cells(expected)
+    assert deduped["stats"]["cells_deduplicated"] > 0
+    assert fake.calls < sequential_calls
+
+
+def test_cached_run_makes_no_calls(workspace, fake_llm, reference):
+    fake_llm()
+    _engine(workspace, parallel=8).compute_tensor(SPEC)
+
+    fake = fake_llm()
+    result = _engine(workspace, parallel=8).compute_tensor(SPEC)
+
+    assert fake.calls == 0
+    assert result["stats"]["cells_from_cache"] == result["stats"]["total_cells"]
+    assert _cells(result) == _cells(reference)
+
+
+def test_resume_after_interrupted_run(workspace, fake_llm, reference):
+    tmp_path = workspace[0]
+    fake_llm(fail_after=40)
+    with pytest.raises(RuntimeError):
+        _engine(workspace, parallel=1).compute_tensor(SPEC)
+
+    # Only the resume traces flushed by the failed run are left to resume from
+    shutil.rmtree(tmp_path / "artifacts" / "cache")
+    fake = fake_llm()
+    result = _engine(workspace, parallel=4, resume=True).compute_tensor(SPEC)
+    stats = result["stats"]
+
+    assert stats["cells_from_resume"] == 40
+    assert stats["cells_computed"] == stats["total_cells"] - 40
+    assert fake.calls == stats["total_cells"] - 40
+    assert _cells(result) == _cells(reference)
+
+
+def test_cell_writer_drains_queue_on_close():
+    written = []
+    writer = _CellWriter(lambda *item: written.append(item), maxsize=4)
+    for n in range(100):
+        writer.submit("M", (n,), f"key{n}", {"value": n})
+    writer.close()
+
+    assert written == [("M", (n,), f"key{n}", {"value": n}) for n in range(100)]
+
+
+def test_cell_writer_reraises_first_error_on_close():
+    written = []
+
+    def write(tensor_name, idx, cache_key, cell):
+        if idx == (3,):
+            raise OSError("disk full")
+        written.append(idx)
+
+    writer = _CellWriter(write)
+    for n in range(10):
+        writer.submit("M", (n,), f"key{n}", {"value": n})
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+    # Writes after the failure are skipped
+    assert written == [(0,), (1,), (2,)]
+
+
+def test_store_error_propagates_from_compute_tensor(workspace, fake_llm, monkeypatch):
+    fake_llm()
+    engine = _engine(workspace, parallel=8)
+
+    def failing_store(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(engine, "_store_cell", failing_store)
+    with pytest.raises(OSError, match="disk full"):
+        engine.compute_tensor(SPEC)
+    assert engine._writer is None